@@ -0,0 +1,79 @@
+# benchmarks/__init__.py
+# Shared helpers for benchmark code (local stub registry, no network access or credentials required)
+
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# DEVELOPMEMNT: account for comanage_api directory being one level up for development purposes
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+
+class StubRegistryHandler(BaseHTTPRequestHandler):
+    """
+    Minimal COmanage registry stub, answers every GET with the body returned by StubRegistryHandler.body(path)
+    after StubRegistryHandler.latency seconds
+    """
+    protocol_version = 'HTTP/1.1'
+    # buffer headers and body into a single write (avoids Nagle/delayed-ACK stalls on keep-alive connections)
+    wbufsize = -1
+    latency = 0.0
+
+    @staticmethod
+    def body(path: str) -> bytes:
+        return json.dumps({
+            'ResponseType': 'CoPeople',
+            'Version': '1.0',
+            'CoPeople': [
+                {
+                    'Version': '1.0',
+                    'Id': path.rsplit('/', 1)[-1].split('.')[0],
+                    'CoId': '123',
+                    'Status': 'Active',
+                    'Created': '2021-09-10 14:33:11',
+                    'Modified': '2021-09-10 14:33:11',
+                    'Revision': '0',
+                    'Deleted': False,
+                    'ActorIdentifier': 'http://cilogon.org/serverA/users/242181'
+                }
+            ]
+        }).encode()
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        body = self.body(self.path.split('?')[0])
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubRegistryServer(ThreadingHTTPServer):
+    """
+    Threaded stub server with a listen backlog large enough for hundreds of concurrent connections, so that
+    SYNs are not dropped (and retransmitted ~1 s later) when many calls are in flight
+    """
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+def start_stub_registry(handler=StubRegistryHandler) -> tuple:
+    """
+    Start a stub registry on a free local port
+
+    :return
+        (server, registry_url)
+    """
+    server = StubRegistryServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://127.0.0.1:{0}/registry'.format(server.server_address[1])
@@ -0,0 +1,55 @@
+# benchmarks/async_copeople_view_one.py
+# Throughput of copeople_view_one: sequential ComanageApi vs. hundreds of calls in flight on AsyncComanageApi
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+from benchmarks import StubRegistryHandler, start_stub_registry
+from comanage_api import AsyncComanageApi, ComanageApi
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--calls', type=int, default=500, help='number of copeople_view_one calls')
+parser.add_argument('--latency', type=float, default=0.02, help='stub registry latency per request (seconds)')
+parser.add_argument('--max-concurrency', type=int, default=200, help='AsyncComanageApi max_concurrency')
+args = parser.parse_args()
+
+StubRegistryHandler.latency = args.latency
+server, url = start_stub_registry()
+credentials = dict(co_api_url=url, co_api_user='co_123.api-user-name', co_api_pass='xxxx-xxxx-xxxx-xxxx',
+                   co_api_org_id=123, co_api_org_name='RegistryName')
+
+# sequential ComanageApi
+api = ComanageApi(**credentials)
+sync_calls = min(args.calls, 100)
+start = time.perf_counter()
+for coperson_id in range(sync_calls):
+    api.copeople_view_one(coperson_id=coperson_id)
+sync_elapsed = time.perf_counter() - start
+
+
+# AsyncComanageApi with all calls in flight
+async def run_async():
+    async with AsyncComanageApi(max_concurrency=args.max_concurrency, pool_maxsize=args.max_concurrency,
+                                **credentials) as async_api:
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[async_api.copeople_view_one(coperson_id=coperson_id) for coperson_id in range(args.calls)])
+        elapsed = time.perf_counter() - start
+        assert [r['CoPeople'][0]['Id'] for r in results] == [str(i) for i in range(args.calls)]
+        return elapsed, async_api.stats()
+
+
+async_elapsed, async_stats = asyncio.run(run_async())
+server.shutdown()
+
+print('### copeople_view_one - stub latency {0:.0f} ms'.format(args.latency * 1000))
+print('ComanageApi (sequential)    : {0:5d} calls in {1:7.3f} s -> {2:8.1f} calls/s'.format(
+    sync_calls, sync_elapsed, sync_calls / sync_elapsed))
+print('AsyncComanageApi (in flight): {0:5d} calls in {1:7.3f} s -> {2:8.1f} calls/s (peak in flight: {3})'.format(
+    args.calls, async_elapsed, args.calls / async_elapsed, async_stats['concurrency']['in_flight_peak']))
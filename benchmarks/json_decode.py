@@ -0,0 +1,107 @@
+# benchmarks/json_decode.py
+# Time and peak memory of json.loads(resp.text) vs. decoding straight from resp.content
+# on large synthetic CoPeople and CoPersonRoles payloads
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+from requests import Response
+
+from comanage_api._json import default_json_loads
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--records', type=int, default=50000, help='number of records per payload')
+parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+args = parser.parse_args()
+
+
+def copeople_payload(records: int) -> bytes:
+    return json.dumps({
+        'ResponseType': 'CoPeople',
+        'Version': '1.0',
+        'CoPeople': [
+            {
+                'Version': '1.0',
+                'Id': str(i),
+                'CoId': '123',
+                'Status': 'Active',
+                'Timezone': 'America/New_York',
+                'Created': '2021-09-10 14:33:11',
+                'Modified': '2021-09-10 14:33:11',
+                'Revision': '0',
+                'Deleted': False,
+                'ActorIdentifier': 'http://cilogon.org/serverA/users/{0}'.format(i)
+            } for i in range(records)
+        ]
+    }).encode()
+
+
+def coperson_roles_payload(records: int) -> bytes:
+    return json.dumps({
+        'ResponseType': 'CoPersonRoles',
+        'Version': '1.0',
+        'CoPersonRoles': [
+            {
+                'Version': '1.0',
+                'Id': str(i),
+                'Person': {'Type': 'CO', 'Id': str(i // 2)},
+                'CouId': str(i % 50),
+                'Affiliation': 'member',
+                'O': 'RegistryName',
+                'Status': 'Active',
+                'Created': '2021-09-10 14:33:11',
+                'Modified': '2021-09-10 14:33:11',
+                'Revision': '0',
+                'Deleted': False,
+                'ActorIdentifier': 'http://cilogon.org/serverA/users/242181'
+            } for i in range(records)
+        ]
+    }).encode()
+
+
+def make_response(content: bytes, content_type: str) -> Response:
+    resp = Response()
+    resp.status_code = 200
+    resp.headers['Content-Type'] = content_type
+    resp._content = content
+    resp.encoding = None
+    return resp
+
+
+def measure(content: bytes, content_type: str, decode) -> tuple:
+    best = None
+    for _ in range(args.repeat):
+        resp = make_response(content, content_type)
+        start = time.perf_counter()
+        decode(resp)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    resp = make_response(content, content_type)
+    tracemalloc.start()
+    decode(resp)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+strategies = [('json.loads(resp.text)', lambda r: json.loads(r.text)),
+              ('json.loads(resp.content)', lambda r: json.loads(r.content))]
+if default_json_loads() is not json.loads:
+    strategies.append(('{0}.loads(resp.content)'.format(default_json_loads().__module__),
+                       lambda r: default_json_loads()(r.content)))
+
+for name, payload in [('CoPeople', copeople_payload(args.records)),
+                      ('CoPersonRoles', coperson_roles_payload(args.records))]:
+    for content_type in ['application/json', 'application/json; charset=UTF-8']:
+        print('### {0}: {1} records, {2:.1f} MB, Content-Type: {3}'.format(
+            name, args.records, len(payload) / 1e6, content_type))
+        for label, decode in strategies:
+            elapsed, peak = measure(payload, content_type, decode)
+            print('{0:28s}: {1:8.1f} ms  peak {2:7.1f} MB'.format(label, elapsed * 1000, peak / 1e6))
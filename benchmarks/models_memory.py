@@ -0,0 +1,118 @@
+# benchmarks/models_memory.py
+# Memory held by the records of a decoded view response (tracemalloc): one dict per record vs. the slotted
+# models returned with as_models=True, on synthetic CoPeople, CoPersonRoles and Identifiers payloads
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+from comanage_api import to_models
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--records', type=int, default=100000, help='number of records per payload')
+args = parser.parse_args()
+
+
+def copeople_payload(records: int) -> bytes:
+    return json.dumps({
+        'ResponseType': 'CoPeople',
+        'Version': '1.0',
+        'CoPeople': [
+            {
+                'Version': '1.0',
+                'Id': str(i),
+                'CoId': '123',
+                'Status': ['Active', 'Suspended', 'Expired'][i % 3],
+                'Timezone': 'America/New_York',
+                'Created': '2021-09-10 14:33:11',
+                'Modified': '2021-09-10 14:33:11',
+                'Revision': '0',
+                'Deleted': False,
+                'ActorIdentifier': 'http://cilogon.org/serverA/users/{0}'.format(i)
+            } for i in range(records)
+        ]
+    }).encode()
+
+
+def coperson_roles_payload(records: int) -> bytes:
+    return json.dumps({
+        'ResponseType': 'CoPersonRoles',
+        'Version': '1.0',
+        'CoPersonRoles': [
+            {
+                'Version': '1.0',
+                'Id': str(i),
+                'Person': {'Type': 'CO', 'Id': str(i // 2)},
+                'CouId': str(i % 50),
+                'Affiliation': ['member', 'staff', 'faculty'][i % 3],
+                'O': 'RegistryName',
+                'Status': ['Active', 'GracePeriod', 'Expired'][i % 3],
+                'Created': '2021-09-10 14:33:11',
+                'Modified': '2021-09-10 14:33:11',
+                'Revision': '0',
+                'Deleted': False,
+                'ActorIdentifier': 'http://cilogon.org/serverA/users/242181'
+            } for i in range(records)
+        ]
+    }).encode()
+
+
+def identifiers_payload(records: int) -> bytes:
+    return json.dumps({
+        'ResponseType': 'Identifiers',
+        'Version': '1.0',
+        'Identifiers': [
+            {
+                'Version': '1.0',
+                'Id': str(i),
+                'Type': ['eppn', 'oidcsub'][i % 2],
+                'Identifier': 'http://cilogon.org/serverA/users/{0}'.format(i),
+                'Login': False,
+                'Person': {'Type': 'CO', 'Id': str(i)},
+                'Status': 'Active',
+                'Created': '2021-09-10 14:33:11',
+                'Modified': '2021-09-10 14:33:11',
+                'Revision': '0',
+                'Deleted': False,
+                'ActorIdentifier': 'http://cilogon.org/serverA/users/242181'
+            } for i in range(records)
+        ]
+    }).encode()
+
+
+def measure(payload: bytes, as_models: bool) -> tuple:
+    """
+    Memory still allocated once the response is decoded (and converted) and the peak during the call.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = json.loads(payload)
+    if as_models:
+        response = to_models(response)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del response
+    return current, peak, elapsed
+
+
+for name, payload in [('CoPeople', copeople_payload(args.records)),
+                      ('CoPersonRoles', coperson_roles_payload(args.records)),
+                      ('Identifiers', identifiers_payload(args.records))]:
+    print('### {0}: {1} records, {2:.1f} MB'.format(name, args.records, len(payload) / 1e6))
+    results = {}
+    for label, as_models in [('dict', False), ('as_models=True', True)]:
+        current, peak, elapsed = measure(payload, as_models)
+        results[label] = current
+        print('{0:16s}: held {1:7.1f} MB  peak {2:7.1f} MB  {3:7.1f} ms  ({4:5.0f} bytes/record)'.format(
+            label, current / 1e6, peak / 1e6, elapsed * 1000, float(current) / args.records))
+    print('{0:16s}: {1:.0%} of the dict form'.format('models', float(results['as_models=True']) / results['dict']))
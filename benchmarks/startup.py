@@ -0,0 +1,72 @@
+# benchmarks/startup.py
+# Cold import time of comanage_api, client construction time and cost of a NOT IMPLEMENTED call,
+# each import measured in a fresh interpreter
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--repeat', type=int, default=10, help='number of fresh interpreters per measurement')
+args = parser.parse_args()
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+IMPORT_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import comanage_api
+elapsed = time.perf_counter() - start
+heavy = [m for m in ('requests_mock', 'asyncio', 'aiohttp', 'orjson', 'sqlite3') if m in sys.modules]
+print(elapsed, ','.join(heavy))
+"""
+BASELINE_SNIPPET = """
+import time
+start = time.perf_counter()
+import requests
+print(time.perf_counter() - start, '')
+"""
+
+
+def cold_import(snippet: str) -> tuple:
+    timings = []
+    heavy = ''
+    for _ in range(args.repeat):
+        out = subprocess.check_output([sys.executable, '-c', snippet], cwd=ROOT).decode().split()
+        timings.append(float(out[0]))
+        heavy = out[1] if len(out) > 1 else ''
+    return statistics.median(timings), heavy
+
+
+elapsed, heavy = cold_import(IMPORT_SNIPPET)
+baseline, _ = cold_import(BASELINE_SNIPPET)
+print('import comanage_api       : {0:8.1f} ms (median of {1})'.format(elapsed * 1000, args.repeat))
+print('import requests (floor)   : {0:8.1f} ms'.format(baseline * 1000))
+print('optional modules loaded   : {0}'.format(heavy or 'none'))
+
+from comanage_api import ComanageApi
+
+start = time.perf_counter()
+for _ in range(1000):
+    api = ComanageApi(
+        co_api_url='https://registry.example.org/registry/',
+        co_api_user='co_123.api-user',
+        co_api_pass='xxxx-xxxx-xxxx-xxxx',
+        co_api_org_id=123,
+        co_api_org_name='RegistryName'
+    )
+print('ComanageApi()             : {0:8.1f} us'.format((time.perf_counter() - start) * 1000))
+
+start = time.perf_counter()
+for _ in range(10000):
+    try:
+        api.names_add()
+    except Exception:
+        pass
+print('NOT IMPLEMENTED call      : {0:8.1f} us'.format((time.perf_counter() - start) * 100))
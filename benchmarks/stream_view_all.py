@@ -0,0 +1,81 @@
+# benchmarks/stream_view_all.py
+# Peak memory (RSS of the client process) and time of copeople_view_all (whole body decoded into one dict)
+# vs. iter_copeople_all (streamed and parsed one record at a time) on a generated payload, each client run
+# in a fresh interpreter
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+sys.path.append(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir))
+)
+from benchmarks import StubRegistryHandler, start_stub_registry
+from comanage_api import ComanageApi
+
+parser = argparse.ArgumentParser()
+parser.add_argument('--records', type=int, default=500000, help='number of CoPeople records in the payload')
+parser.add_argument('--client', choices=['copeople_view_all', 'iter_copeople_all'], help=argparse.SUPPRESS)
+parser.add_argument('--url', help=argparse.SUPPRESS)
+args = parser.parse_args()
+
+
+def copeople_payload(records: int) -> bytes:
+    record = {
+        'Version': '1.0',
+        'Id': '{0}',
+        'CoId': '123',
+        'Status': 'Active',
+        'Timezone': 'America/New_York',
+        'Created': '2021-09-10 14:33:11',
+        'Modified': '2021-09-10 14:33:11',
+        'Revision': '0',
+        'Deleted': False,
+        'ActorIdentifier': 'http://cilogon.org/serverA/users/{0}'
+    }
+    template = json.dumps(record).replace('{', '{{').replace('}', '}}').replace('{{0}}', '{0}')
+    return ('{"ResponseType":"CoPeople","Version":"1.0","CoPeople":[' +
+            ','.join(template.format(i) for i in range(records)) + ']}').encode()
+
+
+def peak_rss() -> int:
+    # VmHWM is reset by exec, ru_maxrss may carry over the high-water mark of the parent process
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run_client():
+    api = ComanageApi(co_api_url=args.url, co_api_user='co_123.api-user-name', co_api_pass='xxxx-xxxx-xxxx-xxxx',
+                      co_api_org_id=123, co_api_org_name='RegistryName')
+    start = time.perf_counter()
+    if args.client == 'copeople_view_all':
+        records = len(api.copeople_view_all().get('CoPeople'))
+    else:
+        records = sum(1 for _ in api.iter_copeople_all())
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'records': records, 'elapsed': elapsed, 'max_rss': peak_rss()}))
+
+
+if args.client:
+    run_client()
+    sys.exit(0)
+
+payload = copeople_payload(args.records)
+StubRegistryHandler.body = staticmethod(lambda path: payload)
+server, url = start_stub_registry()
+print('### CoPeople: {0} records, {1:.1f} MB'.format(args.records, len(payload) / 1e6))
+for client in ['copeople_view_all', 'iter_copeople_all']:
+    out = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--client', client, '--url', url])
+    result = json.loads(out.decode().strip().splitlines()[-1])
+    print('{0:20s}: {1:7d} records {2:8.1f} s  peak RSS {3:8.1f} MB'.format(
+        client, result['records'], result['elapsed'], result['max_rss'] / 1e6))
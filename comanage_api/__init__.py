@@ -1,22 +1,38 @@
-import requests_mock
-from requests import Session
+import threading
 
+from ._async import AsyncComanageApi
+from ._cache import ResponseCache, cache_clear
+from ._conditional import ValidatorStore, collection_fingerprint
 from ._coorgidentitylinks import coorg_identity_links_add, coorg_identity_links_delete, coorg_identity_links_edit, \
     coorg_identity_links_view_all, coorg_identity_links_view_by_identity, coorg_identity_links_view_one
-from ._copeople import copeople_add, copeople_delete, copeople_edit, copeople_find, copeople_match, \
-    copeople_view_all, copeople_view_per_co, copeople_view_per_identifier, copeople_view_one
-from ._copersonroles import coperson_roles_add, coperson_roles_delete, coperson_roles_edit, coperson_roles_view_all, \
-    coperson_roles_view_per_coperson, coperson_roles_view_per_cou, coperson_roles_view_one
+from ._copeople import DEFAULT_FIND_LIMIT, TooManyRecords, copeople_add, copeople_delete, copeople_edit, \
+    copeople_find, copeople_match, copeople_match_many, copeople_view_all, copeople_view_many, copeople_view_per_co, \
+    copeople_view_per_identifier, copeople_view_one, iter_copeople_all, iter_copeople_find, iter_copeople_per_co
+from ._copersonroles import RoleConflict, coperson_roles_add, coperson_roles_add_many, coperson_roles_delete, \
+    coperson_roles_edit, coperson_roles_view_all, coperson_roles_view_per_coperson, coperson_roles_view_per_cou, \
+    coperson_roles_view_one
 from ._cous import cous_add, cous_delete, cous_edit, cous_view_all, cous_view_per_co, cous_view_one
 from ._emailaddresses import email_addresses_add, email_addresses_delete, email_addresses_edit, \
-    email_addresses_view_all, email_addresses_view_per_person, email_addresses_view_one
+    email_addresses_view_all, email_addresses_view_per_person, email_addresses_view_one, iter_email_addresses_all
+from ._fanout import MapResult, RateLimiter, fanout_map
 from ._identifiers import identifiers_add, identifiers_assign, identifiers_delete, identifiers_edit, \
-    identifiers_view_all, identifiers_view_per_entity, identifiers_view_one
-from ._names import names_add, names_delete, names_edit, names_view_all, names_view_per_person, names_view_one
+    identifiers_view_all, identifiers_view_per_entity, identifiers_view_one, iter_identifiers_all
+from ._journal import bulk_write
+from ._mirror import RegistryMirror
+from ._models import CoOrgIdentityLink, CoPerson, CoPersonRole, Cou, EmailAddress, Identifier, Name, OrgIdentity, \
+    SshKey, to_models
+from ._names import iter_names_all, names_add, names_delete, names_edit, names_view_all, names_view_per_person, \
+    names_view_one
 from ._orgidentities import org_identities_add, org_identities_delete, org_identities_edit, org_identities_view_all, \
     org_identities_view_per_co, org_identities_view_per_identifier, org_identities_view_one
+from ._profile import get_person_profile
+from ._reconcile import coperson_roles_reconcile
+from ._resolver import IdentifierResolver
+from ._session import DeadlineExceeded, add_write_listener, build_session, deadline, pool_stats, \
+    remove_write_listener, stats
+from ._statusindex import StatusIndex
 from ._sshkeys import ssh_keys_add, ssh_keys_delete, ssh_keys_edit, ssh_keys_view_all, ssh_keys_view_per_coperson, \
-    ssh_keys_view_one
+    ssh_keys_view_one, iter_ssh_keys_all
 
 # fabric-comanage-api version
 __VERSION__ = "0.1.5"
@@ -44,10 +60,48 @@ class ComanageApi(object):
         COmanage Org Name (required)
     co_ssh_key_authenticator_id: int = None
         SSH Authenticator Plugin ID (optional)
+    pool_connections: int = 10
+        Number of per-host connection pools to cache (optional)
+    pool_maxsize: int = 10
+        Maximum number of connections kept open per host, should be >= the number of worker threads (optional)
+    pool_block: bool = False
+        Block when the pool is exhausted instead of opening a throwaway connection (optional)
+    keep_alive: bool = True
+        Reuse connections between requests (optional)
+    retry_total: int = 3
+        Maximum number of retries per request for transient failures, 0 disables retrying (optional)
+    retry_backoff_factor: float = 0.5
+        Base delay in seconds for jittered exponential backoff between retries (optional)
+    retry_backoff_max: float = 30.0
+        Maximum backoff delay in seconds between two retries (optional)
+    retry_budget: float = 60.0
+        Maximum total time in seconds a request may spend waiting on retries (optional)
+    connect_timeout: float = 5.0
+        Seconds to wait for a connection to the registry to be established (optional)
+    read_timeout: float = 30.0
+        Seconds to wait for the registry to send data before giving up on a request (optional)
+    coalesce: bool = False
+        Share one in-flight response between concurrent identical GET requests (optional)
+    cache_maxsize: int = 0
+        Maximum number of GET responses kept in the in-memory TTL/LRU cache, 0 disables caching (optional)
+    cache_ttls: dict = None
+        Time-to-live in seconds per resource (e.g. {'cous': 300, 'co_person_roles': 30}), 0 disables
+        caching of a resource (optional)
+    conditional_get: bool = False
+        Revalidate copeople_view_per_co, coperson_roles_view_all and ssh_keys_view_all with conditional
+        requests (ETag / If-Modified-Since) and keep their last response in memory (optional)
+    json_loads: callable = None
+        JSON parser for response bodies taking bytes, defaults to orjson.loads when installed else json.loads
+        (optional)
     """
 
     def __init__(self, co_api_url: str, co_api_user: str, co_api_pass: str, co_api_org_id: int,
-                 co_api_org_name: str, co_ssh_key_authenticator_id: int = None):
+                 co_api_org_name: str, co_ssh_key_authenticator_id: int = None, pool_connections: int = 10,
+                 pool_maxsize: int = 10, pool_block: bool = False, keep_alive: bool = True, retry_total: int = 3,
+                 retry_backoff_factor: float = 0.5, retry_backoff_max: float = 30.0, retry_budget: float = 60.0,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0, coalesce: bool = False,
+                 cache_maxsize: int = 0, cache_ttls: dict = None, conditional_get: bool = False,
+                 json_loads=None):
         # COmanage API user and pass
         self._CO_API_USER = str(co_api_user)
         self._CO_API_PASS = str(co_api_pass)
@@ -80,17 +134,83 @@ class ComanageApi(object):
         # SSH Key Type options
         self.SSH_KEY_OPTIONS = ['ssh-dss', 'ecdsa-sha2-nistp256', 'ecdsa-sha2-nistp384', 'ecdsa-sha2-nistp521',
                                 'ssh-ed25519', 'ssh-rsa', 'ssh-rsa1']
-        # create mock response session
-        self._mock_session = Session()
-        self._adapter = requests_mock.Adapter()
-        self._mock_session.mount('mock://', self._adapter)
-        # add mock adapters
+        # URL reported by the local 501 response of endpoints not implemented by the client
         self._MOCK_501_URL = 'mock://not_implemented_501.local'
-        self._adapter.register_uri('GET', self._MOCK_501_URL, reason='Not Implemented', status_code=501)
-        # create comanage_api session
-        self._s = Session()
-        self._s.headers = {'Content-Type': 'application/json'}
-        self._s.auth = (self._CO_API_USER, self._CO_API_PASS)
+        # Retry policy
+        self._RETRY_TOTAL = max(int(retry_total), 0)
+        self._RETRY_BACKOFF_FACTOR = float(retry_backoff_factor)
+        self._RETRY_BACKOFF_MAX = float(retry_backoff_max)
+        self._RETRY_BUDGET = float(retry_budget)
+        # Timeouts, deadlines are tracked per thread
+        self._CONNECT_TIMEOUT = float(connect_timeout)
+        self._READ_TIMEOUT = float(read_timeout)
+        self._local = threading.local()
+        # Request coalescing (single-flight) of identical GET requests
+        self._COALESCE = bool(coalesce)
+        self._inflight_lock = threading.Lock()
+        self._inflight = {}
+        # Response cache of GET requests, invalidated by writes
+        if int(cache_maxsize) > 0:
+            self._cache = ResponseCache(maxsize=cache_maxsize, ttls=cache_ttls)
+        else:
+            self._cache = None
+        # Validators of revalidated collections (conditional GET)
+        self._validators = ValidatorStore() if conditional_get else None
+        # JSON parser for response bodies, resolved on first use when not provided
+        self._json_loads = json_loads
+        # client statistics
+        self._stats_lock = threading.Lock()
+        self._counters = {}
+        # callables notified of the writes made through the client
+        self._write_listeners = []
+        # (CO People count, monotonic time) of the last per-CO listing
+        self._co_size = None
+        # strategy, ids, CO size estimate and time of the last copeople_view_many call
+        self._view_many_last = None
+        # create comanage_api session with a pooled adapter mounted for the registry URL
+        self._s = build_session(self, pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                pool_block=pool_block, keep_alive=keep_alive)
+
+    # Fan-out
+    def map(self, method, iterable_of_kwargs, max_workers: int = None, ordered: bool = True):
+        return fanout_map(self, method=method, iterable_of_kwargs=iterable_of_kwargs, max_workers=max_workers,
+                          ordered=ordered)
+
+    # Person profile
+    def get_person_profile(self, coperson_id: int, timeout: float = None):
+        return get_person_profile(self, coperson_id=coperson_id, timeout=timeout)
+
+    # Bulk journal
+    def bulk_write(self, operations, journal: str, max_workers: int = None, rate_limit: float = None,
+                   fsync: bool = True):
+        return bulk_write(self, operations=operations, journal=journal, max_workers=max_workers,
+                          rate_limit=rate_limit, fsync=fsync)
+
+    # Response cache
+    def cache_clear(self):
+        return cache_clear(self)
+
+    # Conditional GET
+    def collection_fingerprint(self, method: str):
+        return collection_fingerprint(self, method=method)
+
+    # Deadlines
+    def deadline(self, seconds: float):
+        return deadline(self, seconds=seconds)
+
+    # Write listeners
+    def add_write_listener(self, listener):
+        return add_write_listener(self, listener=listener)
+
+    def remove_write_listener(self, listener):
+        return remove_write_listener(self, listener=listener)
+
+    # Client statistics
+    def pool_stats(self):
+        return pool_stats(self)
+
+    def stats(self):
+        return stats(self)
 
     # CoOrgIdentityLink API
     def coorg_identity_links_add(self):
@@ -102,14 +222,15 @@ class ComanageApi(object):
     def coorg_identity_links_edit(self):
         return coorg_identity_links_edit(self)
 
-    def coorg_identity_links_view_all(self):
-        return coorg_identity_links_view_all(self)
+    def coorg_identity_links_view_all(self, as_models: bool = False):
+        return coorg_identity_links_view_all(self, as_models=as_models)
 
-    def coorg_identity_links_view_by_identity(self, identity_type: str, identity_id: int):
-        return coorg_identity_links_view_by_identity(self, identity_type=identity_type, identity_id=identity_id)
+    def coorg_identity_links_view_by_identity(self, identity_type: str, identity_id: int, as_models: bool = False):
+        return coorg_identity_links_view_by_identity(self, identity_type=identity_type, identity_id=identity_id,
+                                                     as_models=as_models)
 
-    def coorg_identity_links_view_one(self, coorg_identity_link_id: int):
-        return coorg_identity_links_view_one(self, coorg_identity_link_id=coorg_identity_link_id)
+    def coorg_identity_links_view_one(self, coorg_identity_link_id: int, as_models: bool = False):
+        return coorg_identity_links_view_one(self, coorg_identity_link_id=coorg_identity_link_id, as_models=as_models)
 
     # COperson API
     def copeople_add(self):
@@ -121,47 +242,79 @@ class ComanageApi(object):
     def copeople_edit(self):
         return copeople_edit(self)
 
-    def copeople_find(self):
-        return copeople_find(self)
+    def copeople_find(self, given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                      limit: int = DEFAULT_FIND_LIMIT, distinct_by_id: bool = True):
+        return copeople_find(self, given=given, family=family, mail=mail, identifier=identifier, limit=limit,
+                             distinct_by_id=distinct_by_id)
 
     def copeople_match(self, given: str = None, family: str = None, mail: str = None, distinct_by_id: bool = True):
         return copeople_match(self, given=given, family=family, mail=mail, distinct_by_id=distinct_by_id)
 
-    def copeople_view_all(self):
-        return copeople_view_all(self)
+    def copeople_match_many(self, queries, max_workers: int = None, distinct_by_id: bool = True):
+        return copeople_match_many(self, queries=queries, max_workers=max_workers, distinct_by_id=distinct_by_id)
+
+    def copeople_view_all(self, as_models: bool = False):
+        return copeople_view_all(self, as_models=as_models)
+
+    def iter_copeople_all(self):
+        return iter_copeople_all(self)
+
+    def copeople_view_many(self, coperson_ids, max_workers: int = None, strategy: str = 'auto',
+                           as_models: bool = False):
+        return copeople_view_many(self, coperson_ids=coperson_ids, max_workers=max_workers, strategy=strategy,
+                                  as_models=as_models)
+
+    def copeople_view_per_co(self, as_models: bool = False):
+        return copeople_view_per_co(self, as_models=as_models)
+
+    def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = True, as_models: bool = False):
+        return copeople_view_per_identifier(self, identifier=identifier, distinct_by_id=distinct_by_id,
+                                            as_models=as_models)
 
-    def copeople_view_per_co(self):
-        return copeople_view_per_co(self)
+    def copeople_view_one(self, coperson_id: int, as_models: bool = False):
+        return copeople_view_one(self, coperson_id=coperson_id, as_models=as_models)
 
-    def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = True):
-        return copeople_view_per_identifier(self, identifier=identifier, distinct_by_id=distinct_by_id)
+    def iter_copeople_find(self, given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                           limit: int = DEFAULT_FIND_LIMIT, distinct_by_id: bool = True):
+        return iter_copeople_find(self, given=given, family=family, mail=mail, identifier=identifier, limit=limit,
+                                  distinct_by_id=distinct_by_id)
 
-    def copeople_view_one(self, coperson_id: int):
-        return copeople_view_one(self, coperson_id=coperson_id)
+    def iter_copeople_per_co(self, page_size: int = 1000, prefetch: bool = True):
+        return iter_copeople_per_co(self, page_size=page_size, prefetch=prefetch)
 
     # COPersonRoles API
     def coperson_roles_add(self, coperson_id: int, cou_id: int, status: str = None, affiliation: str = None):
         return coperson_roles_add(self, coperson_id=coperson_id, cou_id=cou_id, status=status, affiliation=affiliation)
 
+    def coperson_roles_add_many(self, items, max_workers: int = None, rate_limit: float = None, prefetch: str = 'auto'):
+        return coperson_roles_add_many(self, items=items, max_workers=max_workers, rate_limit=rate_limit,
+                                       prefetch=prefetch)
+
+    def coperson_roles_reconcile(self, desired: dict, remove: str = 'delete', dry_run: bool = False,
+                                 max_workers: int = None, rate_limit: float = None, fetch: str = 'auto', index=None):
+        return coperson_roles_reconcile(self, desired=desired, remove=remove, dry_run=dry_run, max_workers=max_workers,
+                                        rate_limit=rate_limit, fetch=fetch, index=index)
+
     def coperson_roles_delete(self, coperson_role_id: int):
         return coperson_roles_delete(self, coperson_role_id=coperson_role_id)
 
     def coperson_roles_edit(self, coperson_role_id: int, coperson_id: int = None, cou_id: int = None,
-                            status: str = None, affiliation: str = None):
+                            status: str = None, affiliation: str = None, coperson_role=None, verify: bool = False):
         return coperson_roles_edit(self, coperson_role_id=coperson_role_id, coperson_id=coperson_id, cou_id=cou_id,
-                                   status=status, affiliation=affiliation)
+                                   status=status, affiliation=affiliation, coperson_role=coperson_role,
+                                   verify=verify)
 
-    def coperson_roles_view_all(self):
-        return coperson_roles_view_all(self)
+    def coperson_roles_view_all(self, as_models: bool = False):
+        return coperson_roles_view_all(self, as_models=as_models)
 
-    def coperson_roles_view_per_coperson(self, coperson_id: int):
-        return coperson_roles_view_per_coperson(self, coperson_id=coperson_id)
+    def coperson_roles_view_per_coperson(self, coperson_id: int, as_models: bool = False):
+        return coperson_roles_view_per_coperson(self, coperson_id=coperson_id, as_models=as_models)
 
-    def coperson_roles_view_per_cou(self, cou_id: int):
-        return coperson_roles_view_per_cou(self, cou_id=cou_id)
+    def coperson_roles_view_per_cou(self, cou_id: int, as_models: bool = False):
+        return coperson_roles_view_per_cou(self, cou_id=cou_id, as_models=as_models)
 
-    def coperson_roles_view_one(self, coperson_role_id: int):
-        return coperson_roles_view_one(self, coperson_role_id=coperson_role_id)
+    def coperson_roles_view_one(self, coperson_role_id: int, as_models: bool = False):
+        return coperson_roles_view_one(self, coperson_role_id=coperson_role_id, as_models=as_models)
 
     # COU API
     def cous_add(self, name: str, description: str, parent_id: int = None):
@@ -173,14 +326,14 @@ class ComanageApi(object):
     def cous_edit(self, cou_id: int, name: str = None, description: str = None, parent_id: int = None):
         return cous_edit(self, cou_id=cou_id, name=name, description=description, parent_id=parent_id)
 
-    def cous_view_all(self):
-        return cous_view_all(self)
+    def cous_view_all(self, as_models: bool = False):
+        return cous_view_all(self, as_models=as_models)
 
-    def cous_view_per_co(self):
-        return cous_view_per_co(self)
+    def cous_view_per_co(self, as_models: bool = False):
+        return cous_view_per_co(self, as_models=as_models)
 
-    def cous_view_one(self, cou_id: int):
-        return cous_view_one(self, cou_id=cou_id)
+    def cous_view_one(self, cou_id: int, as_models: bool = False):
+        return cous_view_one(self, cou_id=cou_id, as_models=as_models)
 
     # EmailAddress API
     def email_addresses_add(self):
@@ -192,14 +345,17 @@ class ComanageApi(object):
     def email_addresses_edit(self):
         return email_addresses_edit(self)
 
-    def email_addresses_view_all(self):
-        return email_addresses_view_all(self)
+    def email_addresses_view_all(self, as_models: bool = False):
+        return email_addresses_view_all(self, as_models=as_models)
+
+    def iter_email_addresses_all(self):
+        return iter_email_addresses_all(self)
 
-    def email_addresses_view_per_person(self, person_type: str, person_id: int):
-        return email_addresses_view_per_person(self, person_type=person_type, person_id=person_id)
+    def email_addresses_view_per_person(self, person_type: str, person_id: int, as_models: bool = False):
+        return email_addresses_view_per_person(self, person_type=person_type, person_id=person_id, as_models=as_models)
 
-    def email_addresses_view_one(self, email_address_id: int):
-        return email_addresses_view_one(self, email_address_id=email_address_id)
+    def email_addresses_view_one(self, email_address_id: int, as_models: bool = False):
+        return email_addresses_view_one(self, email_address_id=email_address_id, as_models=as_models)
 
     # Indentifier API
     def identifiers_add(self):
@@ -214,14 +370,17 @@ class ComanageApi(object):
     def identifiers_edit(self):
         return identifiers_edit(self)
 
-    def identifiers_view_all(self):
-        return identifiers_view_all(self)
+    def identifiers_view_all(self, as_models: bool = False):
+        return identifiers_view_all(self, as_models=as_models)
 
-    def identifiers_view_per_entity(self, entity_type: str, entity_id: int):
-        return identifiers_view_per_entity(self, entity_type=entity_type, entity_id=entity_id)
+    def iter_identifiers_all(self):
+        return iter_identifiers_all(self)
 
-    def identifiers_view_one(self, identifier_id: int):
-        return identifiers_view_one(self, identifier_id=identifier_id)
+    def identifiers_view_per_entity(self, entity_type: str, entity_id: int, as_models: bool = False):
+        return identifiers_view_per_entity(self, entity_type=entity_type, entity_id=entity_id, as_models=as_models)
+
+    def identifiers_view_one(self, identifier_id: int, as_models: bool = False):
+        return identifiers_view_one(self, identifier_id=identifier_id, as_models=as_models)
 
     # Name API
     def names_add(self):
@@ -233,14 +392,17 @@ class ComanageApi(object):
     def names_edit(self):
         return names_edit(self)
 
-    def names_view_all(self):
-        return names_view_all(self)
+    def names_view_all(self, as_models: bool = False):
+        return names_view_all(self, as_models=as_models)
+
+    def iter_names_all(self):
+        return iter_names_all(self)
 
-    def names_view_per_person(self, person_type: str, person_id: int):
-        return names_view_per_person(self, person_type=person_type, person_id=person_id)
+    def names_view_per_person(self, person_type: str, person_id: int, as_models: bool = False):
+        return names_view_per_person(self, person_type=person_type, person_id=person_id, as_models=as_models)
 
-    def names_view_one(self, name_id: int):
-        return names_view_one(self, name_id=name_id)
+    def names_view_one(self, name_id: int, as_models: bool = False):
+        return names_view_one(self, name_id=name_id, as_models=as_models)
 
     # OrgIdentity API
     def org_identities_add(self):
@@ -252,17 +414,17 @@ class ComanageApi(object):
     def org_identities_edit(self):
         return org_identities_edit(self)
 
-    def org_identities_view_all(self):
-        return org_identities_view_all(self)
+    def org_identities_view_all(self, as_models: bool = False):
+        return org_identities_view_all(self, as_models=as_models)
 
-    def org_identities_view_per_co(self):
-        return org_identities_view_per_co(self)
+    def org_identities_view_per_co(self, as_models: bool = False):
+        return org_identities_view_per_co(self, as_models=as_models)
 
-    def org_identities_view_per_identifier(self, identifier_id: int):
-        return org_identities_view_per_identifier(self, identifier_id=identifier_id)
+    def org_identities_view_per_identifier(self, identifier_id: int, as_models: bool = False):
+        return org_identities_view_per_identifier(self, identifier_id=identifier_id, as_models=as_models)
 
-    def org_identities_view_one(self, org_identity_id: int):
-        return org_identities_view_one(self, org_identity_id=org_identity_id)
+    def org_identities_view_one(self, org_identity_id: int, as_models: bool = False):
+        return org_identities_view_one(self, org_identity_id=org_identity_id, as_models=as_models)
 
     # SshKey API
     def ssh_keys_add(self, coperson_id: int, ssh_key: str, key_type: str, comment: str = None,
@@ -278,11 +440,14 @@ class ComanageApi(object):
         return ssh_keys_edit(self, ssh_key_id=ssh_key_id, coperson_id=coperson_id, ssh_key=ssh_key, key_type=key_type,
                              comment=comment, ssh_key_authenticator_id=ssh_key_authenticator_id)
 
-    def ssh_keys_view_all(self):
-        return ssh_keys_view_all(self)
+    def ssh_keys_view_all(self, as_models: bool = False):
+        return ssh_keys_view_all(self, as_models=as_models)
+
+    def iter_ssh_keys_all(self):
+        return iter_ssh_keys_all(self)
 
-    def ssh_keys_view_per_coperson(self, coperson_id: int):
-        return ssh_keys_view_per_coperson(self, coperson_id=coperson_id)
+    def ssh_keys_view_per_coperson(self, coperson_id: int, as_models: bool = False):
+        return ssh_keys_view_per_coperson(self, coperson_id=coperson_id, as_models=as_models)
 
-    def ssh_keys_view_one(self, ssh_key_id: int):
-        return ssh_keys_view_one(self, ssh_key_id=ssh_key_id)
+    def ssh_keys_view_one(self, ssh_key_id: int, as_models: bool = False):
+        return ssh_keys_view_one(self, ssh_key_id=ssh_key_id, as_models=as_models)
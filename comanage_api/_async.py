@@ -0,0 +1,677 @@
+# comanage_api/_async.py
+
+"""
+AsyncComanageApi - asyncio client for the COmanage REST API v1
+
+Provides the same methods and return shapes as ComanageApi as coroutines, using a non-blocking
+aiohttp transport with a shared connection pool and a limit on the number of requests in flight.
+
+Requires the optional aiohttp dependency: pip install fabric-comanage-api[async]
+asyncio and aiohttp are imported on first use, importing comanage_api does not load them.
+"""
+
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+from ._copeople import DEFAULT_FIND_LIMIT, TooManyRecords, _find_params, _too_many_records
+from ._copersonroles import _check_role_version, _coperson_roles_post_body, _role_record
+from ._cous import _cous_post_body
+from ._json import decode
+from ._session import IDEMPOTENT_METHODS, RETRY_STATUS_OPTIONS, RETRY_STATUS_OPTIONS_POST, DeadlineExceeded, \
+    _backoff, _retry_after, count
+from ._sshkeys import _ssh_keys_post_body
+
+# response data read within the request context so the connection is released to the pool
+_AsyncResponse = namedtuple('_AsyncResponse', ['status_code', 'reason', 'url', 'headers', 'content'])
+
+
+class AsyncComanageApi(object):
+    """
+    fabric-comanage-api (asyncio):
+
+    Coroutine based equivalent of ComanageApi, every endpoint method must be awaited.
+    The client should be closed with 'await api.close()' or used as 'async with AsyncComanageApi(...) as api:'
+    Calls made within 'with api.deadline(seconds):' share one deadline, tracked per task (contextvar).
+
+    Attributes
+    ----------
+    co_api_url: str
+        COmanage registry URL (required)
+    co_api_user: str
+        COmanage API username (required)
+    co_api_pass: str
+        COmanage API password (required)
+    co_api_org_id: int
+        COmanage Org ID (required)
+    co_api_org_name: str
+        COmanage Org Name (required)
+    co_ssh_key_authenticator_id: int = None
+        SSH Authenticator Plugin ID (optional)
+    max_concurrency: int = 100
+        Maximum number of requests in flight at once, additional calls wait for a free slot (optional)
+    pool_maxsize: int = 100
+        Maximum number of connections kept open to the registry (optional)
+    keep_alive: bool = True
+        Reuse connections between requests (optional)
+    retry_total: int = 3
+        Maximum number of retries per request for transient failures, 0 disables retrying (optional)
+    retry_backoff_factor: float = 0.5
+        Base delay in seconds for jittered exponential backoff between retries (optional)
+    retry_backoff_max: float = 30.0
+        Maximum backoff delay in seconds between two retries (optional)
+    retry_budget: float = 60.0
+        Maximum total time in seconds a request may spend waiting on retries (optional)
+    connect_timeout: float = 5.0
+        Seconds to wait for a connection to the registry to be established (optional)
+    read_timeout: float = 30.0
+        Seconds to wait for the registry to send data before giving up on a request (optional)
+    json_loads: callable = None
+        JSON parser for response bodies taking bytes, defaults to orjson.loads when installed else json.loads
+        (optional)
+    """
+
+    def __init__(self, co_api_url: str, co_api_user: str, co_api_pass: str, co_api_org_id: int,
+                 co_api_org_name: str, co_ssh_key_authenticator_id: int = None, max_concurrency: int = 100,
+                 pool_maxsize: int = 100, keep_alive: bool = True, retry_total: int = 3,
+                 retry_backoff_factor: float = 0.5, retry_backoff_max: float = 30.0, retry_budget: float = 60.0,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0, json_loads=None):
+        # COmanage API user and pass
+        self._CO_API_USER = str(co_api_user)
+        self._CO_API_PASS = str(co_api_pass)
+        # COmanage CO information
+        self._CO_API_ORG_NAME = str(co_api_org_name)
+        self._CO_API_ORG_ID = int(co_api_org_id)
+        # COmanage Registry URL
+        if str(co_api_url).endswith('/'):
+            self._CO_API_URL = str(co_api_url)[:-1]
+        else:
+            self._CO_API_URL = str(co_api_url)
+        # COmanage SshKeyAuthenticatorId
+        if co_ssh_key_authenticator_id:
+            self._CO_SSH_KEY_AUTHENTICATOR_ID = int(co_ssh_key_authenticator_id)
+        else:
+            self._CO_SSH_KEY_AUTHENTICATOR_ID = 0
+        # Status Type options
+        self.STATUS_OPTIONS = ['Active', 'Approved', 'Confirmed', 'Declined', 'Deleted', 'Denied', 'Duplicate',
+                               'Expired',
+                               'GracePeriod', 'Invited', 'Pending', 'PendingApproval', 'PendingConfirmation',
+                               'Suspended']
+        # Affiliation Type options
+        self.AFFILIATION_OPTIONS = ['affiliate', 'alum', 'employee', 'faculty', 'member', 'staff', 'student']
+        # EmailAddress Type options
+        self.EMAILADDRESS_OPTIONS = ['codeptid', 'copersonid', 'organizationid', 'orgidentityid']
+        # Entity Type options
+        self.ENTITY_OPTIONS = ['codeptid', 'cogroupid', 'copersonid', 'organizationid', 'orgidentityid']
+        # Person Type options
+        self.PERSON_OPTIONS = ['copersonid', 'orgidentityid']
+        # SSH Key Type options
+        self.SSH_KEY_OPTIONS = ['ssh-dss', 'ecdsa-sha2-nistp256', 'ecdsa-sha2-nistp384', 'ecdsa-sha2-nistp521',
+                                'ssh-ed25519', 'ssh-rsa', 'ssh-rsa1']
+        # not implemented endpoints
+        self._MOCK_501_URL = 'mock://not_implemented_501.local'
+        # transport settings, the session and semaphore are created on first use within the running event loop
+        if int(max_concurrency) < 1:
+            raise TypeError("Invalid Fields 'max_concurrency'")
+        if int(pool_maxsize) < 1:
+            raise TypeError("Invalid Fields 'pool_maxsize'")
+        self._MAX_CONCURRENCY = int(max_concurrency)
+        self._POOL_MAXSIZE = int(pool_maxsize)
+        self._KEEP_ALIVE = bool(keep_alive)
+        self._CONNECT_TIMEOUT = float(connect_timeout)
+        self._READ_TIMEOUT = float(read_timeout)
+        self._session = None
+        self._semaphore = None
+        # deadline of the calling task (monotonic time), set with deadline()
+        self._deadline = ContextVar('comanage_api_deadline', default=None)
+        # JSON parser, resolved on first use when not provided
+        self._json_loads = json_loads
+        # Retry policy
+        self._RETRY_TOTAL = max(int(retry_total), 0)
+        self._RETRY_BACKOFF_FACTOR = float(retry_backoff_factor)
+        self._RETRY_BACKOFF_MAX = float(retry_backoff_max)
+        self._RETRY_BUDGET = float(retry_budget)
+        # client statistics
+        self._stats_lock = threading.Lock()
+        self._counters = {}
+        self._in_flight = 0
+        self._in_flight_peak = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying connection pool.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+
+    def _get_session(self):
+        if self._session is None:
+            import asyncio
+            try:
+                import aiohttp
+            except ImportError:
+                raise ImportError("AsyncComanageApi requires 'aiohttp': pip install fabric-comanage-api[async]")
+            connector = aiohttp.TCPConnector(
+                limit=self._POOL_MAXSIZE,
+                limit_per_host=self._POOL_MAXSIZE,
+                force_close=not self._KEEP_ALIVE
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                auth=aiohttp.BasicAuth(self._CO_API_USER, self._CO_API_PASS),
+                headers={'Content-Type': 'application/json'},
+                timeout=aiohttp.ClientTimeout(connect=self._CONNECT_TIMEOUT, sock_read=self._READ_TIMEOUT)
+            )
+            self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENCY)
+        return self._session
+
+    @contextmanager
+    def deadline(self, seconds: float):
+        """
+        Bound every registry call awaited within the context by one deadline, as ComanageApi.deadline().
+        The deadline is tracked per task, tasks created within the context inherit it.
+
+        with api.deadline(2.0):
+            await api.coperson_roles_edit(coperson_role_id=123, status='Expired')
+
+        :param seconds: time allowed from now
+        :return
+            monotonic time at which the deadline expires
+        """
+        expires = time.monotonic() + float(seconds)
+        previous = self._deadline.get()
+        if previous is not None:
+            expires = min(expires, previous)
+        token = self._deadline.set(expires)
+        try:
+            yield expires
+        finally:
+            self._deadline.reset(token)
+
+    def _remaining(self):
+        """
+        Time left before the deadline of the calling task, None when no deadline is set. Raises
+        DeadlineExceeded when it has already expired.
+        """
+        expires = self._deadline.get()
+        if expires is None:
+            return None
+        remaining = expires - time.monotonic()
+        if remaining <= 0:
+            count(self, 'deadline_exceeded')
+            raise DeadlineExceeded('Deadline exceeded before the request could be sent')
+        return remaining
+
+    def _fits_deadline(self, delay: float) -> bool:
+        expires = self._deadline.get()
+        return expires is None or time.monotonic() + delay < expires
+
+    async def _request(self, method: str, url: str, params: dict = None, data: str = None) -> _AsyncResponse:
+        """
+        Send a request to the registry, retrying transient failures per the client retry policy
+        (same rules as the synchronous client). Each attempt, including the wait for a free slot, is bounded
+        by the time left before the deadline of the calling task, and no retry is attempted past it.
+        """
+        import asyncio
+        import aiohttp
+        session = self._get_session()
+        method = str(method).upper()
+        if method in IDEMPOTENT_METHODS:
+            retry_statuses = RETRY_STATUS_OPTIONS
+            retry_errors = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        else:
+            retry_statuses = RETRY_STATUS_OPTIONS_POST
+            retry_errors = (aiohttp.ClientConnectorError,)
+        if params:
+            params = {str(k): str(v) for k, v in params.items()}
+
+        async def send() -> _AsyncResponse:
+            async with self._semaphore:
+                self._in_flight += 1
+                self._in_flight_peak = max(self._in_flight_peak, self._in_flight)
+                try:
+                    async with session.request(method, url, params=params, data=data) as r:
+                        return _AsyncResponse(r.status, r.reason, str(r.url), r.headers, await r.read())
+                finally:
+                    self._in_flight -= 1
+
+        attempt = 0
+        waited = 0.0
+        while True:
+            remaining = self._remaining()
+            try:
+                if remaining is None:
+                    resp = await send()
+                else:
+                    try:
+                        resp = await asyncio.wait_for(send(), remaining)
+                    except asyncio.TimeoutError:
+                        if self._fits_deadline(0):
+                            # connect or read timeout of the session, retried as usual
+                            raise
+                        count(self, 'deadline_exceeded')
+                        raise DeadlineExceeded('Deadline exceeded while waiting for the registry')
+            except retry_errors:
+                if attempt >= self._RETRY_TOTAL:
+                    count(self, 'retry_exhausted')
+                    raise
+                delay = _backoff(self, attempt)
+                if waited + delay > self._RETRY_BUDGET or not self._fits_deadline(delay):
+                    count(self, 'retry_exhausted')
+                    raise
+            else:
+                if resp.status_code not in retry_statuses:
+                    return resp
+                if attempt >= self._RETRY_TOTAL:
+                    count(self, 'retry_exhausted')
+                    return resp
+                delay = _retry_after(resp)
+                if delay is None:
+                    delay = _backoff(self, attempt)
+                if waited + delay > self._RETRY_BUDGET or not self._fits_deadline(delay):
+                    count(self, 'retry_exhausted')
+                    return resp
+            attempt += 1
+            waited += delay
+            count(self, 'retries')
+            count(self, 'retry_wait_seconds', delay)
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _response(resp: _AsyncResponse) -> Response:
+        """
+        requests.Response holding the status code, reason, url, headers and body of resp, attached to the
+        exceptions raised so that they carry the same err.response as with the synchronous client.
+        """
+        response = Response()
+        response.status_code = resp.status_code
+        response.reason = resp.reason
+        response.url = resp.url
+        response.headers = CaseInsensitiveDict(resp.headers or {})
+        response._content = resp.content
+        return response
+
+    def _raise_for_status(self, resp: _AsyncResponse):
+        """
+        Raise requests.exceptions.HTTPError for 4xx/5xx responses, matching the synchronous client: the
+        error is raised by requests.Response.raise_for_status().
+        """
+        if resp.status_code < 400:
+            return
+        self._response(resp).raise_for_status()
+
+    async def _not_implemented(self):
+        self._raise_for_status(_AsyncResponse(501, 'Not Implemented', self._MOCK_501_URL, {}, b''))
+
+    async def _get_json(self, url: str, params: dict = None) -> dict:
+        resp = await self._request('GET', url=url, params=params)
+        if resp.status_code == 200:
+            return decode(self, resp)
+        else:
+            self._raise_for_status(resp)
+
+    async def _post_json(self, url: str, data: str) -> dict:
+        resp = await self._request('POST', url=url, data=data)
+        if resp.status_code == 201:
+            return decode(self, resp)
+        else:
+            self._raise_for_status(resp)
+
+    async def _put(self, url: str, data: str) -> bool:
+        resp = await self._request('PUT', url=url, data=data)
+        if resp.status_code == 200:
+            return True
+        else:
+            self._raise_for_status(resp)
+
+    async def _delete(self, url: str, params: dict = None) -> bool:
+        resp = await self._request('DELETE', url=url, params=params)
+        if resp.status_code == 200:
+            return True
+        else:
+            self._raise_for_status(resp)
+
+    @staticmethod
+    def _distinct_copeople(resp_dict: dict) -> dict:
+        resp_dict['CoPeople'] = list({v['Id']: v for v in resp_dict.get('CoPeople')}.values())
+        return resp_dict
+
+    # Client statistics
+    def stats(self) -> dict:
+        with self._stats_lock:
+            counters = dict(self._counters)
+        return {
+            'concurrency': {
+                'max_concurrency': self._MAX_CONCURRENCY,
+                'in_flight': self._in_flight,
+                'in_flight_peak': self._in_flight_peak
+            },
+            'retry': {
+                'retries': counters.get('retries', 0),
+                'retry_wait_seconds': round(counters.get('retry_wait_seconds', 0.0), 3),
+                'retry_exhausted': counters.get('retry_exhausted', 0)
+            },
+            'deadline_exceeded': counters.get('deadline_exceeded', 0),
+            'roles_edit': {
+                'gets': counters.get('roles_edit_gets', 0),
+                'gets_avoided': counters.get('roles_edit_gets_avoided', 0),
+                'conflicts': counters.get('roles_edit_conflicts', 0)
+            }
+        }
+
+    # CoOrgIdentityLink API
+    async def coorg_identity_links_add(self):
+        return await self._not_implemented()
+
+    async def coorg_identity_links_delete(self):
+        return await self._not_implemented()
+
+    async def coorg_identity_links_edit(self):
+        return await self._not_implemented()
+
+    async def coorg_identity_links_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/co_org_identity_links.json')
+
+    async def coorg_identity_links_view_by_identity(self, identity_type: str, identity_id: int):
+        if not identity_type:
+            identity_type = 'copersonid'
+        else:
+            identity_type = str(identity_type).lower()
+        if identity_type not in self.PERSON_OPTIONS:
+            raise TypeError("Invalid Fields 'identity_type'")
+        return await self._get_json(self._CO_API_URL + '/co_org_identity_links.json',
+                                    params={str(identity_type): str(identity_id)})
+
+    async def coorg_identity_links_view_one(self, coorg_identity_link_id: int):
+        return await self._get_json(
+            self._CO_API_URL + '/co_org_identity_links/' + str(coorg_identity_link_id) + '.json')
+
+    # COperson API
+    async def copeople_add(self):
+        return await self._not_implemented()
+
+    async def copeople_delete(self):
+        return await self._not_implemented()
+
+    async def copeople_edit(self):
+        return await self._not_implemented()
+
+    async def copeople_find(self, given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                            limit: int = DEFAULT_FIND_LIMIT, distinct_by_id: bool = True):
+        params = _find_params(self, given=given, family=family, mail=mail, identifier=identifier, limit=limit)
+        resp = await self._request('GET', url=self._CO_API_URL + '/co_people.json', params=params)
+        if resp.status_code != 200:
+            self._raise_for_status(resp)
+        # same errors as the synchronous client: a message rather than records raises TooManyRecords,
+        # malformed JSON raises ValueError
+        if 'json' not in (resp.headers or {}).get('Content-Type', 'application/json'):
+            raise TooManyRecords(resp.content.decode(errors='replace').strip(), response=self._response(resp))
+        try:
+            resp_dict = decode(self, resp)
+        except ValueError:
+            message = resp.content.decode('utf-8-sig', errors='replace').strip()
+            if message.startswith('{'):
+                raise
+            raise TooManyRecords(message, response=self._response(resp))
+        if 'CoPeople' not in resp_dict:
+            raise _too_many_records(resp_dict, self._response(resp))
+        if distinct_by_id:
+            resp_dict = self._distinct_copeople(resp_dict)
+        resp_dict['CoPeople'] = resp_dict.get('CoPeople')[:params.get('limit')]
+        return resp_dict
+
+    async def copeople_match(self, given: str = None, family: str = None, mail: str = None,
+                             distinct_by_id: bool = True):
+        params = {'coid': self._CO_API_ORG_ID}
+        if given:
+            params.update({'given': given})
+        if family:
+            params.update({'family': family})
+        if mail:
+            params.update({'mail': mail})
+        resp_dict = await self._get_json(self._CO_API_URL + '/co_people.json', params=params)
+        if distinct_by_id:
+            return self._distinct_copeople(resp_dict)
+        return resp_dict
+
+    async def copeople_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/co_people.json')
+
+    async def copeople_view_per_co(self):
+        return await self._get_json(self._CO_API_URL + '/co_people.json', params={'coid': self._CO_API_ORG_ID})
+
+    async def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = True):
+        params = {'coid': self._CO_API_ORG_ID, 'search.identifier': identifier}
+        resp_dict = await self._get_json(self._CO_API_URL + '/co_people.json', params=params)
+        if distinct_by_id:
+            return self._distinct_copeople(resp_dict)
+        return resp_dict
+
+    async def copeople_view_one(self, coperson_id: int):
+        return await self._get_json(self._CO_API_URL + '/co_people/' + str(coperson_id) + '.json',
+                                    params={'coid': self._CO_API_ORG_ID})
+
+    # COPersonRoles API
+    async def coperson_roles_add(self, coperson_id: int, cou_id: int, status: str = None, affiliation: str = None):
+        post_body = _coperson_roles_post_body(self, coperson_id=coperson_id, cou_id=cou_id, status=status,
+                                              affiliation=affiliation)
+        return await self._post_json(self._CO_API_URL + '/co_person_roles.json', data=post_body)
+
+    async def coperson_roles_delete(self, coperson_role_id: int):
+        return await self._delete(self._CO_API_URL + '/co_person_roles/' + str(coperson_role_id) + '.json')
+
+    async def coperson_roles_edit(self, coperson_role_id: int, coperson_id: int = None, cou_id: int = None,
+                                  status: str = None, affiliation: str = None, coperson_role=None,
+                                  verify: bool = False):
+        snapshot = None if coperson_role is None else _role_record(coperson_role_id, coperson_role)
+        if verify or snapshot is None:
+            current = (await self.coperson_roles_view_one(coperson_role_id)).get('CoPersonRoles')[0]
+            count(self, 'roles_edit_gets')
+            if snapshot is None:
+                snapshot = current
+            else:
+                _check_role_version(self, coperson_role_id, snapshot, current)
+        else:
+            count(self, 'roles_edit_gets_avoided')
+        post_body = _coperson_roles_post_body(self, coperson_id=coperson_id, cou_id=cou_id, status=status,
+                                              affiliation=affiliation, coperson_role=snapshot)
+        return await self._put(self._CO_API_URL + '/co_person_roles/' + str(coperson_role_id) + '.json',
+                               data=post_body)
+
+    async def coperson_roles_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/co_person_roles.json')
+
+    async def coperson_roles_view_per_coperson(self, coperson_id: int):
+        return await self._get_json(self._CO_API_URL + '/co_person_roles.json',
+                                    params={'copersonid': int(coperson_id)})
+
+    async def coperson_roles_view_per_cou(self, cou_id: int):
+        return await self._get_json(self._CO_API_URL + '/co_person_roles.json', params={'couid': int(cou_id)})
+
+    async def coperson_roles_view_one(self, coperson_role_id: int):
+        return await self._get_json(self._CO_API_URL + '/co_person_roles/' + str(coperson_role_id) + '.json')
+
+    # COU API
+    async def cous_add(self, name: str, description: str, parent_id: int = None):
+        post_body = _cous_post_body(self, name=name, description=description, parent_id=parent_id)
+        return await self._post_json(self._CO_API_URL + '/cous.json', data=post_body)
+
+    async def cous_delete(self, cou_id: int):
+        return await self._delete(self._CO_API_URL + '/cous/' + str(cou_id) + '.json',
+                                  params={'coid': self._CO_API_ORG_ID})
+
+    async def cous_edit(self, cou_id: int, name: str = None, description: str = None, parent_id: int = None):
+        cou = await self.cous_view_one(cou_id)
+        post_body = _cous_post_body(self, name=name, description=description, parent_id=parent_id,
+                                    cou=cou.get('Cous')[0])
+        return await self._put(self._CO_API_URL + '/cous/' + str(cou_id) + '.json', data=post_body)
+
+    async def cous_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/cous.json')
+
+    async def cous_view_per_co(self):
+        return await self._get_json(self._CO_API_URL + '/cous.json', params={'coid': self._CO_API_ORG_ID})
+
+    async def cous_view_one(self, cou_id: int):
+        return await self._get_json(self._CO_API_URL + '/cous/' + str(cou_id) + '.json',
+                                    params={'coid': self._CO_API_ORG_ID})
+
+    # EmailAddress API
+    async def email_addresses_add(self):
+        return await self._not_implemented()
+
+    async def email_addresses_delete(self):
+        return await self._not_implemented()
+
+    async def email_addresses_edit(self):
+        return await self._not_implemented()
+
+    async def email_addresses_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/email_addresses.json')
+
+    async def email_addresses_view_per_person(self, person_type: str, person_id: int):
+        if not person_type:
+            person_type = 'copersonid'
+        else:
+            person_type = str(person_type).lower()
+        if person_type not in self.EMAILADDRESS_OPTIONS:
+            raise TypeError("Invalid Fields 'person_type'")
+        return await self._get_json(self._CO_API_URL + '/email_addresses.json',
+                                    params={str(person_type): str(person_id)})
+
+    async def email_addresses_view_one(self, email_address_id: int):
+        return await self._get_json(self._CO_API_URL + '/email_addresses/' + str(email_address_id) + '.json')
+
+    # Indentifier API
+    async def identifiers_add(self):
+        return await self._not_implemented()
+
+    async def identifiers_assign(self):
+        return await self._not_implemented()
+
+    async def identifiers_delete(self):
+        return await self._not_implemented()
+
+    async def identifiers_edit(self):
+        return await self._not_implemented()
+
+    async def identifiers_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/identifiers.json')
+
+    async def identifiers_view_per_entity(self, entity_type: str, entity_id: int):
+        if not entity_type:
+            entity_type = 'copersonid'
+        else:
+            entity_type = str(entity_type).lower()
+        if entity_type not in self.ENTITY_OPTIONS:
+            raise TypeError("Invalid Fields 'entity_type'")
+        return await self._get_json(self._CO_API_URL + '/identifiers.json',
+                                    params={str(entity_type): str(entity_id)})
+
+    async def identifiers_view_one(self, identifier_id: int):
+        return await self._get_json(self._CO_API_URL + '/identifiers/' + str(identifier_id) + '.json')
+
+    # Name API
+    async def names_add(self):
+        return await self._not_implemented()
+
+    async def names_delete(self):
+        return await self._not_implemented()
+
+    async def names_edit(self):
+        return await self._not_implemented()
+
+    async def names_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/names.json')
+
+    async def names_view_per_person(self, person_type: str, person_id: int):
+        if not person_type:
+            person_type = 'copersonid'
+        else:
+            person_type = str(person_type).lower()
+        if person_type not in self.PERSON_OPTIONS:
+            raise TypeError("Invalid Fields 'person_type'")
+        return await self._get_json(self._CO_API_URL + '/names.json', params={str(person_type): str(person_id)})
+
+    async def names_view_one(self, name_id: int):
+        return await self._get_json(self._CO_API_URL + '/names/' + str(name_id) + '.json')
+
+    # OrgIdentity API
+    async def org_identities_add(self):
+        return await self._not_implemented()
+
+    async def org_identities_delete(self):
+        return await self._not_implemented()
+
+    async def org_identities_edit(self):
+        return await self._not_implemented()
+
+    async def org_identities_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/org_identities.json')
+
+    async def org_identities_view_per_co(self):
+        return await self._get_json(self._CO_API_URL + '/org_identities.json', params={'coid': self._CO_API_ORG_ID})
+
+    async def org_identities_view_per_identifier(self, identifier_id: int):
+        return await self._get_json(self._CO_API_URL + '/org_identities.json',
+                                    params={'coid': self._CO_API_ORG_ID, 'search.identifier': int(identifier_id)})
+
+    async def org_identities_view_one(self, org_identity_id: int):
+        return await self._get_json(self._CO_API_URL + '/org_identities/' + str(org_identity_id) + '.json',
+                                    params={'coid': self._CO_API_ORG_ID})
+
+    # SshKey API
+    async def ssh_keys_add(self, coperson_id: int, ssh_key: str, key_type: str, comment: str = None,
+                           ssh_key_authenticator_id: int = None):
+        if not ssh_key_authenticator_id:
+            ssh_key_authenticator_id = self._CO_SSH_KEY_AUTHENTICATOR_ID
+        post_body = _ssh_keys_post_body(self, coperson_id=coperson_id, ssh_key=ssh_key, key_type=key_type,
+                                        comment=comment, ssh_key_authenticator_id=ssh_key_authenticator_id)
+        return await self._post_json(self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json', data=post_body)
+
+    async def ssh_keys_delete(self, ssh_key_id: int):
+        return await self._delete(self._CO_API_URL + '/ssh_key_authenticator/ssh_keys/' + str(ssh_key_id) + '.json')
+
+    async def ssh_keys_edit(self, ssh_key_id: int, coperson_id: int = None, ssh_key: str = None,
+                            key_type: str = None, comment: str = None, ssh_key_authenticator_id: int = None):
+        sshkey = await self.ssh_keys_view_one(ssh_key_id=ssh_key_id)
+        post_body = _ssh_keys_post_body(self, coperson_id=coperson_id, ssh_key=ssh_key, key_type=key_type,
+                                        comment=comment, ssh_key_authenticator_id=ssh_key_authenticator_id,
+                                        sshkey=sshkey.get('SshKeys')[0])
+        return await self._put(self._CO_API_URL + '/ssh_key_authenticator/ssh_keys/' + str(ssh_key_id) + '.json',
+                               data=post_body)
+
+    async def ssh_keys_view_all(self):
+        return await self._get_json(self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json')
+
+    async def ssh_keys_view_per_coperson(self, coperson_id: int):
+        resp = await self._request('GET', url=self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json',
+                                   params={'copersonid': str(coperson_id)})
+        no_ssh_keys = {
+            'RequestType': 'SshKeys',
+            'Version': '1.0',
+            'SshKeys': []
+        }
+        if resp.status_code == 200:
+            return decode(self, resp)
+        if resp.status_code == 204:
+            return no_ssh_keys
+        else:
+            self._raise_for_status(resp)
+
+    async def ssh_keys_view_one(self, ssh_key_id: int):
+        return await self._get_json(
+            self._CO_API_URL + '/ssh_key_authenticator/ssh_keys/' + str(ssh_key_id) + '.json')
@@ -0,0 +1,233 @@
+# comanage_api/_cache.py
+
+"""
+Cache - bounded in-memory TTL/LRU cache of registry GET responses
+
+Entries are tagged with the resource they belong to (e.g. 'co_person_roles') and the filters of the
+request (e.g. {'copersonid': '123'} or {'id': '456'}) so that writes can invalidate exactly the entries
+they may affect.
+
+Methods
+-------
+cache_invalidate(resource: str, **filters) -> int
+    Drop the cached entries of resource that may be affected by a write matching filters.
+cache_clear() -> None
+    Drop all cached entries.
+cache_peek(url: str, params: dict = None) -> dict
+    Decoded body of a cached response, None when not cached (never sends a request).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from ._json import decode
+
+# default time-to-live in seconds per resource, resources not listed use DEFAULT_CACHE_TTL
+CACHE_TTL_OPTIONS = {
+    'co_people': 60,
+    'co_person_roles': 60,
+    'cous': 300,
+    'ssh_keys': 60
+}
+DEFAULT_CACHE_TTL = 30
+# request parameters that scope a request to the CO rather than filter it
+_SCOPE_PARAMS = ['coid']
+
+
+def request_key(method: str, url: str, params: dict = None) -> tuple:
+    """
+    Key identifying equivalent requests.
+
+    :param method:
+    :param url:
+    :param params:
+    :return
+        (method, url, sorted params)
+    """
+    if params:
+        return method, url, tuple(sorted((str(k), str(v)) for k, v in params.items()))
+    return method, url, ()
+
+
+def resource_filters(base_url: str, url: str, params: dict = None) -> tuple:
+    """
+    Resource name and filters of a request.
+
+    /co_person_roles.json?couid=12      -> ('co_person_roles', {'couid': '12'})
+    /ssh_key_authenticator/ssh_keys/5.json -> ('ssh_keys', {'id': '5'})
+
+    :param base_url:
+    :param url:
+    :param params:
+    :return
+        (resource, filters)
+    """
+    path = url[len(base_url):] if url.startswith(base_url) else url
+    if path.endswith('.json'):
+        path = path[:-len('.json')]
+    segments = [segment for segment in path.split('/') if segment]
+    filters = {}
+    if len(segments) > 1 and segments[-1].isdigit():
+        filters['id'] = segments[-1]
+        resource = segments[-2]
+    else:
+        resource = segments[-1] if segments else ''
+    for k, v in (params or {}).items():
+        if k not in _SCOPE_PARAMS:
+            filters[str(k)] = str(v)
+    return resource, filters
+
+
+class ResponseCache(object):
+    """
+    Thread-safe TTL/LRU cache of responses keyed by request.
+
+    Attributes
+    ----------
+    maxsize: int
+        Maximum number of cached responses, the least recently used entry is evicted first
+    ttls: dict
+        Time-to-live in seconds per resource, 0 disables caching of that resource
+    default_ttl: float
+        Time-to-live in seconds for resources not in ttls
+    """
+
+    def __init__(self, maxsize: int, ttls: dict = None, default_ttl: float = DEFAULT_CACHE_TTL):
+        self.maxsize = int(maxsize)
+        self.ttls = dict(CACHE_TTL_OPTIONS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = float(default_ttl)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # incremented by every invalidation, responses fetched before an invalidation are not stored
+        self.generation = 0
+        self.hits = self.misses = self.evictions = self.expirations = self.invalidations = 0
+
+    def ttl(self, resource: str) -> float:
+        return float(self.ttls.get(resource, self.default_ttl))
+
+    def get(self, key):
+        """
+        Cached value for key, None on a miss or when the entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def peek(self, key):
+        """
+        Cached value for key without updating recency or statistics.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[3]
+
+    def set(self, key, resource: str, filters: dict, value, generation: int = None):
+        """
+        Store value for key, ignored when an invalidation happened since generation was read.
+        """
+        ttl = self.ttl(resource)
+        if ttl <= 0 or self.maxsize < 1:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic() + ttl, resource, filters, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, resource: str, **filters) -> int:
+        """
+        Drop entries of resource that may be affected by a write matching filters. An entry is kept
+        only when one of its filters is known (present in filters) and has a different value,
+        e.g. invalidate('co_person_roles', copersonid=1, couid=2) keeps '?copersonid=3' and drops
+        '?couid=2', the unfiltered listing and every '/<id>' entry.
+
+        :return
+            number of entries dropped
+        """
+        filters = {str(k): str(v) for k, v in filters.items() if v is not None}
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry[1] == resource and all(
+                k not in filters or filters[k] == v for k, v in entry[2].items())]
+            for key in keys:
+                del self._entries[key]
+            self.invalidations += len(keys)
+            self.generation += 1
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+
+def cache_invalidate(self, resource: str, **filters) -> int:
+    """
+    Drop the cached entries of resource that may be affected by a write matching filters.
+
+    :param self:
+    :param resource: e.g. 'co_person_roles', 'cous', 'ssh_keys'
+    :param filters: known attributes of the written record, e.g. copersonid=123, couid=45, id=678
+    :return
+        number of entries dropped
+    """
+    if self._cache is None:
+        return 0
+    return self._cache.invalidate(resource, **filters)
+
+
+def cache_clear(self):
+    """
+    Drop all cached entries.
+
+    :param self:
+    """
+    if self._cache is not None:
+        self._cache.clear()
+
+
+def cache_peek(self, url: str, params: dict = None):
+    """
+    Decoded body of a cached (unexpired) response for a GET request, never sends a request.
+
+    :param self:
+    :param url:
+    :param params:
+    :return
+        dict or None
+    """
+    if self._cache is None:
+        return None
+    resp = self._cache.peek(request_key('GET', url, params))
+    if resp is None or resp.status_code != 200:
+        return None
+    return decode(self, resp)
@@ -0,0 +1,123 @@
+# comanage_api/_conditional.py
+
+"""
+Conditional GET - revalidation of large collections with ETag / If-Modified-Since
+
+The last response of each revalidated collection is kept with its validators (ETag, Last-Modified)
+and a fingerprint of its content: the ETag when the registry sends one, otherwise a SHA-256 hash of the
+body. Consumers compare fingerprints to skip reprocessing a collection that has not changed.
+
+Methods
+-------
+collection_fingerprint(method: str) -> str
+    Fingerprint of the last response of a revalidated collection, None when not fetched yet.
+"""
+
+import hashlib
+import threading
+
+from requests import Response
+
+from ._cache import request_key
+
+# collections fetched with conditional requests: method name -> (path, scoped to the CO)
+CONDITIONAL_COLLECTIONS = {
+    'copeople_view_per_co': ('/co_people.json', True),
+    'coperson_roles_view_all': ('/co_person_roles.json', False),
+    'ssh_keys_view_all': ('/ssh_key_authenticator/ssh_keys.json', False)
+}
+
+
+class ValidatorStore(object):
+    """
+    Thread-safe store of the last response, validators and fingerprint per request.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.not_modified = self.modified = self.unchanged = 0
+
+    def get(self, key) -> dict:
+        with self._lock:
+            return self._entries.get(key)
+
+    def conditional_headers(self, key) -> dict:
+        """
+        If-None-Match / If-Modified-Since headers for the stored response of key.
+        """
+        entry = self.get(key)
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry.get('etag')
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry.get('last_modified')
+        return headers
+
+    def update(self, key, resp: Response) -> Response:
+        """
+        Record the outcome of a conditional request for key.
+
+        :return
+            response to hand to the caller (the stored one on 304 Not Modified)
+        """
+        if resp.status_code == 304:
+            entry = self.get(key)
+            if entry is None:
+                return resp
+            with self._lock:
+                self.not_modified += 1
+            return entry.get('response')
+        if resp.status_code != 200:
+            return resp
+        etag = resp.headers.get('ETag')
+        if etag:
+            fingerprint = 'etag:' + etag
+        else:
+            fingerprint = 'sha256:' + hashlib.sha256(resp.content).hexdigest()
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous.get('fingerprint') == fingerprint:
+                self.unchanged += 1
+            else:
+                self.modified += 1
+            self._entries[key] = {
+                'etag': etag,
+                'last_modified': resp.headers.get('Last-Modified'),
+                'fingerprint': fingerprint,
+                'response': resp
+            }
+        return resp
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'collections': len(self._entries),
+                'not_modified': self.not_modified,
+                'modified': self.modified,
+                'unchanged': self.unchanged
+            }
+
+
+def collection_fingerprint(self, method: str) -> str:
+    """
+    Fingerprint of the last response of a revalidated collection ('etag:<ETag>' or 'sha256:<hash of body>').
+    The fingerprint only changes when the collection does, consumers can skip reprocessing when it
+    matches the value seen on their previous run.
+
+    fingerprint = api.collection_fingerprint('coperson_roles_view_all')
+
+    :param self:
+    :param method: one of 'copeople_view_per_co', 'coperson_roles_view_all', 'ssh_keys_view_all'
+    :return
+        fingerprint or None when the collection has not been fetched (or conditional_get is disabled)
+    """
+    if method not in CONDITIONAL_COLLECTIONS:
+        raise TypeError("Invalid Fields 'method'")
+    if self._validators is None:
+        return None
+    path, scoped = CONDITIONAL_COLLECTIONS.get(method)
+    params = {'coid': self._CO_API_ORG_ID} if scoped else None
+    entry = self._validators.get(request_key('GET', self._CO_API_URL + path, params))
+    return entry.get('fingerprint') if entry is not None else None
@@ -16,15 +16,17 @@ coorg_identity_links_delete() -> bool
 coorg_identity_links_edit() -> bool
     ### NOT IMPLEMENTED ###
     Edit an existing CO Identity Link.
-coorg_identity_links_view_all() -> dict
+coorg_identity_links_view_all(as_models: bool = False) -> dict
     Retrieve all existing CO Identity Links.
-coorg_identity_links_view_by_identity(identifier_id: int) -> dict
+coorg_identity_links_view_by_identity(identifier_id: int, as_models: bool = False) -> dict
     Retrieve all existing CO Identity Links for a CO Person or an Org Identity.
-coorg_identity_links_view_one(org_identity_id: int) -> dict
+coorg_identity_links_view_one(org_identity_id: int, as_models: bool = False) -> dict
     Retrieve an existing CO Identity Link.
 """
 
-import json
+from ._json import decode
+from ._models import to_models
+from ._session import not_implemented, request
 
 
 def coorg_identity_links_add(self) -> dict:
@@ -38,12 +40,9 @@ def coorg_identity_links_add(self) -> dict:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        return decode(self, resp)
     else:
         resp.raise_for_status()
 
@@ -57,10 +56,7 @@ def coorg_identity_links_delete(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -76,21 +72,19 @@ def coorg_identity_links_edit(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
         resp.raise_for_status()
 
 
-def coorg_identity_links_view_all(self) -> dict:
+def coorg_identity_links_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO Identity Links.
 
     :param self:
+    :param as_models: return the records as CoOrgIdentityLink models instead of dicts
     :return
         {
             "ResponseType":"CoOrgIdentityLinks",
@@ -116,23 +110,26 @@ def coorg_identity_links_view_all(self) -> dict:
         500 Other Error                                     Unknown error
     """
     url = self._CO_API_URL + '/co_org_identity_links.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
 
-def coorg_identity_links_view_by_identity(self, identity_type: str, identity_id: int) -> dict:
+def coorg_identity_links_view_by_identity(self, identity_type: str, identity_id: int, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO Identity Links for a CO Person or an Org Identity.
 
     :param self:
     :param identity_type:
     :param identity_id:
+    :param as_models: return the records as CoOrgIdentityLink models instead of dicts
     :return
        {
             "ResponseType":"CoOrgIdentityLinks",
@@ -167,22 +164,25 @@ def coorg_identity_links_view_by_identity(self, identity_type: str, identity_id:
         raise TypeError("Invalid Fields 'identity_type'")
     url = self._CO_API_URL + '/co_org_identity_links.json'
     params = {str(identity_type): str(identity_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def coorg_identity_links_view_one(self, coorg_identity_link_id: int) -> dict:
+def coorg_identity_links_view_one(self, coorg_identity_link_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing CO Identity Link.
 
     :param self:
     :param coorg_identity_link_id:
+    :param as_models: return the records as CoOrgIdentityLink models instead of dicts
     :return
         {
             "ResponseType":"CoOrgIdentityLinks",
@@ -208,10 +208,12 @@ def coorg_identity_links_view_one(self, coorg_identity_link_id: int) -> dict:
         500 Other Error                                                 Unknown error
     """
     url = self._CO_API_URL + '/co_org_identity_links/' + str(coorg_identity_link_id) + '.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
@@ -17,26 +17,72 @@ copeople_delete() -> bool
 copeople_edit() -> bool
     ### NOT IMPLEMENTED ###
     Edit an existing CO Person.
-copeople_find() -> dict
-    ### NOT IMPLEMENTED ###
+copeople_find(given: str = None, family: str = None, mail: str = None, identifier: str = None,
+              limit: int = 100, distinct_by_id: bool = True) -> dict
     Search for existing CO Person records.
-    When too many records are found, a message may be returned rather than specific records.
+    When too many records are found, a message may be returned rather than specific records
+    (TooManyRecords is raised).
 copeople_match(given: str = None, family: str = None, mail: str = None, distinct_by_id: bool = True) -> dict
     Attempt to match existing CO Person records.
     Note that matching is not performed on search criteria of less than 3 characters,
     or for email addresses that are not syntactically valid.
-copeople_view_all() -> dict
+copeople_match_many(queries: iterable, max_workers: int = None, distinct_by_id: bool = True) -> list
+    Run many copeople_match queries concurrently, each distinct query is sent once.
+copeople_view_all(as_models: bool = False) -> dict
     Retrieve all existing CO People.
-copeople_view_per_co() -> dict
+copeople_view_many(coperson_ids: iterable, max_workers: int = None, strategy: str = 'auto',
+                   as_models: bool = False) -> dict
+    Retrieve the specified CO People, with parallel copeople_view_one calls or one filtered per-CO listing.
+copeople_view_per_co(as_models: bool = False) -> dict
     Retrieve all existing CO People for the specified CO.
-copeople_view_per_identifier(identifier: str, distinct_by_id: bool = True) -> dict
+copeople_view_per_identifier(identifier: str, distinct_by_id: bool = True, as_models: bool = False) -> dict
     Retrieve all existing CO People attached to the specified identifier.
     Note the specified identifier must be attached to a CO Person, not an Org Identity.
-copeople_view_one(coperson_id: int) -> dict
+copeople_view_one(coperson_id: int, as_models: bool = False) -> dict
     Retrieve an existing CO Person.
+iter_copeople_find(given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                   limit: int = 100, distinct_by_id: bool = True) -> generator
+    Search for existing CO Person records, yielding them one at a time from a streamed response.
+iter_copeople_per_co(page_size: int = 1000, prefetch: bool = True) -> generator
+    Iterate over the CO People of the specified CO one record at a time, fetched page by page.
+iter_copeople_all() -> generator
+    Iterate over all existing CO People one record at a time, parsed incrementally from a streamed response.
 """
 
 import json
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from requests.exceptions import HTTPError, RequestException
+
+from ._fanout import MapResult, _call, fanout_map
+from ._json import decode, iter_records
+from ._models import to_models
+from ._session import count, current_deadline, not_implemented, request
+
+# criteria shorter than this are ignored by the registry when matching
+MATCH_MIN_LENGTH = 3
+_MATCH_FIELDS = ['given', 'family', 'mail']
+_MAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s.]+$')
+# copeople_find criteria -> registry search parameter
+FIND_SEARCH_OPTIONS = {
+    'given': 'search.given',
+    'family': 'search.family',
+    'mail': 'search.mail',
+    'identifier': 'search.identifier'
+}
+# default maximum number of records returned by copeople_find
+DEFAULT_FIND_LIMIT = 100
+# copeople_view_many strategies: decide per call, parallel copeople_view_one calls, filtered per-CO listing
+VIEW_MANY_STRATEGY_OPTIONS = ['auto', 'one', 'listing']
+# auto: use the per-CO listing once the number of ids reaches this fraction of the estimated CO size
+VIEW_MANY_LISTING_RATIO = 0.02
+# auto without CO size estimate: use the per-CO listing from this number of ids
+VIEW_MANY_LISTING_MIN_IDS = 200
+# seconds the CO size observed on the last per-CO listing is used as estimate
+CO_SIZE_TTL = 3600
 
 
 def copeople_add(self) -> dict:
@@ -49,12 +95,9 @@ def copeople_add(self) -> dict:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        return decode(self, resp)
     else:
         resp.raise_for_status()
 
@@ -70,10 +113,7 @@ def copeople_delete(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -89,34 +129,125 @@ def copeople_edit(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
         resp.raise_for_status()
 
 
-def copeople_find(self) -> dict:
+class TooManyRecords(RequestException):
     """
-    ### NOT IMPLEMENTED ###
-    Search for existing CO Person records.
-    When too many records are found, a message may be returned rather than specific records.
+    The registry answered a search with a message rather than records because too many records matched.
+    The message is the exception text, the response is available as err.response.
+    """
+
+
+def _find_params(self, given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                 limit: int = None) -> dict:
+    params = {'coid': self._CO_API_ORG_ID}
+    for field, value in [('given', given), ('family', family), ('mail', mail), ('identifier', identifier)]:
+        if value:
+            params[FIND_SEARCH_OPTIONS.get(field)] = value
+    if len(params) == 1:
+        raise TypeError("Invalid Fields 'given', 'family', 'mail', 'identifier'")
+    if limit is not None:
+        if int(limit) < 1:
+            raise TypeError("Invalid Fields 'limit'")
+        params['limit'] = int(limit)
+    return params
+
+
+def _too_many_records(members: dict, resp) -> TooManyRecords:
+    message = members.get('Message') or members.get('message') or members.get('Error') or json.dumps(members)
+    return TooManyRecords(str(message), response=resp)
+
+
+def _iter_found(resp, limit: int = None, distinct_by_id: bool = True):
+    """
+    CO People of a streamed search response, at most limit of them.
+    """
+    if 'json' not in resp.headers.get('Content-Type', 'application/json'):
+        message = resp.text
+        resp.close()
+        raise TooManyRecords(message.strip(), response=resp)
+    head = []
+    records = iter_records(resp, 'CoPeople', head=head)
+    seen = set()
+    found = 0
+    started = False
+    try:
+        while True:
+            try:
+                coperson = next(records)
+            except StopIteration as stop:
+                if stop.value is not None:
+                    raise _too_many_records(stop.value, resp)
+                return
+            except ValueError:
+                message = b''.join(head).decode('utf-8-sig', errors='replace').strip()
+                if started or message.startswith('{'):
+                    raise
+                # a message sent with a JSON Content-Type, the body is not a JSON object
+                raise TooManyRecords(message, response=resp)
+            started = True
+            if limit is not None and found >= limit:
+                # more records than requested: the registry ignored the limit, stop the download
+                return
+            if distinct_by_id:
+                if coperson.get('Id') in seen:
+                    continue
+                seen.add(coperson.get('Id'))
+            found += 1
+            yield coperson
+    finally:
+        records.close()
+
+
+def copeople_find(self, given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                  limit: int = DEFAULT_FIND_LIMIT, distinct_by_id: bool = True) -> dict:
+    """
+    Search for existing CO Person records with the registry search parameters (search.given, search.family,
+    search.mail, search.identifier), at least one criterion is required.
+    At most limit records are returned: the limit is sent to the registry and the response is streamed,
+    so the download stops once limit records have been read even when the registry does not apply it.
+    When too many records are found, a message may be returned rather than specific records,
+    TooManyRecords is raised with that message.
 
     :param self:
+    :param given:
+    :param family:
+    :param mail:
+    :param identifier:
+    :param limit: maximum number of records to return, None for no limit
+    :param distinct_by_id:
     :return
-        501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
+        {
+          "ResponseType":"CoPeople",
+          "Version":"1.0",
+          "CoPeople":
+          [
+            {
+              "Version":"1.0",
+              "CoId":"<CoId>",
+              "Timezone":"<Timezone>",
+              "DateOfBirth":"<DateOfBirth>",
+              "Status":("Active"|"Approved"|"Confirmed"|"Declined"|"Deleted"|"Denied"|"Duplicate"|"Expired"|
+                  "GracePeriod"|"Invited"|"Locked"|"Pending"|"PendingApproval"|"PendingConfirmation"|"Suspended")
+            }
+          ]
+        }:
+
+    Response Format
+        HTTP Status             Response Body           Description
+        200 OK                  CoPerson Response       CoPerson returned (zero or more matches may be returned)
+        200 OK                  Message                 Too many records found (TooManyRecords raised)
+        401 Unauthorized                                Authentication required
+        500 Other Error                                 Unknown error
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
-    if resp.status_code == 200:
-        return json.loads(resp.text)
-    else:
-        resp.raise_for_status()
+    copeople = list(iter_copeople_find(self, given=given, family=family, mail=mail, identifier=identifier,
+                                       limit=limit, distinct_by_id=distinct_by_id))
+    return {'ResponseType': 'CoPeople', 'Version': '1.0', 'CoPeople': copeople}
 
 
 def copeople_match(self, given: str = None, family: str = None, mail: str = None, distinct_by_id: bool = True) -> dict:
@@ -163,27 +294,97 @@ def copeople_match(self, given: str = None, family: str = None, mail: str = None
         params.update({'family': family})
     if mail:
         params.update({'mail': mail})
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
         if distinct_by_id:
-            resp_dict = json.loads(resp.text)
+            resp_dict = decode(self, resp)
             distinct_copeople = list({v['Id']: v for v in resp_dict.get('CoPeople')}.values())
             resp_dict['CoPeople'] = distinct_copeople
             return resp_dict
         else:
-            return json.loads(resp.text)
+            return decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def copeople_view_all(self) -> dict:
+def _match_criteria(query) -> tuple:
+    """
+    Criteria of a copeople_match query the registry would use: stripped, dropping values of less than
+    MATCH_MIN_LENGTH characters and email addresses that are not syntactically valid.
+
+    :param query: {'given': ..., 'family': ..., 'mail': ...} or (given, family, mail)
+    :return
+        (given, family, mail) with None for ignored criteria
+    """
+    if isinstance(query, dict):
+        if any(k not in _MATCH_FIELDS for k in query.keys()):
+            raise TypeError("Invalid Fields 'queries'")
+        values = [query.get(k) for k in _MATCH_FIELDS]
+    else:
+        values = list(query)
+        if len(values) > len(_MATCH_FIELDS):
+            raise TypeError("Invalid Fields 'queries'")
+        values += [None] * (len(_MATCH_FIELDS) - len(values))
+    criteria = []
+    for field, value in zip(_MATCH_FIELDS, values):
+        value = str(value).strip() if value is not None else ''
+        if len(value) < MATCH_MIN_LENGTH or (field == 'mail' and not _MAIL_PATTERN.match(value)):
+            value = None
+        criteria.append(value)
+    return tuple(criteria)
+
+
+def copeople_match_many(self, queries, max_workers: int = None, distinct_by_id: bool = True) -> list:
+    """
+    Attempt to match existing CO Person records for many queries, running the matches concurrently over
+    the shared session. Criteria the registry would ignore (less than 3 characters, email addresses that
+    are not syntactically valid) are dropped before sending, queries left without criteria return an
+    empty match without a request, and queries with the same remaining criteria are sent once.
+
+    results = api.copeople_match_many([('Jane', 'Doe', 'jane@example.org'), {'mail': 'joe@example.org'}])
+    for r in results:
+        if r.error is None:
+            matches = r.result.get('CoPeople')
+
+    :param self:
+    :param queries: iterable of {'given': ..., 'family': ..., 'mail': ...} dicts or (given, family, mail) tuples
+    :param max_workers: number of worker threads (default: the pool_maxsize of the session)
+    :param distinct_by_id: drop duplicate CO Person records from each result
+    :return
+        list of MapResult(kwargs, result, error) in the order of queries, kwargs holding the query as
+        passed and result the copeople_match response
+    """
+    queries = list(queries)
+    criteria = [_match_criteria(query) for query in queries]
+    unique = {c: None for c in criteria if any(c)}
+    match = partial(copeople_match, self, distinct_by_id=distinct_by_id)
+    calls = (dict(zip(_MATCH_FIELDS, c)) for c in unique.keys())
+    for r in fanout_map(self, match, calls, max_workers=max_workers, ordered=False):
+        unique[tuple(r.kwargs.get(k) for k in _MATCH_FIELDS)] = r
+    results = []
+    for query, c in zip(queries, criteria):
+        r = unique.get(c)
+        if r is None:
+            result, error = {'ResponseType': 'CoPeople', 'Version': '1.0', 'CoPeople': []}, None
+        else:
+            result, error = r.result, r.error
+            if result is not None:
+                result = dict(result, CoPeople=list(result.get('CoPeople') or []))
+        results.append(MapResult(query, result, error))
+    return results
+
+
+def copeople_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO People.
 
     :param self:
+    :param as_models: return the records as CoPerson models instead of dicts
     :return
         {
           "RequestType":"CoPeople",
@@ -208,20 +409,104 @@ def copeople_view_all(self) -> dict:
         500 Other Error                                 Unknown error
     """
     url = self._CO_API_URL + '/co_people.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def copeople_view_per_co(self) -> dict:
+def co_size_estimate(self) -> int:
+    """
+    Number of CO People seen on the last per-CO listing, None when there is none or it is older than
+    CO_SIZE_TTL seconds.
+
+    :param self:
+    :return
+        int or None
+    """
+    co_size = self._co_size
+    if co_size is None or time.monotonic() - co_size[1] > CO_SIZE_TTL:
+        return None
+    return co_size[0]
+
+
+def copeople_view_many(self, coperson_ids, max_workers: int = None, strategy: str = 'auto',
+                       as_models: bool = False) -> dict:
+    """
+    Retrieve the specified CO People with the cheaper of two strategies:
+    - 'one': parallel copeople_view_one calls over the shared session (max_workers threads)
+    - 'listing': one copeople_view_per_co call filtered on the client
+    With 'auto' the listing is used when the number of ids reaches VIEW_MANY_LISTING_RATIO of the CO size
+    estimate (the size seen on the last per-CO listing), or VIEW_MANY_LISTING_MIN_IDS ids when there is
+    no estimate yet. The strategies used and their timings are reported in stats()['view_many'].
+
+    copeople = api.copeople_view_many(coperson_ids=[123, 456, 789]).get('CoPeople')
+
+    :param self:
+    :param coperson_ids: ids of the CO People to retrieve
+    :param max_workers: number of worker threads for the 'one' strategy (default: the pool_maxsize of the session)
+    :param strategy: 'auto', 'one' or 'listing'
+    :param as_models: return the records as CoPerson models instead of dicts
+    :return
+        same format as copeople_view_per_co, CO People in the order of coperson_ids (ids not found are omitted)
+    """
+    if strategy not in VIEW_MANY_STRATEGY_OPTIONS:
+        raise TypeError("Invalid Fields 'strategy'")
+    ids = list(dict.fromkeys(str(i) for i in coperson_ids))
+    estimate = co_size_estimate(self)
+    if strategy == 'auto':
+        if estimate is None:
+            listing = len(ids) >= VIEW_MANY_LISTING_MIN_IDS
+        else:
+            listing = len(ids) >= VIEW_MANY_LISTING_RATIO * estimate
+        strategy = 'listing' if listing else 'one'
+    start = time.perf_counter()
+    copeople = {}
+    if ids and strategy == 'listing':
+        wanted = set(ids)
+        for coperson in copeople_view_per_co(self).get('CoPeople') or []:
+            if str(coperson.get('Id')) in wanted:
+                copeople[str(coperson.get('Id'))] = coperson
+    elif ids:
+        view_one = partial(copeople_view_one, self)
+        for r in fanout_map(self, view_one, ({'coperson_id': i} for i in ids), max_workers=max_workers,
+                            ordered=False):
+            if r.error is not None:
+                if isinstance(r.error, HTTPError) and getattr(r.error.response, 'status_code', None) == 404:
+                    continue
+                raise r.error
+            for coperson in (r.result or {}).get('CoPeople') or []:
+                copeople[str(coperson.get('Id'))] = coperson
+    elapsed = time.perf_counter() - start
+    count(self, 'view_many_' + strategy)
+    count(self, 'view_many_' + strategy + '_ids', len(ids))
+    count(self, 'view_many_' + strategy + '_seconds', elapsed)
+    with self._stats_lock:
+        self._view_many_last = {
+            'strategy': strategy,
+            'ids': len(ids),
+            'co_size_estimate': estimate,
+            'seconds': round(elapsed, 6)
+        }
+    resp_dict = {
+        'ResponseType': 'CoPeople',
+        'Version': '1.0',
+        'CoPeople': [copeople.get(i) for i in ids if i in copeople]
+    }
+    return to_models(resp_dict) if as_models else resp_dict
+
+
+def copeople_view_per_co(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO People for the specified CO.
 
     :param self:
+    :param as_models: return the records as CoPerson models instead of dicts
     :return
         {
           "RequestType":"CoPeople",
@@ -249,17 +534,24 @@ def copeople_view_per_co(self) -> dict:
     """
     url = self._CO_API_URL + '/co_people.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
-        params=params
+        params=params,
+        revalidate=True
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        resp_dict = decode(self, resp)
+        # size estimate used by copeople_view_many
+        self._co_size = (len(resp_dict.get('CoPeople') or []), time.monotonic())
+        return to_models(resp_dict) if as_models else resp_dict
     else:
         resp.raise_for_status()
 
 
-def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = True) -> dict:
+def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = True,
+                                 as_models: bool = False) -> dict:
     """
     Retrieve all existing CO People attached to the specified identifier.
     Note the specified identifier must be attached to a CO Person, not an Org Identity.
@@ -267,6 +559,7 @@ def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = T
     :param self:
     :param identifier:
     :param distinct_by_id:
+    :param as_models: return the records as CoPerson models instead of dicts
     :return
         {
           "RequestType":"CoPeople",
@@ -293,28 +586,31 @@ def copeople_view_per_identifier(self, identifier: str, distinct_by_id: bool = T
     """
     url = self._CO_API_URL + '/co_people.json'
     params = {'coid': self._CO_API_ORG_ID, 'search.identifier': identifier}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
         if distinct_by_id:
-            resp_dict = json.loads(resp.text)
+            resp_dict = decode(self, resp)
             distinct_copeople = list({v['Id']: v for v in resp_dict.get('CoPeople')}.values())
             resp_dict['CoPeople'] = distinct_copeople
-            return resp_dict
+            return to_models(resp_dict) if as_models else resp_dict
         else:
-            return json.loads(resp.text)
+            return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def copeople_view_one(self, coperson_id: int) -> dict:
+def copeople_view_one(self, coperson_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing CO Person.
 
     :param self:
     :param coperson_id:
+    :param as_models: return the records as CoPerson models instead of dicts
     :return
         {
           "RequestType":"CoPeople",
@@ -341,11 +637,184 @@ def copeople_view_one(self, coperson_id: int) -> dict:
     """
     url = self._CO_API_URL + '/co_people/' + str(coperson_id) + '.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
+    else:
+        resp.raise_for_status()
+
+
+def _copeople_page(self, page: int, page_size: int) -> list:
+    """
+    Retrieve one page of CO People for the specified CO.
+
+    :param self:
+    :param page: page number (starts at 1)
+    :param page_size: number of records per page
+    :return
+        list of CoPerson records
+    """
+    url = self._CO_API_URL + '/co_people.json'
+    params = {'coid': self._CO_API_ORG_ID, 'limit': page_size, 'page': page}
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        params=params
+    )
+    if resp.status_code == 200:
+        return decode(self, resp).get('CoPeople', [])
+    else:
+        resp.raise_for_status()
+        return []
+
+
+def _iter_copeople_pages(self, page_size: int, prefetch: bool):
+    """
+    Generator of iter_copeople_per_co, the arguments are validated by the caller.
+    """
+    expires = current_deadline(self)
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def fetch(page: int):
+        return _copeople_page(self, page=page, page_size=page_size)
+
+    def submit(page: int):
+        if executor is None:
+            return page
+        return executor.submit(_call, self, fetch, {'page': page}, expires)
+
+    def result(pending) -> list:
+        if executor is None:
+            return fetch(pending)
+        r = pending.result()
+        if r.error is not None:
+            raise r.error
+        return r.result
+
+    page = 1
+    first_page_ids = None
+    previous_first_id = None
+    pending = submit(page)
+    try:
+        while True:
+            records = result(pending)
+            pending = None
+            if not records:
+                return
+            first_id = records[0].get('Id')
+            if page > 1 and first_id == previous_first_id:
+                # page parameter ignored, fall back to the full listing for the records not yielded yet
+                for record in copeople_view_per_co(self).get('CoPeople', []):
+                    if record.get('Id') not in first_page_ids:
+                        yield record
+                return
+            last_page = len(records) != page_size
+            if not last_page:
+                pending = submit(page + 1)
+            if page == 1:
+                first_page_ids = {record.get('Id') for record in records}
+            yield from records
+            if last_page:
+                return
+            previous_first_id = first_id
+            page += 1
+    finally:
+        if executor is not None:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=True)
+
+
+def iter_copeople_per_co(self, page_size: int = 1000, prefetch: bool = True):
+    """
+    Iterate over the CO People of the specified CO one record at a time, fetched page by page with the
+    registry limit/page parameters. With prefetch the next page is requested in the background while the
+    caller processes the current one.
+
+    Registries that ignore paging are detected: a page larger than page_size is the full listing and is
+    yielded as is, a page that repeats the previous one ends paging and the remaining records are taken
+    from copeople_view_per_co().
+
+    for coperson in api.iter_copeople_per_co(page_size=500):
+        ...
+
+    :param self:
+    :param page_size: number of records per request
+    :param prefetch: request the next page while the current one is being consumed
+    :return
+        generator of CoPerson records (same format as the "CoPeople" items of copeople_view_per_co)
+    """
+    if int(page_size) < 1:
+        raise TypeError("Invalid Fields 'page_size'")
+    page_size = int(page_size)
+    return _iter_copeople_pages(self, page_size=page_size, prefetch=prefetch)
+
+
+def iter_copeople_all(self):
+    """
+    Iterate over all existing CO People one record at a time. The response is streamed and parsed
+    incrementally, records are yielded as they arrive and the full listing is never held in memory.
+    Streamed requests bypass the response cache, coalescing and revalidation.
+
+    for record in api.iter_copeople_all():
+        ...
+
+    :param self:
+    :return
+        generator of CoPeople records (same format as the "CoPeople" items of copeople_view_all)
+    """
+    url = self._CO_API_URL + '/co_people.json'
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        stream=True
+    )
+    if resp.status_code == 200:
+        return iter_records(resp, 'CoPeople')
+    else:
+        resp.close()
+        resp.raise_for_status()
+        return iter([])
+
+
+def iter_copeople_find(self, given: str = None, family: str = None, mail: str = None, identifier: str = None,
+                       limit: int = DEFAULT_FIND_LIMIT, distinct_by_id: bool = True):
+    """
+    Search for existing CO Person records (see copeople_find), yielding them one at a time as the streamed
+    response is parsed. Closing the generator early stops the download, e.g. for search-as-you-type.
+
+    for coperson in api.iter_copeople_find(family='Doe', limit=20):
+        ...
+
+    :param self:
+    :param given:
+    :param family:
+    :param mail:
+    :param identifier:
+    :param limit: maximum number of records to yield, None for no limit
+    :param distinct_by_id:
+    :return
+        generator of CoPerson records (raises TooManyRecords when the registry returns a message instead)
+    """
+    url = self._CO_API_URL + '/co_people.json'
+    params = _find_params(self, given=given, family=family, mail=mail, identifier=identifier, limit=limit)
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        params=params,
+        stream=True
+    )
+    if resp.status_code == 200:
+        return _iter_found(resp, limit=params.get('limit'), distinct_by_id=distinct_by_id)
     else:
+        resp.close()
         resp.raise_for_status()
+        return iter([])
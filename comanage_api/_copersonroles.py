@@ -7,22 +7,168 @@ Methods
 -------
 coperson_roles_add(coperson_id: int, cou_id: int, status: str = None, affiliation: str = None) -> dict
     Add a new CO Person Role.
+coperson_roles_add_many(items: iterable, max_workers: int = None, rate_limit: float = None,
+                        prefetch: str = 'auto') -> dict
+    Add many CO Person Roles concurrently, skipping CO Person / COU pairs that already hold a role.
 coperson_roles_delete(coperson_role_id: int) -> bool
     Remove a CO Person Role.
 coperson_roles_edit(coperson_role_id: int, coperson_id: int = None, cou_id: int = None, status: str = None,
-                   affiliation: str = None) -> bool
-    Edit an existing CO Person Role.
-coperson_roles_view_all() -> dict
+                   affiliation: str = None, coperson_role: dict = None, verify: bool = False) -> bool
+    Edit an existing CO Person Role, based on a role snapshot or the cached role when available (no GET).
+coperson_roles_view_all(as_models: bool = False) -> dict
     Retrieve all existing CO Person Roles.
-coperson_roles_view_per_coperson(coperson_id: int) -> dict
+coperson_roles_view_per_coperson(coperson_id: int, as_models: bool = False) -> dict
     Retrieve all existing CO Person Roles for the specified CO Person. Available since Registry v2.0.0.
-coperson_roles_view_per_cou(cou_id: int) -> dict
+coperson_roles_view_per_cou(cou_id: int, as_models: bool = False) -> dict
     Retrieve all existing CO Person Roles for the specified COU.
-coperson_roles_view_one(coperson_role_id: int) -> dict
+coperson_roles_view_one(coperson_role_id: int, as_models: bool = False) -> dict
     Retrieve an existing CO Person Role.
 """
 
 import json
+import time
+from functools import partial
+
+from requests.exceptions import RequestException
+
+from ._cache import cache_invalidate, cache_peek
+from ._fanout import RateLimiter, fanout_map
+from ._json import decode
+from ._models import to_models
+from ._session import count, notify_write, request
+
+# existing roles looked up by coperson_roles_add_many: per COU, per CO Person or whichever needs fewer listings
+ADD_MANY_PREFETCH_OPTIONS = ['auto', 'cou', 'coperson']
+
+
+class RoleConflict(RequestException):
+    """
+    A CO Person Role was changed since the snapshot an edit was based on (its Revision/Modified differ).
+    """
+
+
+def _coperson_roles_post_body(self, coperson_id: int, cou_id: int, status: str = None, affiliation: str = None,
+                              coperson_role: dict = None) -> str:
+    """
+    Build the CoPersonRoles request body. Unspecified fields are taken from the existing coperson_role record
+    when one is provided (edit), otherwise they are set to their defaults (add).
+
+    :param self:
+    :param coperson_id:
+    :param cou_id:
+    :param status:
+    :param affiliation:
+    :param coperson_role: existing CoPersonRole record
+    :return
+        JSON encoded request body
+    """
+    post_body = {
+        'RequestType': 'CoPersonRoles',
+        'Version': '1.0',
+        'CoPersonRoles': [
+            {
+                'Version': '1.0',
+                'Person':
+                    {
+                        'Type': 'CO'
+                    },
+                'O': str(self._CO_API_ORG_NAME)
+            }
+        ]
+    }
+    if coperson_id or coperson_role is None:
+        post_body['CoPersonRoles'][0]['Person']['Id'] = str(coperson_id)
+    else:
+        post_body['CoPersonRoles'][0]['Person']['Id'] = str(coperson_role.get('Person').get('Id'))
+    if cou_id or coperson_role is None:
+        post_body['CoPersonRoles'][0]['CouId'] = str(cou_id)
+    else:
+        post_body['CoPersonRoles'][0]['CouId'] = str(coperson_role.get('CouId'))
+    if status:
+        if status not in self.STATUS_OPTIONS:
+            raise TypeError("Invalid Fields 'status'")
+        post_body['CoPersonRoles'][0]['Status'] = str(status)
+    elif coperson_role is not None:
+        post_body['CoPersonRoles'][0]['Status'] = coperson_role.get('Status')
+    else:
+        post_body['CoPersonRoles'][0]['Status'] = 'Active'
+    if affiliation:
+        affiliation = str(affiliation).lower()
+        if affiliation not in self.AFFILIATION_OPTIONS:
+            raise TypeError("Invalid Fields 'affiliation'")
+        post_body['CoPersonRoles'][0]['Affiliation'] = str(affiliation)
+    elif coperson_role is not None:
+        post_body['CoPersonRoles'][0]['Affiliation'] = coperson_role.get('Affiliation')
+    else:
+        post_body['CoPersonRoles'][0]['Affiliation'] = 'member'
+    return json.dumps(post_body)
+
+
+def _invalidate_coperson_role(self, coperson_role_id, coperson_role: dict = None):
+    """
+    Drop cached CoPersonRoles responses affected by a write to coperson_role_id: the role itself, the
+    listings of its CO Person and COU, and unfiltered listings. When the role record is not known every
+    per CO Person and per COU listing is dropped.
+
+    :param self:
+    :param coperson_role_id:
+    :param coperson_role: CoPersonRole record (or None when unknown)
+    """
+    if coperson_role:
+        cache_invalidate(self, 'co_person_roles', id=coperson_role_id,
+                         copersonid=coperson_role.get('Person', {}).get('Id'), couid=coperson_role.get('CouId'))
+    else:
+        cache_invalidate(self, 'co_person_roles', id=coperson_role_id)
+
+
+def _role_record(coperson_role_id, coperson_role) -> dict:
+    """
+    CoPersonRole record of a snapshot given as a record dict or a CoPersonRole model.
+    """
+    if hasattr(coperson_role, 'to_dict'):
+        coperson_role = coperson_role.to_dict()
+    if not isinstance(coperson_role, dict) or not isinstance(coperson_role.get('Person'), dict) or \
+            str(coperson_role.get('Id', coperson_role_id)) != str(coperson_role_id):
+        raise TypeError("Invalid Fields 'coperson_role'")
+    return coperson_role
+
+
+def _role_version(coperson_role: dict) -> tuple:
+    """
+    Revision/Modified of a CoPersonRole record, None when it carries neither.
+    """
+    if coperson_role.get('Revision') is None and coperson_role.get('Modified') is None:
+        return None
+    return str(coperson_role.get('Revision')), str(coperson_role.get('Modified'))
+
+
+def _role_revision(coperson_role: dict) -> int:
+    """
+    Revision of a CoPersonRole record as a number, None when it has none.
+    """
+    try:
+        return int(coperson_role.get('Revision'))
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_role_version(self, coperson_role_id, snapshot: dict, current: dict, fresh: bool = True) -> bool:
+    """
+    Raise RoleConflict when current is known to be a newer state of the role than snapshot: a role just
+    fetched from the registry (fresh) with a different Revision/Modified, or a cached role with a higher
+    Revision. A cached role that differs without being newer is stale, True is returned so that it is dropped.
+    """
+    expected = _role_version(snapshot)
+    found = _role_version(current)
+    if expected is None or found is None or expected == found:
+        return False
+    if not fresh:
+        revision, cached_revision = _role_revision(snapshot), _role_revision(current)
+        if revision is None or cached_revision is None or cached_revision <= revision:
+            return True
+    count(self, 'roles_edit_conflicts')
+    raise RoleConflict("CoPersonRole '{0}' was modified: Revision/Modified {1} expected, {2} found".format(
+        coperson_role_id, '/'.join(expected), '/'.join(found)))
 
 
 def coperson_roles_add(self, coperson_id: int, cou_id: int, status: str = None, affiliation: str = None) -> dict:
@@ -85,47 +231,157 @@ def coperson_roles_add(self, coperson_id: int, cou_id: int, status: str = None,
         403 COU Does Not Exist                                      The specified COU does not exist
         500 Other Error                                             Unknown error
     """
-    post_body = {
-        'RequestType': 'CoPersonRoles',
-        'Version': '1.0',
-        'CoPersonRoles': [
-            {
-                'Version': '1.0',
-                'Person':
-                    {
-                        'Type': 'CO',
-                        'Id': str(coperson_id)
-                    },
-                'CouId': str(cou_id),
-                'O': str(self._CO_API_ORG_NAME)
-            }
-        ]
-    }
-    if status:
-        if status not in self.STATUS_OPTIONS:
-            raise TypeError("Invalid Fields 'status'")
-        post_body['CoPersonRoles'][0]['Status'] = str(status)
-    else:
-        post_body['CoPersonRoles'][0]['Status'] = 'Active'
-    if affiliation:
-        affiliation = str(affiliation).lower()
-        if affiliation not in self.AFFILIATION_OPTIONS:
-            raise TypeError("Invalid Fields 'affiliation'")
-        post_body['CoPersonRoles'][0]['Affiliation'] = str(affiliation)
-    else:
-        post_body['CoPersonRoles'][0]['Affiliation'] = 'member'
-    post_body = json.dumps(post_body)
+    post_body = _coperson_roles_post_body(self, coperson_id=coperson_id, cou_id=cou_id, status=status,
+                                          affiliation=affiliation)
     url = self._CO_API_URL + '/co_person_roles.json'
-    resp = self._s.post(
+    resp = request(
+        self,
+        method='POST',
         url=url,
         data=post_body
     )
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        resp_dict = decode(self, resp)
+        coperson_role = json.loads(post_body).get('CoPersonRoles')[0]
+        _invalidate_coperson_role(self, resp_dict.get('Id'), coperson_role)
+        notify_write(self, 'co_person_roles', 'add', resp_dict.get('Id'), dict(coperson_role, Id=resp_dict.get('Id')))
+        return resp_dict
     else:
         resp.raise_for_status()
 
 
+def _role_item(item) -> dict:
+    """
+    Keyword arguments of coperson_roles_add for a (coperson_id, cou_id, status, affiliation) tuple or dict.
+    """
+    if not isinstance(item, dict):
+        item = list(item)
+        if not 2 <= len(item) <= 4:
+            raise TypeError("Invalid Fields 'items'")
+        item = dict(zip(['coperson_id', 'cou_id', 'status', 'affiliation'], item))
+    if item.get('coperson_id') is None or item.get('cou_id') is None or \
+            set(item) - {'coperson_id', 'cou_id', 'status', 'affiliation'}:
+        raise TypeError("Invalid Fields 'items'")
+    return {'coperson_id': item.get('coperson_id'), 'cou_id': item.get('cou_id'), 'status': item.get('status'),
+            'affiliation': item.get('affiliation')}
+
+
+def coperson_roles_add_many(self, items, max_workers: int = None, rate_limit: float = None,
+                            prefetch: str = 'auto') -> dict:
+    """
+    Add many CO Person Roles, skipping CO Person / COU pairs that already hold a role so that a batch can
+    be run again after a partial failure without creating duplicates.
+
+    The existing roles are listed first, concurrently, with coperson_roles_view_per_cou for each COU of the
+    batch or coperson_roles_view_per_coperson for each CO Person (prefetch='auto' picks the one needing
+    fewer listings). A pair holding a role in any status is reported as "exists", a pair repeated within
+    the batch as "duplicate". The remaining roles are added with concurrent coperson_roles_add calls, at
+    most rate_limit POSTs per second. Items whose listing failed are not added and are reported as "failed".
+
+    report = api.coperson_roles_add_many([(123, 45, 'Active', 'member'), (124, 45, None, None)], rate_limit=10)
+    failed = [item for item in report.get('items') if item.get('outcome') == 'failed']
+
+    :param self:
+    :param items: (coperson_id, cou_id[, status[, affiliation]]) tuples or dicts with these keys
+    :param max_workers: number of worker threads (default: the pool_maxsize of the session)
+    :param rate_limit: maximum number of POSTs per second (default: no limit)
+    :param prefetch: 'auto', 'cou' or 'coperson'
+    :return
+        {
+            "items":
+            [
+                {
+                    "coperson_id": <coperson_id>,
+                    "cou_id": <cou_id>,
+                    "status": <status or None>,
+                    "affiliation": <affiliation or None>,
+                    "outcome": ("added"|"exists"|"duplicate"|"failed"),
+                    "id": <id of the added or existing CoPersonRole>,
+                    "existing_status": <Status of the existing CoPersonRole>,
+                    "error": <exception or None>,
+                    "seconds": <time of the POST>
+                }, ...
+            ],
+            "added": <roles added>,
+            "exists": <pairs already holding a role>,
+            "duplicate": <pairs repeated in items>,
+            "failed": <items not added>,
+            "prefetch": {"by": ("cou"|"coperson"), "calls": <listings>, "seconds": <listing time>},
+            "seconds": <total time>
+        }:
+    """
+    if prefetch not in ADD_MANY_PREFETCH_OPTIONS:
+        raise TypeError("Invalid Fields 'prefetch'")
+    start = time.perf_counter()
+    items = [_role_item(item) for item in items]
+    for item in items:
+        # invalid status or affiliation fails the batch before anything is sent
+        _coperson_roles_post_body(self, **item)
+    report = [dict(item, coperson_id=str(item.get('coperson_id')), cou_id=str(item.get('cou_id')), outcome=None,
+                   id=None, existing_status=None, error=None, seconds=None) for item in items]
+    # existing roles, per COU or per CO Person
+    cou_ids = sorted({entry.get('cou_id') for entry in report})
+    coperson_ids = sorted({entry.get('coperson_id') for entry in report})
+    if prefetch == 'auto':
+        prefetch = 'cou' if len(cou_ids) <= len(coperson_ids) else 'coperson'
+    if prefetch == 'cou':
+        group, keys, listing = 'cou_id', cou_ids, partial(coperson_roles_view_per_cou, self)
+    else:
+        group, keys, listing = 'coperson_id', coperson_ids, partial(coperson_roles_view_per_coperson, self)
+    existing = {}
+    unknown = {}
+    prefetch_start = time.perf_counter()
+    for r in fanout_map(self, listing, ({group: key} for key in keys), max_workers=max_workers, ordered=False):
+        if r.error is not None:
+            unknown[r.kwargs.get(group)] = r.error
+            continue
+        for role in (r.result or {}).get('CoPersonRoles') or []:
+            pair = (str((role.get('Person') or {}).get('Id')), str(role.get('CouId')))
+            existing.setdefault(pair, role)
+    prefetch_seconds = time.perf_counter() - prefetch_start
+    pending = []
+    seen = set()
+    for index, entry in enumerate(report):
+        pair = (entry.get('coperson_id'), entry.get('cou_id'))
+        if entry.get(group) in unknown:
+            entry.update(outcome='failed', error=unknown.get(entry.get(group)))
+        elif pair in existing:
+            entry.update(outcome='exists', id=existing.get(pair).get('Id'),
+                         existing_status=existing.get(pair).get('Status'))
+        elif pair in seen:
+            entry.update(outcome='duplicate')
+        else:
+            seen.add(pair)
+            pending.append(index)
+    limiter = RateLimiter(rate_limit)
+
+    def add(index: int) -> dict:
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            return coperson_roles_add(self, **items[index])
+        finally:
+            report[index]['seconds'] = round(time.perf_counter() - started, 6)
+
+    for r in fanout_map(self, add, ({'index': index} for index in pending), max_workers=max_workers,
+                        ordered=False):
+        entry = report[r.kwargs.get('index')]
+        if r.error is not None:
+            entry.update(outcome='failed', error=r.error)
+        else:
+            entry.update(outcome='added', id=(r.result or {}).get('Id'))
+    outcomes = [entry.get('outcome') for entry in report]
+    return {
+        'items': report,
+        'added': outcomes.count('added'),
+        'exists': outcomes.count('exists'),
+        'duplicate': outcomes.count('duplicate'),
+        'failed': outcomes.count('failed'),
+        'prefetch': {'by': prefetch, 'calls': len(keys), 'seconds': round(prefetch_seconds, 6)},
+        'seconds': round(time.perf_counter() - start, 6)
+    }
+
+
 def coperson_roles_delete(self, coperson_role_id: int) -> bool:
     """
     Remove a CO Person Role.
@@ -143,26 +399,43 @@ def coperson_roles_delete(self, coperson_role_id: int) -> bool:
         500 Other Error                                 Unknown error
     """
     url = self._CO_API_URL + '/co_person_roles/' + str(coperson_role_id) + '.json'
-    resp = self._s.delete(
+    # role record from the cache (if any) to only invalidate the listings of its CO Person and COU
+    coperson_role = cache_peek(self, url=url)
+    if coperson_role:
+        coperson_role = coperson_role.get('CoPersonRoles')[0]
+    resp = request(
+        self,
+        method='DELETE',
         url=url
     )
     if resp.status_code == 200:
+        _invalidate_coperson_role(self, coperson_role_id, coperson_role)
+        notify_write(self, 'co_person_roles', 'delete', coperson_role_id, coperson_role)
         return True
     else:
         resp.raise_for_status()
 
 
 def coperson_roles_edit(self, coperson_role_id: int, coperson_id: int = None, cou_id: int = None, status: str = None,
-                       affiliation: str = None) -> bool:
+                       affiliation: str = None, coperson_role=None, verify: bool = False) -> bool:
     """
     Edit an existing CO Person Role.
 
+    Unspecified fields are taken from the current role record: the coperson_role snapshot when the caller
+    has one (e.g. from coperson_roles_view_per_cou), else the cached role, else a coperson_roles_view_one
+    request. A snapshot is checked against the latest known state of the role and RoleConflict is raised
+    without writing when that state is newer: with verify a fresh GET whose Revision/Modified differ, else a
+    cached role with a higher Revision. A cached role older than the snapshot is dropped from the cache.
+    GETs sent and avoided are reported in stats()['roles_edit'].
+
     :param self:
     :param coperson_role_id:
     :param affiliation:
     :param coperson_id:
     :param cou_id:
     :param status:
+    :param coperson_role: CoPersonRole record (dict or CoPersonRole model) the edit is based on
+    :param verify: fetch the role to check the snapshot (or the cached role) against the registry
 
     :return:
 
@@ -209,60 +482,47 @@ def coperson_roles_edit(self, coperson_role_id: int, coperson_id: int = None, co
         404 CoPersonRole Unknown                                        id not found
         500 Other Error                                                 Unknown error
     """
-    coperson_role = coperson_roles_view_one(self, coperson_role_id)
-    post_body = {
-        'RequestType': 'CoPersonRoles',
-        'Version': '1.0',
-        'CoPersonRoles': [
-            {
-                'Version': '1.0',
-                'Person':
-                    {
-                        'Type': 'CO'
-                    },
-                'O': str(self._CO_API_ORG_NAME)
-            }
-        ]
-    }
-    if coperson_id:
-        post_body['CoPersonRoles'][0]['Person']['Id'] = str(coperson_id)
-    else:
-        post_body['CoPersonRoles'][0]['Person']['Id'] = str(
-            coperson_role.get('CoPersonRoles')[0].get('Person').get('Id'))
-    if cou_id:
-        post_body['CoPersonRoles'][0]['CouId'] = str(cou_id)
-    else:
-        post_body['CoPersonRoles'][0]['CouId'] = str(coperson_role.get('CoPersonRoles')[0].get('CouId'))
-    if status:
-        if status not in self.STATUS_OPTIONS:
-            raise TypeError("Invalid Fields 'status'")
-        post_body['CoPersonRoles'][0]['Status'] = str(status)
-    else:
-        post_body['CoPersonRoles'][0]['Status'] = coperson_role.get('CoPersonRoles')[0].get('Status')
-    if affiliation:
-        affiliation = str(affiliation).lower()
-        if affiliation not in self.AFFILIATION_OPTIONS:
-            raise TypeError("Invalid Fields 'affiliation'")
-        post_body['CoPersonRoles'][0]['Affiliation'] = str(affiliation)
-    else:
-        post_body['CoPersonRoles'][0]['Affiliation'] = coperson_role.get('CoPersonRoles')[0].get('Affiliation')
-    post_body = json.dumps(post_body)
     url = self._CO_API_URL + '/co_person_roles/' + str(coperson_role_id) + '.json'
-    resp = self._s.put(
+    cached = (cache_peek(self, url=url) or {}).get('CoPersonRoles') or [None]
+    snapshot = cached[0] if coperson_role is None else _role_record(coperson_role_id, coperson_role)
+    current = cached[0]
+    if verify or snapshot is None:
+        if current is not None:
+            # drop the cached role (and the listings holding it) so that the registry is asked
+            _invalidate_coperson_role(self, coperson_role_id, current)
+        current = coperson_roles_view_one(self, coperson_role_id).get('CoPersonRoles')[0]
+        count(self, 'roles_edit_gets')
+    else:
+        count(self, 'roles_edit_gets_avoided')
+    if snapshot is None:
+        snapshot = current
+    elif current is not None and _check_role_version(self, coperson_role_id, snapshot, current, fresh=verify):
+        # the snapshot (e.g. a listing row fetched since) is newer than the cached role
+        _invalidate_coperson_role(self, coperson_role_id, current)
+    post_body = _coperson_roles_post_body(self, coperson_id=coperson_id, cou_id=cou_id, status=status,
+                                          affiliation=affiliation, coperson_role=snapshot)
+    resp = request(
+        self,
+        method='PUT',
         url=url,
         data=post_body
     )
     if resp.status_code == 200:
+        coperson_role = json.loads(post_body).get('CoPersonRoles')[0]
+        _invalidate_coperson_role(self, coperson_role_id, snapshot)
+        _invalidate_coperson_role(self, coperson_role_id, coperson_role)
+        notify_write(self, 'co_person_roles', 'edit', coperson_role_id, dict(coperson_role, Id=str(coperson_role_id)))
         return True
     else:
         resp.raise_for_status()
 
 
-def coperson_roles_view_all(self) -> dict:
+def coperson_roles_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO Person Roles.
 
     :param self:
+    :param as_models: return the records as CoPersonRole models instead of dicts
     :return
         {
           "ResponseType":"CoPersonRoles",
@@ -305,21 +565,25 @@ def coperson_roles_view_all(self) -> dict:
         500 Other Error                                             Unknown error
     """
     url = self._CO_API_URL + '/co_person_roles.json'
-    resp = self._s.get(
-        url=url
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        revalidate=True
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def coperson_roles_view_per_coperson(self, coperson_id: int) -> dict:
+def coperson_roles_view_per_coperson(self, coperson_id: int, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO Person Roles for the specified CO Person. Available since Registry v2.0.0.
 
     :param self:
     :param coperson_id:
+    :param as_models: return the records as CoPersonRole models instead of dicts
     :return
         {
           "ResponseType":"CoPersonRoles",
@@ -364,22 +628,25 @@ def coperson_roles_view_per_coperson(self, coperson_id: int) -> dict:
     """
     url = self._CO_API_URL + '/co_person_roles.json'
     params = {'copersonid': int(coperson_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def coperson_roles_view_per_cou(self, cou_id: int) -> dict:
+def coperson_roles_view_per_cou(self, cou_id: int, as_models: bool = False) -> dict:
     """
     Retrieve all existing CO Person Roles for the specified COU.
 
     :param self:
     :param cou_id:
+    :param as_models: return the records as CoPersonRole models instead of dicts
     :return
         {
           "ResponseType":"CoPersonRoles",
@@ -424,22 +691,25 @@ def coperson_roles_view_per_cou(self, cou_id: int) -> dict:
     """
     url = self._CO_API_URL + '/co_person_roles.json'
     params = {'couid': int(cou_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def coperson_roles_view_one(self, coperson_role_id: int) -> dict:
+def coperson_roles_view_one(self, coperson_role_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing CO Person Role.
 
     :param self:
     :param coperson_role_id:
+    :param as_models: return the records as CoPersonRole models instead of dicts
     :return
         {
           "ResponseType":"CoPersonRoles",
@@ -483,10 +753,12 @@ def coperson_roles_view_one(self, coperson_role_id: int) -> dict:
         500 Other Error                                                 Unknown error
     """
     url = self._CO_API_URL + '/co_person_roles/' + str(coperson_role_id) + '.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
@@ -11,16 +11,63 @@ cous_delete(cou_id: int) -> bool
     Remove a Cou.
 cous_edit(cou_id: int, name: str = None, description: str = None, parent_id: int = None) -> bool
     Edit an existing Cou.
-cous_view_all() -> dict
+cous_view_all(as_models: bool = False) -> dict
     Retrieve all existing Cous.
-cous_view_per_co() -> dict
+cous_view_per_co(as_models: bool = False) -> dict
     Retrieve Cou attached to a CO.
-cous_view_one(cou_id: int) -> dict
+cous_view_one(cou_id: int, as_models: bool = False) -> dict
     Retrieve an existing Cou.
 """
 
 import json
 
+from ._cache import cache_invalidate
+from ._json import decode
+from ._models import to_models
+from ._session import notify_write, request
+
+
+def _cous_post_body(self, name: str, description: str, parent_id: int = None, cou: dict = None) -> str:
+    """
+    Build the Cous request body. Unspecified fields are taken from the existing cou record when one is
+    provided (edit), in which case parent_id=0 resets the parent of the COU.
+
+    :param self:
+    :param name:
+    :param description:
+    :param parent_id:
+    :param cou: existing Cou record
+    :return
+        JSON encoded request body
+    """
+    post_body = {
+        'RequestType': 'Cous',
+        'Version': '1.0',
+        'Cous':
+            [
+                {
+                    'Version': '1.0',
+                    'CoId': self._CO_API_ORG_ID
+                }
+            ]
+    }
+    if name or cou is None:
+        post_body['Cous'][0]['Name'] = str(name)
+    else:
+        post_body['Cous'][0]['Name'] = cou.get('Name')
+    if description or cou is None:
+        post_body['Cous'][0]['Description'] = str(description)
+    else:
+        post_body['Cous'][0]['Description'] = cou.get('Description')
+    if parent_id:
+        post_body['Cous'][0]['ParentId'] = str(parent_id)
+    elif cou is not None:
+        if cou.get('ParentId'):
+            post_body['Cous'][0]['ParentId'] = str(cou.get('ParentId'))
+        if str(parent_id) == '0':
+            post_body['Cous'][0]['ParentId'] = ''
+    return json.dumps(post_body)
+
 
 def cous_add(self, name: str, description: str, parent_id: int = None) -> dict:
     """
@@ -69,29 +116,20 @@ def cous_add(self, name: str, description: str, parent_id: int = None) -> dict:
         403 Wrong CO                                                Parent/Child COU not member of same CO
         500 Other Error                                             Unknown error
     """
-    post_body = {
-        'RequestType': 'Cous',
-        'Version': '1.0',
-        'Cous':
-            [
-                {
-                    'Version': '1.0',
-                    'CoId': self._CO_API_ORG_ID,
-                    'Name': str(name),
-                    'Description': str(description)
-                }
-            ]
-    }
-    if parent_id:
-        post_body['Cous'][0]['ParentId'] = str(parent_id)
-    post_body = json.dumps(post_body)
+    post_body = _cous_post_body(self, name=name, description=description, parent_id=parent_id)
     url = self._CO_API_URL + '/cous.json'
-    resp = self._s.post(
+    resp = request(
+        self,
+        method='POST',
         url=url,
         data=post_body
     )
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        resp_dict = decode(self, resp)
+        cache_invalidate(self, 'cous', id=resp_dict.get('Id'))
+        notify_write(self, 'cous', 'add', resp_dict.get('Id'), dict(json.loads(post_body).get('Cous')[0],
+                                                                     Id=resp_dict.get('Id')))
+        return resp_dict
     else:
         resp.raise_for_status()
 
@@ -116,11 +154,15 @@ def cous_delete(self, cou_id: int) -> bool:
     """
     url = self._CO_API_URL + '/cous/' + str(cou_id) + '.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.delete(
+    resp = request(
+        self,
+        method='DELETE',
         url=url,
         params=params
     )
     if resp.status_code == 200:
+        cache_invalidate(self, 'cous', id=cou_id)
+        notify_write(self, 'cous', 'delete', cou_id)
         return True
     else:
         resp.raise_for_status()
@@ -174,49 +216,29 @@ def cous_edit(self, cou_id: int, name: str = None, description: str = None, pare
         500 Other Error                                             Unknown error
     """
     cou = cous_view_one(self, cou_id)
-    post_body = {
-        'RequestType': 'Cous',
-        'Version': '1.0',
-        'Cous':
-            [
-                {
-                    'Version': '1.0',
-                    'CoId': self._CO_API_ORG_ID
-                }
-            ]
-    }
-    if name:
-        post_body['Cous'][0]['Name'] = str(name)
-    else:
-        post_body['Cous'][0]['Name'] = cou.get('Cous')[0].get('Name')
-    if description:
-        post_body['Cous'][0]['Description'] = str(description)
-    else:
-        post_body['Cous'][0]['Description'] = cou.get('Cous')[0].get('Description')
-    if parent_id:
-        post_body['Cous'][0]['ParentId'] = str(parent_id)
-    else:
-        if cou.get('Cous')[0].get('ParentId'):
-            post_body['Cous'][0]['ParentId'] = str(cou.get('Cous')[0].get('ParentId'))
-        if str(parent_id) == '0':
-            post_body['Cous'][0]['ParentId'] = ''
-    post_body = json.dumps(post_body)
+    post_body = _cous_post_body(self, name=name, description=description, parent_id=parent_id,
+                                cou=cou.get('Cous')[0])
     url = self._CO_API_URL + '/cous/' + str(cou_id) + '.json'
-    resp = self._s.put(
+    resp = request(
+        self,
+        method='PUT',
         url=url,
         data=post_body
     )
     if resp.status_code == 200:
+        cache_invalidate(self, 'cous', id=cou_id)
+        notify_write(self, 'cous', 'edit', cou_id, dict(json.loads(post_body).get('Cous')[0], Id=str(cou_id)))
         return True
     else:
         resp.raise_for_status()
 
 
-def cous_view_all(self) -> dict:
+def cous_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing Cous.
 
     :param self:
+    :param as_models: return the records as Cou models instead of dicts
     :return
     {
         "ResponseType":"Cous",
@@ -249,20 +271,23 @@ def cous_view_all(self) -> dict:
         500 Other Error                         Unknown error
     """
     url = self._CO_API_URL + '/cous.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def cous_view_per_co(self) -> dict:
+def cous_view_per_co(self, as_models: bool = False) -> dict:
     """
     Retrieve Cou attached to a CO.
 
     :param self:
+    :param as_models: return the records as Cou models instead of dicts
     :return
     {
         "ResponseType":"Cous",
@@ -297,22 +322,25 @@ def cous_view_per_co(self) -> dict:
     """
     url = self._CO_API_URL + '/cous.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def cous_view_one(self, cou_id: int) -> dict:
+def cous_view_one(self, cou_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing Cou.
 
     :param self:
     :param cou_id:
+    :param as_models: return the records as Cou models instead of dicts
     :return
     {
         "ResponseType":"Cous",
@@ -344,11 +372,13 @@ def cous_view_one(self, cou_id: int) -> dict:
     """
     url = self._CO_API_URL + '/cous/' + str(cou_id) + '.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
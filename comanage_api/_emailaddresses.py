@@ -14,15 +14,19 @@ email_addresses_delete() -> bool
 email_addresses_edit() -> bool
     ### NOT IMPLEMENTED ###
     Edit an existing EmailAddress.
-email_addresses_view_all() -> dict
+email_addresses_view_all(as_models: bool = False) -> dict
     Retrieve all existing EmailAddresses.
-email_addresses_view_per_person(person_type: str, person_id: int) -> dict
+email_addresses_view_per_person(person_type: str, person_id: int, as_models: bool = False) -> dict
     Retrieve EmailAddresses attached to a CO Department, CO Person, or Org Identity.
-email_addresses_view_one(email_address_id: int) -> dict
+email_addresses_view_one(email_address_id: int, as_models: bool = False) -> dict
     Retrieve an existing EmailAddress.
+iter_email_addresses_all() -> generator
+    Iterate over all existing Email Addresses one record at a time, parsed incrementally from a streamed response.
 """
 
-import json
+from ._json import decode, iter_records
+from ._models import to_models
+from ._session import not_implemented, request
 
 
 def email_addresses_add(self) -> dict:
@@ -34,12 +38,9 @@ def email_addresses_add(self) -> dict:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        return decode(self, resp)
     else:
         resp.raise_for_status()
 
@@ -53,10 +54,7 @@ def email_addresses_delete(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -72,21 +70,19 @@ def email_addresses_edit(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
         resp.raise_for_status()
 
 
-def email_addresses_view_all(self) -> dict:
+def email_addresses_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing EmailAddresses.
 
     :param self:
+    :param as_models: return the records as EmailAddress models instead of dicts
     :return
         {
             "ResponseType":"EmailAddresses",
@@ -119,22 +115,25 @@ def email_addresses_view_all(self) -> dict:
         500 Other Error                             Unknown error
     """
     url = self._CO_API_URL + '/email_addresses.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def email_addresses_view_per_person(self, person_type: str, person_id: int) -> dict:
+def email_addresses_view_per_person(self, person_type: str, person_id: int, as_models: bool = False) -> dict:
     """
     Retrieve EmailAddresses attached to a CO Department, CO Person, or Org Identity.
 
     :param self:
     :param person_type:
     :param person_id:
+    :param as_models: return the records as EmailAddress models instead of dicts
     :return
         {
             "ResponseType":"EmailAddresses",
@@ -186,22 +185,25 @@ def email_addresses_view_per_person(self, person_type: str, person_id: int) -> d
         raise TypeError("Invalid Fields 'person_type'")
     url = self._CO_API_URL + '/email_addresses.json'
     params = {str(person_type): str(person_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def email_addresses_view_one(self, email_address_id: int) -> dict:
+def email_addresses_view_one(self, email_address_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing EmailAddress.
 
     :param self:
     :param emailaddress_id:
+    :param as_models: return the records as EmailAddress models instead of dicts
     :return
         {
             "ResponseType":"EmailAddresses",
@@ -234,10 +236,40 @@ def email_addresses_view_one(self, email_address_id: int) -> dict:
         500 Other Error                                         Unknown error
     """
     url = self._CO_API_URL + '/email_addresses/' + str(email_address_id) + '.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
+    else:
+        resp.raise_for_status()
+
+
+def iter_email_addresses_all(self):
+    """
+    Iterate over all existing Email Addresses one record at a time. The response is streamed and parsed
+    incrementally, records are yielded as they arrive and the full listing is never held in memory.
+    Streamed requests bypass the response cache, coalescing and revalidation.
+
+    for record in api.iter_email_addresses_all():
+        ...
+
+    :param self:
+    :return
+        generator of EmailAddresses records (same format as the "EmailAddresses" items of email_addresses_view_all)
+    """
+    url = self._CO_API_URL + '/email_addresses.json'
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        stream=True
+    )
+    if resp.status_code == 200:
+        return iter_records(resp, 'EmailAddresses')
     else:
+        resp.close()
         resp.raise_for_status()
+        return iter([])
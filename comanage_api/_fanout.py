@@ -0,0 +1,133 @@
+# comanage_api/_fanout.py
+
+"""
+Fan-out - run many calls of a ComanageApi method concurrently over the shared session
+
+Methods
+-------
+fanout_map(method: str | callable, iterable_of_kwargs: iterable, max_workers: int = None,
+           ordered: bool = True) -> generator
+    Run method once per kwargs dict on a bounded thread pool, yielding a MapResult per call.
+RateLimiter(rate: float)
+    Space calls made from any number of threads at most 1 / rate seconds apart.
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ._session import current_deadline
+
+# result of one call: kwargs passed to the method, the value it returned (or None) and the exception raised (or None)
+MapResult = namedtuple('MapResult', ['kwargs', 'result', 'error'])
+
+
+class RateLimiter(object):
+    """
+    Thread-safe limiter spacing calls at most 1 / rate seconds apart, shared by the workers of a batch.
+
+    limiter = RateLimiter(rate=10)
+    limiter.acquire()  # blocks until the next slot
+
+    Attributes
+    ----------
+    rate: float
+        Maximum number of calls per second, None for no limit
+    """
+
+    def __init__(self, rate: float = None):
+        if rate is not None and float(rate) <= 0:
+            raise TypeError("Invalid Fields 'rate'")
+        self.interval = 1.0 / float(rate) if rate is not None else 0.0
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+        self.waited = 0.0
+
+    def acquire(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+            self.waited += slot - now
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _call(self, method, kwargs: dict, expires) -> MapResult:
+    """
+    Call method(**kwargs) in a worker thread under the deadline of the submitting thread.
+
+    :param self:
+    :param method:
+    :param kwargs:
+    :param expires: deadline of the submitting thread
+    :return
+        MapResult
+    """
+    previous = getattr(self._local, 'deadline', None)
+    self._local.deadline = expires
+    try:
+        return MapResult(kwargs, method(**kwargs), None)
+    except Exception as err:
+        return MapResult(kwargs, None, err)
+    finally:
+        self._local.deadline = previous
+
+
+def fanout_map(self, method, iterable_of_kwargs, max_workers: int = None, ordered: bool = True):
+    """
+    Run method once per kwargs dict on a bounded thread pool over the shared session.
+
+    A failed call does not stop the batch, it is yielded as a MapResult with the exception in 'error'.
+    Inputs are consumed lazily, at most 2 * max_workers calls are queued at any time. A deadline set
+    with api.deadline() in the calling thread applies to every call.
+
+    for r in api.map('copeople_view_one', ({'coperson_id': i} for i in ids), max_workers=8):
+        if r.error is None:
+            ...
+
+    :param self:
+    :param method: name of a ComanageApi method (e.g. 'copeople_view_one') or a callable
+    :param iterable_of_kwargs: keyword arguments for each call
+    :param max_workers: number of worker threads (default: the pool_maxsize of the session)
+    :param ordered: yield results in input order (True) or as they finish (False)
+    :return
+        generator of MapResult(kwargs, result, error)
+    """
+    if isinstance(method, str):
+        if method.startswith('_') or not callable(getattr(self, method, None)):
+            raise TypeError("Invalid Fields 'method'")
+        method = getattr(self, method)
+    if max_workers is None:
+        max_workers = self._pool_adapter._pool_maxsize
+    if int(max_workers) < 1:
+        raise TypeError("Invalid Fields 'max_workers'")
+    max_workers = int(max_workers)
+    expires = current_deadline(self)
+    kwargs_iter = iter(iterable_of_kwargs)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < 2 * max_workers:
+                try:
+                    kwargs = dict(next(kwargs_iter))
+                except StopIteration:
+                    break
+                pending.append(executor.submit(_call, self, method, kwargs, expires))
+            if not pending:
+                return
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
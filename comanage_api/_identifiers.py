@@ -17,15 +17,19 @@ identifiers_delete() -> bool
 identifiers_edit() -> bool
     ### NOT IMPLEMENTED ###
     Edit an existing Identifier.
-identifiers_view_all() -> dict
+identifiers_view_all(as_models: bool = False) -> dict
     Retrieve all existing Identifiers.
-identifiers_view_per_entity(entity_type: str, entity_id: int) -> dict
+identifiers_view_per_entity(entity_type: str, entity_id: int, as_models: bool = False) -> dict
     Retrieve Identifiers attached to a CO Department, Co Group, CO Person, or Org Identity.
-identifiers_view_one(identifier_id: int) -> dict
+identifiers_view_one(identifier_id: int, as_models: bool = False) -> dict
     Retrieve an existing Identifier.
+iter_identifiers_all() -> generator
+    Iterate over all existing Identifiers one record at a time, parsed incrementally from a streamed response.
 """
 
-import json
+from ._json import decode, iter_records
+from ._models import to_models
+from ._session import not_implemented, request
 
 
 def identifiers_add(self) -> dict:
@@ -37,12 +41,9 @@ def identifiers_add(self) -> dict:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        return decode(self, resp)
     else:
         resp.raise_for_status()
 
@@ -56,10 +57,7 @@ def identifiers_assign(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -75,10 +73,7 @@ def identifiers_delete(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -94,21 +89,19 @@ def identifiers_edit(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
         resp.raise_for_status()
 
 
-def identifiers_view_all(self) -> dict:
+def identifiers_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing Identifiers.
 
     :param self:
+    :param as_models: return the records as Identifier models instead of dicts
     :return
         {
           "ResponseType":"Identifiers",
@@ -138,22 +131,25 @@ def identifiers_view_all(self) -> dict:
         500 Other Error                             Unknown error
     """
     url = self._CO_API_URL + '/identifiers.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def identifiers_view_per_entity(self, entity_type: str, entity_id: int) -> dict:
+def identifiers_view_per_entity(self, entity_type: str, entity_id: int, as_models: bool = False) -> dict:
     """
     Retrieve Identifiers attached to a CO Department, Co Group, CO Person, or Org Identity.
 
     :param self:
     :param entity_type:
     :param entity_id:
+    :param as_models: return the records as Identifier models instead of dicts
     :return
         {
           "ResponseType":"Identifiers",
@@ -205,22 +201,25 @@ def identifiers_view_per_entity(self, entity_type: str, entity_id: int) -> dict:
         raise TypeError("Invalid Fields 'entity_type'")
     url = self._CO_API_URL + '/identifiers.json'
     params = {str(entity_type): str(entity_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def identifiers_view_one(self, identifier_id: int) -> dict:
+def identifiers_view_one(self, identifier_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing Identifier.
 
     :param self:
     :param identifier_id:
+    :param as_models: return the records as Identifier models instead of dicts
     :return
         {
           "ResponseType":"Identifiers",
@@ -251,10 +250,40 @@ def identifiers_view_one(self, identifier_id: int) -> dict:
         500 Other Error                                     Unknown error
     """
     url = self._CO_API_URL + '/identifiers/' + str(identifier_id) + '.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
+    else:
+        resp.raise_for_status()
+
+
+def iter_identifiers_all(self):
+    """
+    Iterate over all existing Identifiers one record at a time. The response is streamed and parsed
+    incrementally, records are yielded as they arrive and the full listing is never held in memory.
+    Streamed requests bypass the response cache, coalescing and revalidation.
+
+    for record in api.iter_identifiers_all():
+        ...
+
+    :param self:
+    :return
+        generator of Identifiers records (same format as the "Identifiers" items of identifiers_view_all)
+    """
+    url = self._CO_API_URL + '/identifiers.json'
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        stream=True
+    )
+    if resp.status_code == 200:
+        return iter_records(resp, 'Identifiers')
     else:
+        resp.close()
         resp.raise_for_status()
+        return iter([])
@@ -0,0 +1,286 @@
+# comanage_api/_journal.py
+
+"""
+Journal - crash-resumable bulk writes recorded in an append-only JSON lines file (write-ahead log)
+
+Every item of a batch is identified by a key derived from its operation and arguments. Before an item is
+sent, an "intent" line is appended to the journal and flushed to disk; once the registry has answered, a
+"done" or "failed" line follows. Running the same batch again with the same journal skips the items already
+done without sending anything to the registry, and only checks the registry for the items left in doubt by
+the previous run: intent written and outcome missing, or a failure after which the write may have been
+applied (no HTTP answer, or a 5xx answer to a POST).
+
+Methods
+-------
+bulk_write(operations: iterable, journal: str, max_workers: int = None, rate_limit: float = None,
+           fsync: bool = True) -> dict
+    Run role and SSH key writes, journaling each intent and outcome and resuming a previous run.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from requests.exceptions import HTTPError
+
+from ._copersonroles import coperson_roles_add, coperson_roles_delete, coperson_roles_edit, \
+    coperson_roles_view_per_coperson
+from ._fanout import RateLimiter, fanout_map
+from ._sshkeys import ssh_keys_add, ssh_keys_delete, ssh_keys_view_per_coperson
+
+# operations that can be journaled
+JOURNAL_OPERATIONS = {
+    'coperson_roles_add': coperson_roles_add,
+    'coperson_roles_edit': coperson_roles_edit,
+    'coperson_roles_delete': coperson_roles_delete,
+    'ssh_keys_add': ssh_keys_add,
+    'ssh_keys_delete': ssh_keys_delete
+}
+
+
+class _Journal(object):
+    """
+    Append-only JSON lines file, one record per line, written under a lock by the workers of a batch.
+    """
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = None
+        # the last line was cut short by a crash, the next record starts on a new line
+        self._truncated = False
+
+    def load(self) -> dict:
+        """
+        Last record of every key in the journal, a line truncated by a crash is ignored.
+        """
+        records = {}
+        if not os.path.exists(self.path):
+            return records
+        with open(self.path, 'r') as f:
+            for line in f:
+                self._truncated = not line.endswith('\n')
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get('key') is not None:
+                    records[record.get('key')] = record
+        return records
+
+    def append(self, record: dict):
+        line = json.dumps(record, sort_keys=True, default=str) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a')
+                if self._truncated:
+                    self._file.write('\n')
+                    self._truncated = False
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _operation_item(item) -> dict:
+    """
+    {"operation", "kwargs", "key"} of a (operation, kwargs) tuple or a dict with these keys.
+    """
+    if isinstance(item, (tuple, list)) and len(item) == 2:
+        item = {'operation': item[0], 'kwargs': item[1]}
+    if not isinstance(item, dict) or item.get('operation') not in JOURNAL_OPERATIONS or \
+            not isinstance(item.get('kwargs'), dict):
+        raise TypeError("Invalid Fields 'operations'")
+    kwargs = {}
+    for name, value in item.get('kwargs').items():
+        # snapshots passed as models are journaled in their JSON form
+        kwargs[name] = value.to_dict() if hasattr(value, 'to_dict') else value
+    return {'operation': item.get('operation'), 'kwargs': kwargs, 'key': item.get('key')}
+
+
+def _item_keys(items: list) -> list:
+    """
+    Key of every item: the given key, or a digest of the operation and its arguments numbered by
+    occurrence, so that identical items of a batch are journaled separately.
+    """
+    keys = []
+    seen = {}
+    for item in items:
+        if item.get('key') is not None:
+            keys.append(str(item.get('key')))
+            continue
+        digest = hashlib.sha1(json.dumps([item.get('operation'), item.get('kwargs')], sort_keys=True,
+                                         default=str).encode()).hexdigest()
+        seen[digest] = seen.get(digest, 0) + 1
+        keys.append('{0}:{1}'.format(digest, seen.get(digest)))
+    return keys
+
+
+def _recover(self, operation: str, kwargs: dict):
+    """
+    Outcome of an item whose request may have reached the registry before the previous run stopped:
+    (True, result) when the registry shows the write, (False, None) when it has to be sent again.
+    """
+    if operation == 'coperson_roles_add':
+        roles = coperson_roles_view_per_coperson(self, coperson_id=kwargs.get('coperson_id'))
+        for role in (roles or {}).get('CoPersonRoles') or []:
+            if str(role.get('CouId')) == str(kwargs.get('cou_id')):
+                return True, {'Id': role.get('Id')}
+    elif operation == 'ssh_keys_add':
+        sshkeys = ssh_keys_view_per_coperson(self, coperson_id=kwargs.get('coperson_id'))
+        for sshkey in (sshkeys or {}).get('SshKeys') or []:
+            if sshkey.get('Skey') == str(kwargs.get('ssh_key')):
+                return True, {'Id': sshkey.get('Id')}
+    return False, None
+
+
+def _in_doubt(operation: str, record: dict) -> bool:
+    """
+    Whether the write of an item may have been applied by the run that journaled record.
+    """
+    if record.get('event') == 'intent':
+        return True
+    if record.get('event') != 'failed':
+        return False
+    if record.get('error_class') != 'HTTPError':
+        # timeout, connection dropped after the request was sent, or journaled without the error class
+        return True
+    # the registry may have created the record before failing
+    return operation.endswith('_add') and (record.get('status') or 0) >= 500
+
+
+def _send(self, operation: str, kwargs: dict, in_doubt: bool):
+    """
+    Send one item, returning (recovered, result).
+    """
+    if in_doubt:
+        recovered, result = _recover(self, operation, kwargs)
+        if recovered:
+            return True, result
+        if operation == 'coperson_roles_edit':
+            # the snapshot predates the edit that may have been applied, the role is read again
+            kwargs = dict(kwargs, coperson_role=None, verify=False)
+    try:
+        return False, JOURNAL_OPERATIONS.get(operation)(self, **kwargs)
+    except HTTPError as err:
+        if in_doubt and operation.endswith('_delete') and err.response is not None and \
+                err.response.status_code == 404:
+            # deleted by the interrupted run
+            return True, True
+        raise
+
+
+def bulk_write(self, operations, journal: str, max_workers: int = None, rate_limit: float = None,
+               fsync: bool = True) -> dict:
+    """
+    Run coperson_roles_add, coperson_roles_edit, coperson_roles_delete, ssh_keys_add and ssh_keys_delete
+    calls concurrently, recording each intent and outcome in journal (JSON lines, appended to). The intent
+    of an item is flushed (and fsync'ed) before its request is sent.
+
+    When the journal holds a previous run of the batch, items recorded as done are skipped without any
+    request ("journaled") and items that failed with an HTTP error answer are sent again. Items left in
+    doubt, with an intent but no outcome or a failure after which the write may have been applied (no HTTP
+    answer, e.g. a timeout or a dropped connection, or a 5xx answer to an add), are checked against the
+    registry first: an added role (same CO Person and COU) or SSH key (same key) is taken as done, a delete
+    answered with 404 as done, an edit is sent again based on the current role. Only these in-doubt items
+    are read back from the registry.
+
+    operations = [('coperson_roles_add', {'coperson_id': 123, 'cou_id': 45, 'status': 'Active'}),
+                  ('ssh_keys_delete', {'ssh_key_id': 678})]
+    report = api.bulk_write(operations, journal='/var/tmp/roles-batch.jsonl', max_workers=8)
+    print(report.get('resumed_at'), report.get('journaled'), report.get('failed'))
+
+    :param self:
+    :param operations: (operation, kwargs) tuples or {"operation", "kwargs"[, "key"]} dicts, kwargs as for
+                       the method of the same name
+    :param journal: path of the journal file, created when missing
+    :param max_workers: number of worker threads (default: the pool_maxsize of the session)
+    :param rate_limit: maximum number of writes per second (default: no limit)
+    :param fsync: fsync the journal after each record (durable across a machine crash, not only a process
+                  crash)
+    :return
+        {
+            "items":
+            [
+                {
+                    "key": <journal key>,
+                    "operation": <operation>,
+                    "outcome": ("done"|"journaled"|"recovered"|"failed"),
+                    "result": <method result, or the journaled one>,
+                    "error": <exception or None>,
+                    "seconds": <time of the write>
+                }, ...
+            ],
+            "done": <items written by this run>,
+            "journaled": <items already done in the journal>,
+            "recovered": <in-doubt items found written in the registry>,
+            "failed": <items that failed>,
+            "resumed_at": <position of the first item not done in the journal>,
+            "seconds": <total time>
+        }:
+    """
+    start = time.perf_counter()
+    items = [_operation_item(item) for item in operations]
+    keys = _item_keys(items)
+    log = _Journal(journal, fsync=fsync)
+    previous = log.load()
+    report = [{'key': key, 'operation': item.get('operation'), 'outcome': None, 'result': None, 'error': None,
+               'seconds': None} for key, item in zip(keys, items)]
+    pending = []
+    for position, entry in enumerate(report):
+        record = previous.get(entry.get('key')) or {}
+        if record.get('event') == 'done':
+            entry.update(outcome='journaled', result=record.get('result'))
+        else:
+            pending.append(position)
+    limiter = RateLimiter(rate_limit)
+
+    def write(position: int):
+        item, entry = items[position], report[position]
+        in_doubt = _in_doubt(item.get('operation'), previous.get(entry.get('key')) or {})
+        log.append({'event': 'intent', 'key': entry.get('key'), 'operation': item.get('operation'),
+                    'kwargs': item.get('kwargs'), 'time': time.time()})
+        limiter.acquire()
+        started = time.perf_counter()
+        try:
+            recovered, result = _send(self, item.get('operation'), item.get('kwargs'), in_doubt)
+        except Exception as err:
+            response = getattr(err, 'response', None)
+            log.append({'event': 'failed', 'key': entry.get('key'), 'error': repr(err),
+                        'error_class': type(err).__name__,
+                        'status': response.status_code if response is not None else None, 'time': time.time()})
+            raise
+        finally:
+            entry['seconds'] = round(time.perf_counter() - started, 6)
+        log.append({'event': 'done', 'key': entry.get('key'), 'result': result, 'time': time.time()})
+        return recovered, result
+
+    try:
+        for r in fanout_map(self, write, ({'position': position} for position in pending),
+                            max_workers=max_workers, ordered=False):
+            entry = report[r.kwargs.get('position')]
+            if r.error is not None:
+                entry.update(outcome='failed', error=r.error)
+            else:
+                entry.update(outcome='recovered' if r.result[0] else 'done', result=r.result[1])
+    finally:
+        log.close()
+    outcomes = [entry.get('outcome') for entry in report]
+    return {
+        'items': report,
+        'done': outcomes.count('done'),
+        'journaled': outcomes.count('journaled'),
+        'recovered': outcomes.count('recovered'),
+        'failed': outcomes.count('failed'),
+        'resumed_at': pending[0] if pending else len(report),
+        'seconds': round(time.perf_counter() - start, 6)
+    }
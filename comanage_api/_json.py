@@ -0,0 +1,235 @@
+# comanage_api/_json.py
+
+"""
+JSON - decoding of registry response bodies
+
+Bodies are parsed straight from the response bytes (resp.content), skipping the bytes-to-text round trip
+and charset detection of resp.text and the second copy of the body it keeps alive. The parser defaults to
+orjson when it is installed, otherwise the standard library json module; any callable taking bytes can be
+plugged in with the json_loads client option.
+
+Methods
+-------
+default_json_loads() -> callable
+    Fastest available JSON parser (orjson.loads or json.loads).
+decode(resp: Response) -> dict
+    Decode the JSON body of a response with the client parser.
+iter_json_array(chunks: iterable, key: str) -> generator
+    Incrementally parse the array stored under key in a JSON object read chunk by chunk.
+iter_records(resp: Response, key: str) -> generator
+    Yield the records of a streamed registry response one at a time.
+"""
+
+import codecs
+import json
+import re
+
+from requests import Response
+
+# bytes read from a streamed response per chunk
+STREAM_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+_default_json_loads = None
+
+
+def default_json_loads():
+    """
+    Fastest available JSON parser: orjson.loads when orjson is installed, json.loads otherwise.
+    Resolved on first use so that importing the package does not import orjson.
+
+    :return
+        callable(bytes) -> object
+    """
+    global _default_json_loads
+    if _default_json_loads is None:
+        try:
+            import orjson
+            _default_json_loads = orjson.loads
+        except ImportError:
+            _default_json_loads = json.loads
+    return _default_json_loads
+
+
+def decode(self, resp: Response) -> dict:
+    """
+    Decode the JSON body of a response with the client parser, directly from the response bytes.
+
+    :param self:
+    :param resp:
+    :return
+        decoded body
+    """
+    json_loads = self._json_loads
+    if json_loads is None:
+        json_loads = self._json_loads = default_json_loads()
+    return json_loads(resp.content)
+
+
+class _JsonStream(object):
+    """
+    Text buffer over an iterable of byte chunks, holding only the part of the document not parsed yet.
+    """
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder('utf-8-sig')()
+        self._decoder = json.JSONDecoder()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Append the next chunk to the buffer, dropping the parsed part.
+
+        :return
+            False at the end of the document
+        """
+        if self.eof:
+            return False
+        try:
+            text = self._text.decode(next(self._chunks))
+        except StopIteration:
+            text = self._text.decode(b'', final=True)
+            self.eof = True
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def next_char(self) -> str:
+        """
+        Consume and return the next non-whitespace character ('' at the end of the document).
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                self.pos += 1
+                return self.buf[self.pos - 1]
+            if not self.fill():
+                return ''
+
+    def peek_char(self) -> str:
+        char = self.next_char()
+        if char:
+            self.pos -= 1
+        return char
+
+    def expect(self, char: str):
+        found = self.next_char()
+        if found != char:
+            raise ValueError("Invalid JSON: expected '{0}', found '{1}'".format(char, found))
+
+    def value(self):
+        """
+        Consume and return the next complete JSON value, reading more chunks as needed.
+        """
+        self.peek_char()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+            except ValueError:
+                if not self.fill():
+                    raise
+                continue
+            # a number ending the buffer may continue in the next chunk
+            if end == len(self.buf) and isinstance(obj, (int, float)) and not isinstance(obj, bool) \
+                    and self.fill():
+                continue
+            self.pos = end
+            return obj
+
+    def items(self):
+        """
+        Yield the elements of the non-empty array whose '[' has just been consumed, up to its ']'.
+        """
+        raw_decode = self._decoder.raw_decode
+        skip = _WHITESPACE.match
+        while True:
+            buf = self.buf
+            try:
+                obj, end = raw_decode(buf, skip(buf, self.pos).end())
+                end = skip(buf, end).end()
+                char = buf[end]
+            except (ValueError, IndexError):
+                # element or separator continues in the next chunk
+                obj = self.value()
+                char = self.next_char()
+            else:
+                self.pos = end + 1
+            yield obj
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError("Invalid JSON: expected ',' or ']', found '{0}'".format(char))
+
+
+def iter_json_array(chunks, key: str):
+    """
+    Incrementally parse the array stored under key in a JSON object, yielding its elements one at a time.
+    Only the current element and the unparsed part of the last chunk are held in memory; members of the
+    object before the array are parsed and discarded, parsing stops at the end of the array.
+
+    :param chunks: iterable of bytes (UTF-8)
+    :param key: name of the array member, e.g. 'CoPeople'
+    :return
+        generator of array elements, returning (StopIteration value) the other members of the object when
+        it has no key array (e.g. a message returned instead of records), None otherwise
+    """
+    stream = _JsonStream(chunks)
+    members = {}
+    stream.expect('{')
+    if stream.peek_char() == '}':
+        return members
+    while True:
+        name = stream.value()
+        stream.expect(':')
+        if name == key and stream.peek_char() == '[':
+            stream.expect('[')
+            if stream.peek_char() == ']':
+                return
+            yield from stream.items()
+            return None
+        members[name] = stream.value()
+        char = stream.next_char()
+        if char == '}':
+            return members
+        if char != ',':
+            raise ValueError("Invalid JSON: expected ',' or '}}', found '{0}'".format(char))
+
+
+def _first_chunk(chunks, head: list):
+    """
+    Pass chunks through, appending the first one to head.
+    """
+    for chunk in chunks:
+        if not head:
+            head.append(chunk)
+        yield chunk
+
+
+def iter_records(resp: Response, key: str, chunk_size: int = STREAM_CHUNK_SIZE, head: list = None):
+    """
+    Yield the records of a streamed registry response (request(..., stream=True)) one at a time.
+    Records are parsed with the standard library json module, the json_loads client option does not
+    apply to streamed responses. The response is closed when the generator is exhausted or closed.
+
+    :param resp: streamed response
+    :param key: name of the records array, e.g. 'CoPeople', 'Names', 'SshKeys'
+    :param chunk_size: bytes read per chunk
+    :param head: list the first chunk of the body is appended to, e.g. to report a body that is not JSON
+    :return
+        generator of records, returning the other members of the body when it has no key array
+        (see iter_json_array)
+    """
+    chunks = resp.iter_content(chunk_size=chunk_size)
+    if head is not None:
+        chunks = _first_chunk(chunks, head)
+    try:
+        members = yield from iter_json_array(chunks, key)
+        # read the rest of the body so the connection is returned to the pool
+        for _ in chunks:
+            pass
+        return members
+    finally:
+        resp.close()
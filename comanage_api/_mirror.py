@@ -0,0 +1,266 @@
+# comanage_api/_mirror.py
+
+"""
+RegistryMirror - local SQLite mirror of the CO for read-heavy tools
+
+CO People, CO Person Roles, COUs, Identifiers, Email Addresses and SSH Keys are loaded into SQLite tables
+indexed on person id, COU id, identifier value, email address and key fingerprint. A refresh compares the
+Modified/Revision fields of each record with the mirrored row and only writes rows that were added,
+changed or removed. Collections fetched with conditional requests (conditional_get client option) are not
+compared at all when their fingerprint has not changed since the previous refresh.
+
+Methods
+-------
+refresh(tables: list = None) -> dict
+    Bring the mirrored tables up to date with the registry.
+coperson(coperson_id: int) -> dict
+    CO Person record, None when not mirrored.
+copeople_per_identifier(identifier: str) -> list
+    CO People attached to an identifier.
+copeople_per_email(mail: str) -> list
+    CO People attached to an email address (case insensitive).
+roles_per_coperson(coperson_id: int) -> list
+    CO Person Roles of a CO Person.
+roles_per_cou(cou_id: int) -> list
+    CO Person Roles in a COU.
+ssh_keys_per_coperson(coperson_id: int) -> list
+    SSH Keys of a CO Person.
+ssh_keys_per_fingerprint(fingerprint: str) -> list
+    SSH Keys with an OpenSSH SHA256 fingerprint.
+query(sql: str, params: tuple = ()) -> list
+    Run a read-only SQL query against the mirror.
+"""
+
+import hashlib
+import json
+import threading
+import time
+
+from ._sshkeys import ssh_key_fingerprint
+
+# mirrored tables, in refresh order
+MIRROR_TABLE_OPTIONS = ['co_people', 'coperson_roles', 'cous', 'identifiers', 'email_addresses', 'ssh_keys']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS co_people (
+    id TEXT PRIMARY KEY, co_id TEXT, status TEXT, version TEXT, data TEXT);
+CREATE TABLE IF NOT EXISTS coperson_roles (
+    id TEXT PRIMARY KEY, coperson_id TEXT, cou_id TEXT, status TEXT, affiliation TEXT, version TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS coperson_roles_coperson_id ON coperson_roles (coperson_id);
+CREATE INDEX IF NOT EXISTS coperson_roles_cou_id ON coperson_roles (cou_id);
+CREATE TABLE IF NOT EXISTS cous (
+    id TEXT PRIMARY KEY, co_id TEXT, parent_id TEXT, name TEXT, version TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS cous_parent_id ON cous (parent_id);
+CREATE TABLE IF NOT EXISTS identifiers (
+    id TEXT PRIMARY KEY, identifier TEXT, type TEXT, person_type TEXT, person_id TEXT, status TEXT,
+    version TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS identifiers_identifier ON identifiers (identifier);
+CREATE INDEX IF NOT EXISTS identifiers_person ON identifiers (person_type, person_id);
+CREATE TABLE IF NOT EXISTS email_addresses (
+    id TEXT PRIMARY KEY, mail TEXT COLLATE NOCASE, type TEXT, person_type TEXT, person_id TEXT, version TEXT,
+    data TEXT);
+CREATE INDEX IF NOT EXISTS email_addresses_mail ON email_addresses (mail);
+CREATE INDEX IF NOT EXISTS email_addresses_person ON email_addresses (person_type, person_id);
+CREATE TABLE IF NOT EXISTS ssh_keys (
+    id TEXT PRIMARY KEY, coperson_id TEXT, type TEXT, fingerprint TEXT, version TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS ssh_keys_coperson_id ON ssh_keys (coperson_id);
+CREATE INDEX IF NOT EXISTS ssh_keys_fingerprint ON ssh_keys (fingerprint);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    name TEXT PRIMARY KEY, fingerprint TEXT, refreshed REAL);
+"""
+
+# table -> (ComanageApi method, records key or None for a record iterator, fetched with conditional requests)
+_MIRROR_SOURCES = {
+    'co_people': ('copeople_view_per_co', 'CoPeople', True),
+    'coperson_roles': ('coperson_roles_view_all', 'CoPersonRoles', True),
+    'cous': ('cous_view_per_co', 'Cous', False),
+    'identifiers': ('iter_identifiers_all', None, False),
+    'email_addresses': ('iter_email_addresses_all', None, False),
+    'ssh_keys': ('ssh_keys_view_all', 'SshKeys', True)
+}
+
+
+def _person(record: dict) -> tuple:
+    person = record.get('Person') or {}
+    person_id = person.get('Id', person.get('ID'))
+    return person.get('Type'), str(person_id) if person_id is not None else None
+
+
+def _str(value):
+    return str(value) if value is not None else None
+
+
+def _columns(table: str, record: dict) -> tuple:
+    """
+    Indexed column values of a record (without id, version and data).
+    """
+    if table == 'co_people':
+        return _str(record.get('CoId')), record.get('Status')
+    if table == 'coperson_roles':
+        return _person(record)[1], _str(record.get('CouId')), record.get('Status'), record.get('Affiliation')
+    if table == 'cous':
+        return _str(record.get('CoId')), _str(record.get('ParentId')), record.get('Name')
+    if table == 'identifiers':
+        return (record.get('Identifier'), record.get('Type')) + _person(record) + (record.get('Status'),)
+    if table == 'email_addresses':
+        return (record.get('Mail'), record.get('Type')) + _person(record)
+    if table == 'ssh_keys':
+        return _person(record)[1], record.get('Type'), ssh_key_fingerprint(record.get('Skey'))
+    raise TypeError("Invalid Fields 'table'")
+
+
+def _version(record: dict) -> str:
+    """
+    Modified/Revision of a record, a hash of its content when it carries neither.
+    """
+    if record.get('Modified') is not None or record.get('Revision') is not None:
+        return '{0}|{1}'.format(record.get('Modified'), record.get('Revision'))
+    return 'sha1:' + hashlib.sha1(json.dumps(record, sort_keys=True).encode()).hexdigest()
+
+
+class RegistryMirror(object):
+    """
+    Local SQLite mirror of the CO with incremental refresh.
+
+    mirror = RegistryMirror(api, path='registry.sqlite')
+    mirror.refresh()
+    roles = mirror.roles_per_cou(cou_id=45)
+
+    Attributes
+    ----------
+    api: ComanageApi
+        Client used to refresh the mirror (required)
+    path: str = ':memory:'
+        SQLite database file, kept between runs so that refreshes stay incremental (optional)
+    """
+
+    def __init__(self, api, path: str = ':memory:'):
+        self.api = api
+        self.path = path
+        import sqlite3
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _fetch(self, table: str) -> tuple:
+        """
+        Records of table from the registry and the fingerprint of the collection (None when unknown).
+        """
+        method, key, revalidated = _MIRROR_SOURCES.get(table)
+        resp = getattr(self.api, method)()
+        if key is None:
+            return resp, None
+        fingerprint = self.api.collection_fingerprint(method) if revalidated else None
+        return (resp or {}).get(key) or [], fingerprint
+
+    def _refresh_table(self, table: str) -> dict:
+        start = time.perf_counter()
+        records, fingerprint = self._fetch(table)
+        report = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'skipped': False}
+        with self._lock, self._conn:
+            state = self._conn.execute('SELECT fingerprint FROM mirror_state WHERE name = ?', (table,)).fetchone()
+            if fingerprint is not None and state is not None and state[0] == fingerprint:
+                report['skipped'] = True
+                report['unchanged'] = self._conn.execute('SELECT COUNT(*) FROM ' + table).fetchone()[0]
+            else:
+                existing = dict(self._conn.execute('SELECT id, version FROM ' + table))
+                rows = []
+                for record in records:
+                    record_id = _str(record.get('Id'))
+                    if record_id is None:
+                        continue
+                    version = _version(record)
+                    previous = existing.pop(record_id, None)
+                    if previous == version:
+                        report['unchanged'] += 1
+                        continue
+                    report['inserted' if previous is None else 'updated'] += 1
+                    rows.append((record_id,) + _columns(table, record) + (version, json.dumps(record)))
+                if rows:
+                    placeholders = ', '.join('?' * len(rows[0]))
+                    self._conn.executemany(
+                        'INSERT OR REPLACE INTO {0} VALUES ({1})'.format(table, placeholders), rows)
+                if existing:
+                    self._conn.executemany('DELETE FROM {0} WHERE id = ?'.format(table),
+                                           [(record_id,) for record_id in existing.keys()])
+                report['deleted'] = len(existing)
+            self._conn.execute('INSERT OR REPLACE INTO mirror_state VALUES (?, ?, ?)',
+                               (table, fingerprint, time.time()))
+        report['seconds'] = round(time.perf_counter() - start, 3)
+        return report
+
+    def refresh(self, tables: list = None) -> dict:
+        """
+        Bring the mirrored tables up to date with the registry, writing only rows that were added,
+        changed (different Modified/Revision) or removed.
+
+        :param tables: subset of MIRROR_TABLE_OPTIONS (default: all)
+        :return
+            {
+                "<table>":
+                {
+                    "inserted": <rows added>,
+                    "updated": <rows rewritten>,
+                    "deleted": <rows removed>,
+                    "unchanged": <rows left as is>,
+                    "skipped": <collection fingerprint unchanged, records not compared>,
+                    "seconds": <refresh time>
+                }, ...
+            }:
+        """
+        tables = MIRROR_TABLE_OPTIONS if tables is None else list(tables)
+        if any(table not in MIRROR_TABLE_OPTIONS for table in tables):
+            raise TypeError("Invalid Fields 'tables'")
+        return {table: self._refresh_table(table) for table in tables}
+
+    def _records(self, sql: str, params: tuple) -> list:
+        with self._lock:
+            return [json.loads(row[0]) for row in self._conn.execute(sql, params)]
+
+    def coperson(self, coperson_id: int) -> dict:
+        records = self._records('SELECT data FROM co_people WHERE id = ?', (str(coperson_id),))
+        return records[0] if records else None
+
+    def copeople_per_identifier(self, identifier: str) -> list:
+        return self._records(
+            'SELECT DISTINCT p.data FROM identifiers i JOIN co_people p ON p.id = i.person_id '
+            "WHERE i.identifier = ? AND i.person_type = 'CO'", (str(identifier),))
+
+    def copeople_per_email(self, mail: str) -> list:
+        return self._records(
+            'SELECT DISTINCT p.data FROM email_addresses e JOIN co_people p ON p.id = e.person_id '
+            "WHERE e.mail = ? AND e.person_type = 'CO'", (str(mail),))
+
+    def roles_per_coperson(self, coperson_id: int) -> list:
+        return self._records('SELECT data FROM coperson_roles WHERE coperson_id = ?', (str(coperson_id),))
+
+    def roles_per_cou(self, cou_id: int) -> list:
+        return self._records('SELECT data FROM coperson_roles WHERE cou_id = ?', (str(cou_id),))
+
+    def ssh_keys_per_coperson(self, coperson_id: int) -> list:
+        return self._records('SELECT data FROM ssh_keys WHERE coperson_id = ?', (str(coperson_id),))
+
+    def ssh_keys_per_fingerprint(self, fingerprint: str) -> list:
+        return self._records('SELECT data FROM ssh_keys WHERE fingerprint = ?', (str(fingerprint),))
+
+    def query(self, sql: str, params: tuple = ()) -> list:
+        """
+        Run a read-only SQL query against the mirror, e.g.
+        mirror.query('SELECT cou_id, COUNT(*) FROM coperson_roles WHERE status = ? GROUP BY cou_id', ('Active',))
+
+        :param sql:
+        :param params:
+        :return
+            list of row tuples
+        """
+        with self._lock:
+            self._conn.execute('PRAGMA query_only = ON')
+            try:
+                return self._conn.execute(sql, params).fetchall()
+            finally:
+                self._conn.execute('PRAGMA query_only = OFF')
@@ -0,0 +1,273 @@
+# comanage_api/_models.py
+
+"""
+Models - optional typed records with __slots__
+
+The view methods return the decoded JSON (one dict per record) by default; with as_models=True the records
+of the response are converted to the classes below. A slotted object has no per-instance __dict__, and the
+enum-like values (Status, Affiliation, Type, Version, CoId, CouId and the Person Type) are interned, so that
+the many records sharing a value reference a single string. Keys a model does not declare are kept in
+"extra" and written back by to_dict().
+
+Records can be read by attribute (role.status) or, like the dict form, by JSON key (role.get('Status')).
+
+Methods
+-------
+to_models(response: dict) -> dict
+    Copy of a view response with its records converted to models.
+"""
+
+import sys
+
+# attribute -> JSON key of the fields shared by every record
+_COMMON_FIELDS = (
+    ('version', 'Version'),
+    ('id', 'Id')
+)
+
+# attribute -> JSON key of the change tracking fields
+_META_FIELDS = (
+    ('created', 'Created'),
+    ('modified', 'Modified'),
+    ('revision', 'Revision'),
+    ('deleted', 'Deleted'),
+    ('actor_identifier', 'ActorIdentifier')
+)
+
+# attributes holding low cardinality values, interned on load
+_INTERNED = frozenset(['version', 'status', 'affiliation', 'type', 'person_type', 'co_id', 'cou_id'])
+
+
+_MISSING = object()
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class _Model(object):
+    """
+    Base of the slotted record classes, subclasses declare _FIELDS and whether records carry a Person.
+    """
+    __slots__ = ()
+    _FIELDS = ()
+    _PERSON = False
+
+    def __init__(self, **kwargs):
+        for attribute in self.__slots__:
+            value = kwargs.pop(attribute, None)
+            setattr(self, attribute, _intern(value) if attribute in _INTERNED else value)
+        if kwargs:
+            raise TypeError("Invalid Fields '{0}'".format(', '.join(sorted(kwargs))))
+
+    @classmethod
+    def from_dict(cls, record: dict):
+        """
+        Build a model from the JSON form of a record.
+        """
+        model = cls.__new__(cls)
+        extra = dict(record)
+        for attribute, key in cls._FIELDS:
+            value = extra.pop(key, None)
+            setattr(model, attribute, _intern(value) if attribute in _INTERNED else value)
+        if cls._PERSON:
+            person = extra.pop('Person', None) or {}
+            model.person_type = _intern(person.get('Type'))
+            model.person_id = person.get('Id', person.get('ID'))
+        model.extra = extra or None
+        return model
+
+    def to_dict(self) -> dict:
+        """
+        JSON form of the record, fields that are None are left out.
+        """
+        record = {}
+        for attribute, key in self._FIELDS:
+            value = getattr(self, attribute)
+            if value is not None:
+                record[key] = value
+        if self._PERSON and (self.person_type is not None or self.person_id is not None):
+            record['Person'] = {'Type': self.person_type, 'Id': self.person_id}
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+    def get(self, key: str, default=None):
+        """
+        Value of a JSON key, as dict.get() on the record would return it.
+        """
+        for attribute, field in self._FIELDS:
+            if field == key:
+                value = getattr(self, attribute)
+                return default if value is None else value
+        if key == 'Person' and self._PERSON:
+            return {'Type': self.person_type, 'Id': self.person_id}
+        return (self.extra or {}).get(key, default)
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attribute) == getattr(other, attribute) for attribute in self.__slots__)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '{0}(id={1!r})'.format(type(self).__name__, self.id)
+
+
+def _slots(fields: tuple, person: bool = False) -> tuple:
+    return tuple(attribute for attribute, _ in fields) + (('person_type', 'person_id') if person else ()) + \
+        ('extra',)
+
+
+class CoPerson(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('co_id', 'CoId'),
+        ('status', 'Status'),
+        ('timezone', 'Timezone'),
+        ('date_of_birth', 'DateOfBirth')
+    ) + _META_FIELDS
+    __slots__ = _slots(_FIELDS)
+
+
+class CoPersonRole(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('cou_id', 'CouId'),
+        ('affiliation', 'Affiliation'),
+        ('title', 'Title'),
+        ('o', 'O'),
+        ('ordr', 'Ordr'),
+        ('ou', 'Ou'),
+        ('status', 'Status'),
+        ('valid_from', 'ValidFrom'),
+        ('valid_through', 'ValidThrough')
+    ) + _META_FIELDS
+    _PERSON = True
+    __slots__ = _slots(_FIELDS, person=True)
+
+
+class Cou(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('co_id', 'CoId'),
+        ('name', 'Name'),
+        ('description', 'Description'),
+        ('parent_id', 'ParentId'),
+        ('lft', 'Lft'),
+        ('rght', 'Rght')
+    ) + _META_FIELDS
+    __slots__ = _slots(_FIELDS)
+
+
+class SshKey(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('type', 'Type'),
+        ('skey', 'Skey'),
+        ('comment', 'Comment'),
+        ('ssh_key_authenticator_id', 'SshKeyAuthenticatorId')
+    ) + _META_FIELDS
+    _PERSON = True
+    __slots__ = _slots(_FIELDS, person=True)
+
+
+class Identifier(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('type', 'Type'),
+        ('identifier', 'Identifier'),
+        ('login', 'Login'),
+        ('status', 'Status'),
+        ('co_provisioning_target_id', 'CoProvisioningTargetId')
+    ) + _META_FIELDS
+    _PERSON = True
+    __slots__ = _slots(_FIELDS, person=True)
+
+
+class Name(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('honorific', 'Honorific'),
+        ('given', 'Given'),
+        ('middle', 'Middle'),
+        ('family', 'Family'),
+        ('suffix', 'Suffix'),
+        ('type', 'Type'),
+        ('language', 'Language'),
+        ('primary_name', 'PrimaryName')
+    ) + _META_FIELDS
+    _PERSON = True
+    __slots__ = _slots(_FIELDS, person=True)
+
+
+class EmailAddress(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('mail', 'Mail'),
+        ('type', 'Type'),
+        ('description', 'Description'),
+        ('verified', 'Verified')
+    ) + _META_FIELDS
+    _PERSON = True
+    __slots__ = _slots(_FIELDS, person=True)
+
+
+class OrgIdentity(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('co_id', 'CoId'),
+        ('affiliation', 'Affiliation'),
+        ('title', 'Title'),
+        ('o', 'O'),
+        ('ou', 'Ou'),
+        ('valid_from', 'ValidFrom'),
+        ('valid_through', 'ValidThrough'),
+        ('date_of_birth', 'DateOfBirth')
+    ) + _META_FIELDS
+    __slots__ = _slots(_FIELDS)
+
+
+class CoOrgIdentityLink(_Model):
+    _FIELDS = _COMMON_FIELDS + (
+        ('coperson_id', 'CoPersonId'),
+        ('org_identity_id', 'OrgIdentityId')
+    ) + _META_FIELDS
+    __slots__ = _slots(_FIELDS)
+
+
+# records key of a view response -> model
+RECORD_MODELS = {
+    'CoPeople': CoPerson,
+    'CoPersonRoles': CoPersonRole,
+    'Cous': Cou,
+    'SshKeys': SshKey,
+    'Identifiers': Identifier,
+    'Names': Name,
+    'EmailAddresses': EmailAddress,
+    'OrgIdentities': OrgIdentity,
+    'CoOrgIdentityLinks': CoOrgIdentityLink
+}
+
+
+def to_models(response: dict) -> dict:
+    """
+    Copy of a view response with its records converted to models, the response itself (which may be
+    held by the response cache) is left unchanged.
+
+    :param response: decoded view response
+    :return
+        same format as the response, with a list of models in place of the records
+    """
+    if not isinstance(response, dict):
+        return response
+    converted = dict(response)
+    for key, model in RECORD_MODELS.items():
+        records = response.get(key)
+        if isinstance(records, list):
+            converted[key] = [model.from_dict(record) if isinstance(record, dict) else record
+                              for record in records]
+    return converted
@@ -14,15 +14,19 @@ names_delete() -> bool
 names_edit() -> bool
     ### NOT IMPLEMENTED ###
     Edit an existing Name.
-names_view_all() -> dict
+names_view_all(as_models: bool = False) -> dict
     Retrieve all existing Names.
-names_view_per_person(person_type: str, person_id: int) -> dict
+names_view_per_person(person_type: str, person_id: int, as_models: bool = False) -> dict
     Retrieve Names attached to a CO Person or Org Identity.
-names_view_one(name_id: int) -> dict
+names_view_one(name_id: int, as_models: bool = False) -> dict
     Retrieve Names attached to a CO Person or Org Identity.
+iter_names_all() -> generator
+    Iterate over all existing Names one record at a time, parsed incrementally from a streamed response.
 """
 
-import json
+from ._json import decode, iter_records
+from ._models import to_models
+from ._session import not_implemented, request
 
 
 def names_add(self) -> dict:
@@ -34,12 +38,9 @@ def names_add(self) -> dict:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        return decode(self, resp)
     else:
         resp.raise_for_status()
 
@@ -53,10 +54,7 @@ def names_delete(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -72,21 +70,19 @@ def names_edit(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
         resp.raise_for_status()
 
 
-def names_view_all(self) -> dict:
+def names_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing Names.
 
     :param self:
+    :param as_models: return the records as Name models instead of dicts
     :return
         {
             "ResponseType":"Names",
@@ -123,22 +119,25 @@ def names_view_all(self) -> dict:
         500 Other Error                             Unknown error
     """
     url = self._CO_API_URL + '/names.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def names_view_per_person(self, person_type: str, person_id: int) -> dict:
+def names_view_per_person(self, person_type: str, person_id: int, as_models: bool = False) -> dict:
     """
     Retrieve Names attached to a CO Person or Org Identity.
 
     :param self:
     :param person_type:
     :param person_id:
+    :param as_models: return the records as Name models instead of dicts
     :return
         {
             "ResponseType":"Names",
@@ -184,22 +183,25 @@ def names_view_per_person(self, person_type: str, person_id: int) -> dict:
         raise TypeError("Invalid Fields 'person_type'")
     url = self._CO_API_URL + '/names.json'
     params = {str(person_type): str(person_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def names_view_one(self, name_id: int) -> dict:
+def names_view_one(self, name_id: int, as_models: bool = False) -> dict:
     """
     Retrieve Names attached to a CO Person or Org Identity.
 
     :param self:
     :param name_id:
+    :param as_models: return the records as Name models instead of dicts
     :return
         {
             "ResponseType":"Names",
@@ -237,10 +239,40 @@ def names_view_one(self, name_id: int) -> dict:
         500 Other Error                                     Unknown error
     """
     url = self._CO_API_URL + '/names/' + str(name_id) + '.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
+    else:
+        resp.raise_for_status()
+
+
+def iter_names_all(self):
+    """
+    Iterate over all existing Names one record at a time. The response is streamed and parsed
+    incrementally, records are yielded as they arrive and the full listing is never held in memory.
+    Streamed requests bypass the response cache, coalescing and revalidation.
+
+    for record in api.iter_names_all():
+        ...
+
+    :param self:
+    :return
+        generator of Names records (same format as the "Names" items of names_view_all)
+    """
+    url = self._CO_API_URL + '/names.json'
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        stream=True
+    )
+    if resp.status_code == 200:
+        return iter_records(resp, 'Names')
     else:
+        resp.close()
         resp.raise_for_status()
+        return iter([])
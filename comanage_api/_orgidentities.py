@@ -16,18 +16,20 @@ org_identities_delete() -> bool
 org_identities_edit() -> bool
     ### NOT IMPLEMENTED ###
     Edit an existing Organizational Identity.
-org_identities_view_all() -> dict
+org_identities_view_all(as_models: bool = False) -> dict
     Retrieve all existing Organizational Identities.
-org_identities_view_per_co(person_type: str, person_id: int) -> dict
+org_identities_view_per_co(person_type: str, person_id: int, as_models: bool = False) -> dict
     Retrieve all existing Organizational Identities for the specified CO.
-org_identities_view_per_identifier(identifier_id: int) -> dict
+org_identities_view_per_identifier(identifier_id: int, as_models: bool = False) -> dict
     Retrieve all existing Organizational Identities attached to the specified identifier.
     Note the specified identifier must be attached to an Org Identity, not a CO Person.
-org_identities_view_one(org_identity_id: int) -> dict
+org_identities_view_one(org_identity_id: int, as_models: bool = False) -> dict
     Retrieve an existing Organizational Identity.
 """
 
-import json
+from ._json import decode
+from ._models import to_models
+from ._session import not_implemented, request
 
 
 def org_identities_add(self) -> dict:
@@ -39,12 +41,9 @@ def org_identities_add(self) -> dict:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        return decode(self, resp)
     else:
         resp.raise_for_status()
 
@@ -60,10 +59,7 @@ def org_identities_delete(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
@@ -79,21 +75,19 @@ def org_identities_edit(self) -> bool:
     :return
         501 Server Error: Not Implemented for url: mock://not_implemented_501.local:
     """
-    url = self._MOCK_501_URL
-    resp = self._mock_session.get(
-        url=url
-    )
+    resp = not_implemented(self)
     if resp.status_code == 200:
         return True
     else:
         resp.raise_for_status()
 
 
-def org_identities_view_all(self) -> dict:
+def org_identities_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing EmailAddresses.
 
     :param self:
+    :param as_models: return the records as OrgIdentity models instead of dicts
     :return
         {
             "ResponseType":"OrgIdentities",
@@ -125,20 +119,23 @@ def org_identities_view_all(self) -> dict:
         500 Other Error                             Unknown error
     """
     url = self._CO_API_URL + '/org_identities.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def org_identities_view_per_co(self) -> dict:
+def org_identities_view_per_co(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing Organizational Identities for the specified CO.
 
     :param self:
+    :param as_models: return the records as OrgIdentity models instead of dicts
     :return
         {
             "ResponseType":"OrgIdentities",
@@ -172,23 +169,26 @@ def org_identities_view_per_co(self) -> dict:
     """
     url = self._CO_API_URL + '/org_identities.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def org_identities_view_per_identifier(self, identifier_id: int) -> dict:
+def org_identities_view_per_identifier(self, identifier_id: int, as_models: bool = False) -> dict:
     """
     Retrieve all existing Organizational Identities attached to the specified identifier.
     Note the specified identifier must be attached to an Org Identity, not a CO Person.
 
     :param self:
     :param identifier_id:
+    :param as_models: return the records as OrgIdentity models instead of dicts
     :return
        {
             "ResponseType":"OrgIdentities",
@@ -222,22 +222,25 @@ def org_identities_view_per_identifier(self, identifier_id: int) -> dict:
     """
     url = self._CO_API_URL + '/org_identities.json'
     params = {'coid': self._CO_API_ORG_ID, 'search.identifier': int(identifier_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def org_identities_view_one(self, org_identity_id: int) -> dict:
+def org_identities_view_one(self, org_identity_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing Organizational Identity.
 
     :param self:
     :param org_identity_id:
+    :param as_models: return the records as OrgIdentity models instead of dicts
     :return
         {
             "ResponseType":"OrgIdentities",
@@ -270,11 +273,13 @@ def org_identities_view_one(self, org_identity_id: int) -> dict:
     """
     url = self._CO_API_URL + '/org_identities/' + str(org_identity_id) + '.json'
     params = {'coid': self._CO_API_ORG_ID}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
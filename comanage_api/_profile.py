@@ -0,0 +1,96 @@
+# comanage_api/_profile.py
+
+"""
+Profile - one-call aggregation of the records attached to a CO Person
+
+Methods
+-------
+get_person_profile(coperson_id: int, timeout: float = None) -> dict
+    Retrieve a CO Person with its roles, names, email addresses, identifiers and SSH keys concurrently.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from ._copeople import copeople_view_one
+from ._copersonroles import coperson_roles_view_per_coperson
+from ._emailaddresses import email_addresses_view_per_person
+from ._fanout import _call
+from ._identifiers import identifiers_view_per_entity
+from ._names import names_view_per_person
+from ._session import DeadlineExceeded, current_deadline
+from ._sshkeys import ssh_keys_view_per_coperson
+
+# profile part -> (method, records key of its response)
+PROFILE_PARTS = {
+    'CoPerson': (lambda self, i: copeople_view_one(self, coperson_id=i), 'CoPeople'),
+    'CoPersonRoles': (lambda self, i: coperson_roles_view_per_coperson(self, coperson_id=i), 'CoPersonRoles'),
+    'Names': (lambda self, i: names_view_per_person(self, person_type='copersonid', person_id=i), 'Names'),
+    'EmailAddresses': (lambda self, i: email_addresses_view_per_person(
+        self, person_type='copersonid', person_id=i), 'EmailAddresses'),
+    'Identifiers': (lambda self, i: identifiers_view_per_entity(
+        self, entity_type='copersonid', entity_id=i), 'Identifiers'),
+    'SshKeys': (lambda self, i: ssh_keys_view_per_coperson(self, coperson_id=i), 'SshKeys')
+}
+
+
+def get_person_profile(self, coperson_id: int, timeout: float = None) -> dict:
+    """
+    Retrieve a CO Person with its roles, names, email addresses, identifiers and SSH keys in one call.
+    The six requests are sent concurrently over the shared session, so the call takes as long as the
+    slowest part rather than the sum of them. Each part is bounded by timeout (and by the deadline of the
+    calling thread); a part that fails or times out is reported in "Errors" and the others are returned.
+
+    profile = api.get_person_profile(coperson_id=123, timeout=2.0)
+    if 'SshKeys' in profile.get('Errors'):
+        ...
+
+    :param self:
+    :param coperson_id:
+    :param timeout: seconds allowed per part (default: no limit beyond the client timeouts)
+    :return
+        {
+            "CoPerson": <CoPerson record or None>,
+            "CoPersonRoles": [<CoPersonRole record>, ...],
+            "Names": [<Name record>, ...],
+            "EmailAddresses": [<EmailAddress record>, ...],
+            "Identifiers": [<Identifier record>, ...],
+            "SshKeys": [<SshKey record>, ...],
+            "Errors": {<part>: <exception>, ...}
+        }:
+    """
+    if timeout is not None and float(timeout) <= 0:
+        raise TypeError("Invalid Fields 'timeout'")
+    expires = current_deadline(self)
+    if timeout is not None:
+        part_expires = time.monotonic() + float(timeout)
+        expires = part_expires if expires is None else min(expires, part_expires)
+    executor = ThreadPoolExecutor(max_workers=len(PROFILE_PARTS))
+    try:
+        futures = {
+            part: executor.submit(_call, self, partial(method, self, coperson_id), {}, expires)
+            for part, (method, _) in PROFILE_PARTS.items()
+        }
+        wait(list(futures.values()), timeout=None if expires is None else max(expires - time.monotonic(), 0))
+    finally:
+        # parts still running are bounded by their deadline, do not wait for them
+        executor.shutdown(wait=False)
+    profile = {}
+    errors = {}
+    for part, (_, key) in PROFILE_PARTS.items():
+        future = futures.get(part)
+        records = []
+        if not future.done():
+            future.cancel()
+            errors[part] = DeadlineExceeded('Deadline exceeded while retrieving {0}'.format(part))
+        elif future.result().error is not None:
+            errors[part] = future.result().error
+        else:
+            records = (future.result().result or {}).get(key) or []
+        if part == 'CoPerson':
+            profile[part] = records[0] if records else None
+        else:
+            profile[part] = records
+    profile['Errors'] = errors
+    return profile
@@ -0,0 +1,224 @@
+# comanage_api/_reconcile.py
+
+"""
+Reconcile - bring COU memberships in line with a desired state using a minimal set of role writes
+
+Methods
+-------
+coperson_roles_reconcile(desired: dict, remove: str = 'delete', dry_run: bool = False, max_workers: int = None,
+                         rate_limit: float = None, fetch: str = 'auto', index: StatusIndex = None) -> dict
+    Plan and apply the role adds, edits and deletes that make the COUs of desired match it.
+"""
+
+import time
+from functools import partial
+
+from ._copersonroles import coperson_roles_add, coperson_roles_delete, coperson_roles_edit, coperson_roles_view_all, \
+    coperson_roles_view_per_cou
+from ._fanout import RateLimiter, fanout_map
+
+# current state of the COUs: per COU listings, one listing of every role, or decided by the number of COUs
+RECONCILE_FETCH_OPTIONS = ['auto', 'cou', 'all']
+# with fetch='auto', coperson_roles_view_all is used from this number of COUs on
+RECONCILE_VIEW_ALL_MIN_COUS = 10
+
+
+def _desired_state(self, desired: dict) -> dict:
+    """
+    {cou_id: {coperson_id: (status, affiliation or None)}} with validated values.
+    """
+    if not isinstance(desired, dict):
+        raise TypeError("Invalid Fields 'desired'")
+    state = {}
+    for cou_id, members in desired.items():
+        if not isinstance(members, dict):
+            raise TypeError("Invalid Fields 'desired'")
+        state[str(cou_id)] = {}
+        for coperson_id, value in members.items():
+            if isinstance(value, dict):
+                status, affiliation = value.get('status', 'Active'), value.get('affiliation')
+            elif isinstance(value, (tuple, list)):
+                status, affiliation = (list(value) + [None])[:2]
+            else:
+                status, affiliation = value, None
+            status = 'Active' if status is None else status
+            if status not in self.STATUS_OPTIONS:
+                raise TypeError("Invalid Fields 'status'")
+            if affiliation is not None:
+                affiliation = str(affiliation).lower()
+                if affiliation not in self.AFFILIATION_OPTIONS:
+                    raise TypeError("Invalid Fields 'affiliation'")
+            state[str(cou_id)][str(coperson_id)] = (status, affiliation)
+    return state
+
+
+def _current_state(self, cou_ids: list, fetch: str, index, max_workers: int) -> tuple:
+    """
+    Roles of the COUs, how they were fetched and the number of listings.
+    """
+    if index is not None:
+        return {cou_id: index.roles(cou_id) for cou_id in cou_ids}, 'index', 0
+    if fetch == 'auto':
+        fetch = 'all' if len(cou_ids) >= RECONCILE_VIEW_ALL_MIN_COUS else 'cou'
+    current = {cou_id: [] for cou_id in cou_ids}
+    if fetch == 'all':
+        for role in coperson_roles_view_all(self).get('CoPersonRoles') or []:
+            if str(role.get('CouId')) in current:
+                current[str(role.get('CouId'))].append(role)
+        return current, fetch, 1
+    listing = partial(coperson_roles_view_per_cou, self)
+    for r in fanout_map(self, listing, ({'cou_id': cou_id} for cou_id in cou_ids), max_workers=max_workers,
+                        ordered=False):
+        if r.error is not None:
+            raise r.error
+        current[str(r.kwargs.get('cou_id'))] = (r.result or {}).get('CoPersonRoles') or []
+    return current, fetch, len(cou_ids)
+
+
+def _matches(role: dict, status: str, affiliation: str) -> bool:
+    return role.get('Status') == status and (affiliation is None or role.get('Affiliation') == affiliation)
+
+
+def _plan(desired: dict, current: dict, remove: str) -> tuple:
+    """
+    Steps making current match desired, and the number of memberships already matching.
+    """
+    plan = []
+    unchanged = 0
+    for cou_id, members in desired.items():
+        roles = {}
+        for role in current.get(cou_id) or []:
+            person = role.get('Person') or {}
+            roles.setdefault(str(person.get('Id', person.get('ID'))), []).append(role)
+        for coperson_id, (status, affiliation) in members.items():
+            held = roles.get(coperson_id) or []
+            if any(_matches(role, status, affiliation) for role in held):
+                unchanged += 1
+            elif not held:
+                plan.append({'action': 'add', 'cou_id': cou_id, 'coperson_id': coperson_id,
+                             'coperson_role_id': None, 'status': status, 'affiliation': affiliation,
+                             'current': None})
+            else:
+                plan.append({'action': 'edit', 'cou_id': cou_id, 'coperson_id': coperson_id,
+                             'coperson_role_id': str(held[0].get('Id')), 'status': status,
+                             'affiliation': affiliation, 'current': held[0]})
+        if remove is None:
+            continue
+        for coperson_id, held in roles.items():
+            if coperson_id in members:
+                continue
+            for role in held:
+                if remove == 'delete':
+                    plan.append({'action': 'delete', 'cou_id': cou_id, 'coperson_id': coperson_id,
+                                 'coperson_role_id': str(role.get('Id')), 'status': None, 'affiliation': None,
+                                 'current': role})
+                elif role.get('Status') != remove:
+                    plan.append({'action': 'edit', 'cou_id': cou_id, 'coperson_id': coperson_id,
+                                 'coperson_role_id': str(role.get('Id')), 'status': remove, 'affiliation': None,
+                                 'current': role})
+                else:
+                    unchanged += 1
+    return plan, unchanged
+
+
+def _apply_step(self, step: dict):
+    if step.get('action') == 'add':
+        return coperson_roles_add(self, coperson_id=step.get('coperson_id'), cou_id=step.get('cou_id'),
+                                  status=step.get('status'), affiliation=step.get('affiliation'))
+    if step.get('action') == 'edit':
+        # the listed role is the snapshot of the edit, no GET before the PUT
+        return coperson_roles_edit(self, coperson_role_id=step.get('coperson_role_id'), status=step.get('status'),
+                                   affiliation=step.get('affiliation'), coperson_role=step.get('current'))
+    return coperson_roles_delete(self, coperson_role_id=step.get('coperson_role_id'))
+
+
+def coperson_roles_reconcile(self, desired: dict, remove: str = 'delete', dry_run: bool = False,
+                             max_workers: int = None, rate_limit: float = None, fetch: str = 'auto',
+                             index=None) -> dict:
+    """
+    Bring the memberships of the COUs in desired in line with it. The current roles of these COUs are
+    fetched with as few listings as possible (one coperson_roles_view_per_cou per COU, or one
+    coperson_roles_view_all from RECONCILE_VIEW_ALL_MIN_COUS COUs on, or none with a StatusIndex),
+    then a minimal plan is computed:
+    - add: CO Person without role in the COU
+    - edit: CO Person whose roles in the COU all differ in status (or affiliation, when specified)
+    - delete: role of a CO Person not in the desired members of its COU (remove='delete')
+    CO People already holding a matching role are left alone, and COUs not in desired are not touched.
+    The steps run concurrently (max_workers threads, at most rate_limit writes per second); edits are
+    based on the listed roles and send no GET. With dry_run the plan is returned without writing.
+
+    report = api.coperson_roles_reconcile({45: {123: 'Active', 124: {'status': 'GracePeriod'}}}, dry_run=True)
+    for step in report.get('plan'):
+        print(step.get('action'), step.get('cou_id'), step.get('coperson_id'), step.get('status'))
+
+    :param self:
+    :param desired: {cou_id: {coperson_id: status | (status, affiliation) | {"status", "affiliation"}}}
+    :param remove: 'delete' to delete the roles of CO People not in desired, a status to set on them
+                   (e.g. 'Expired'), None to leave them
+    :param dry_run: compute the plan without writing
+    :param max_workers: number of worker threads (default: the pool_maxsize of the session)
+    :param rate_limit: maximum number of writes per second (default: no limit)
+    :param fetch: 'auto', 'cou' or 'all'
+    :param index: StatusIndex to read the current state from instead of the registry
+    :return
+        {
+            "plan":
+            [
+                {
+                    "action": ("add"|"edit"|"delete"),
+                    "cou_id": <cou_id>,
+                    "coperson_id": <coperson_id>,
+                    "coperson_role_id": <edited or deleted role, None for add>,
+                    "status": <desired status>,
+                    "affiliation": <desired affiliation or None>,
+                    "current": <current CoPersonRole record, None for add>,
+                    "outcome": ("planned"|"applied"|"failed"),
+                    "error": <exception or None>,
+                    "seconds": <time of the write>
+                }, ...
+            ],
+            "unchanged": <memberships already matching>,
+            "applied": <steps written>,
+            "failed": <steps that failed>,
+            "fetch": {"by": ("cou"|"all"|"index"), "calls": <listings>, "seconds": <fetch time>},
+            "seconds": <total time>
+        }:
+    """
+    if fetch not in RECONCILE_FETCH_OPTIONS:
+        raise TypeError("Invalid Fields 'fetch'")
+    if remove is not None and remove != 'delete' and remove not in self.STATUS_OPTIONS:
+        raise TypeError("Invalid Fields 'remove'")
+    start = time.perf_counter()
+    desired = _desired_state(self, desired)
+    current, fetched_by, calls = _current_state(self, sorted(desired), fetch, index, max_workers)
+    fetch_seconds = time.perf_counter() - start
+    plan, unchanged = _plan(desired, current, remove)
+    for step in plan:
+        step.update(outcome='planned', error=None, seconds=None)
+    if not dry_run:
+        limiter = RateLimiter(rate_limit)
+
+        def apply(position: int):
+            limiter.acquire()
+            started = time.perf_counter()
+            try:
+                return _apply_step(self, plan[position])
+            finally:
+                plan[position]['seconds'] = round(time.perf_counter() - started, 6)
+
+        for r in fanout_map(self, apply, ({'position': position} for position in range(len(plan))),
+                            max_workers=max_workers, ordered=False):
+            step = plan[r.kwargs.get('position')]
+            if r.error is not None:
+                step.update(outcome='failed', error=r.error)
+            else:
+                step.update(outcome='applied')
+    outcomes = [step.get('outcome') for step in plan]
+    return {
+        'plan': plan,
+        'unchanged': unchanged,
+        'applied': outcomes.count('applied'),
+        'failed': outcomes.count('failed'),
+        'fetch': {'by': fetched_by, 'calls': calls, 'seconds': round(fetch_seconds, 6)},
+        'seconds': round(time.perf_counter() - start, 6)
+    }
@@ -0,0 +1,181 @@
+# comanage_api/_resolver.py
+
+"""
+IdentifierResolver - in-memory identifier to CO Person resolution with positive and negative caching
+
+Built on copeople_view_per_identifier: resolved identifiers are kept for ttl seconds, identifiers without
+a CO Person (empty "CoPeople") for the shorter negative_ttl, so that returning users are answered from
+memory and repeated lookups of unknown identifiers do not reach the registry on every call.
+
+Methods
+-------
+resolve(identifier: str) -> dict
+    CO People attached to identifier, same format as copeople_view_per_identifier.
+warm_up() -> int
+    Load every CO Person identifier of the CO into the resolver.
+invalidate(identifier: str) -> None
+    Drop the cached resolution of identifier.
+clear() -> None
+    Drop all cached resolutions.
+stats() -> dict
+    Lookup counts, hit rate and latency percentiles.
+"""
+
+import threading
+import time
+from collections import deque
+
+from ._cache import ResponseCache
+
+# number of most recent lookup latencies kept for the percentiles
+LATENCY_SAMPLES = 10000
+
+
+def _copeople_response(copeople: list) -> dict:
+    return {'ResponseType': 'CoPeople', 'Version': '1.0', 'CoPeople': copeople}
+
+
+def _percentile(samples: list, percent: float) -> float:
+    """
+    Nearest-rank percentile of sorted samples, None when there are none.
+    """
+    if not samples:
+        return None
+    rank = max(int(round(percent / 100.0 * len(samples) + 0.5)) - 1, 0)
+    return samples[min(rank, len(samples) - 1)]
+
+
+class IdentifierResolver(object):
+    """
+    Identifier to CO Person resolver with positive and negative caching.
+
+    resolver = IdentifierResolver(api, ttl=300, negative_ttl=30)
+    resolver.warm_up()
+    copeople = resolver.resolve('http://cilogon.org/serverA/users/242181').get('CoPeople')
+
+    Attributes
+    ----------
+    api: ComanageApi
+        Client used for registry lookups (required)
+    ttl: float = 300
+        Seconds a resolved identifier is answered from memory (optional)
+    negative_ttl: float = 30
+        Seconds an identifier without CO Person is answered from memory, 0 disables negative caching (optional)
+    maxsize: int = 100000
+        Maximum number of cached identifiers, the least recently used is evicted first (optional)
+    """
+
+    def __init__(self, api, ttl: float = 300, negative_ttl: float = 30, maxsize: int = 100000):
+        if float(ttl) < 0:
+            raise TypeError("Invalid Fields 'ttl'")
+        if float(negative_ttl) < 0:
+            raise TypeError("Invalid Fields 'negative_ttl'")
+        if int(maxsize) < 1:
+            raise TypeError("Invalid Fields 'maxsize'")
+        self.api = api
+        self._cache = ResponseCache(maxsize=maxsize, ttls={'positive': ttl, 'negative': negative_ttl})
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.lookups = self.positive_hits = self.negative_hits = self.registry_lookups = self.warmed = 0
+
+    def resolve(self, identifier: str) -> dict:
+        """
+        CO People attached to identifier, answered from memory when cached.
+
+        :param identifier:
+        :return
+            same format as copeople_view_per_identifier (distinct by id)
+        """
+        start = time.perf_counter()
+        key = str(identifier)
+        copeople = self._cache.get(key)
+        if copeople is None:
+            generation = self._cache.generation
+            copeople = self.api.copeople_view_per_identifier(identifier=identifier).get('CoPeople') or []
+            self._cache.set(key, 'positive' if copeople else 'negative', {'identifier': key}, copeople,
+                            generation=generation)
+            hit = None
+        else:
+            hit = 'positive' if copeople else 'negative'
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.lookups += 1
+            if hit == 'positive':
+                self.positive_hits += 1
+            elif hit == 'negative':
+                self.negative_hits += 1
+            else:
+                self.registry_lookups += 1
+            self._latencies.append(elapsed)
+        return _copeople_response(list(copeople))
+
+    def warm_up(self) -> int:
+        """
+        Load every CO Person identifier of the CO: identifiers are streamed from identifiers_view_all and
+        joined with the CO People of copeople_view_per_co. CO People are loaded whatever their Status, as
+        copeople_view_per_identifier returns them. Identifiers of other COs, of Org Identities and deleted
+        identifiers are skipped.
+
+        :return
+            number of identifiers loaded
+        """
+        generation = self._cache.generation
+        copeople = {p.get('Id'): p for p in self.api.copeople_view_per_co().get('CoPeople') or []}
+        resolved = {}
+        for record in self.api.iter_identifiers_all():
+            person = record.get('Person') or {}
+            if person.get('Type') != 'CO' or record.get('Status') == 'Deleted':
+                continue
+            coperson = copeople.get(person.get('Id', person.get('ID')))
+            if coperson is None or not record.get('Identifier'):
+                continue
+            people = resolved.setdefault(str(record.get('Identifier')), {})
+            people[coperson.get('Id')] = coperson
+        for identifier, people in resolved.items():
+            self._cache.set(identifier, 'positive', {'identifier': identifier}, list(people.values()),
+                            generation=generation)
+        with self._lock:
+            self.warmed += len(resolved)
+        return len(resolved)
+
+    def invalidate(self, identifier: str):
+        for resource in ['positive', 'negative']:
+            self._cache.invalidate(resource, identifier=str(identifier))
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """
+        Resolver statistics, latencies in milliseconds over the last LATENCY_SAMPLES lookups.
+
+        :return
+            {
+                "lookups": <resolve() calls>,
+                "positive_hits": <answered from memory with a CO Person>,
+                "negative_hits": <answered from memory without CO Person>,
+                "registry_lookups": <sent to the registry>,
+                "hit_rate": <(positive_hits + negative_hits) / lookups>,
+                "warmed": <identifiers loaded by warm_up()>,
+                "size": <cached identifiers>,
+                "p50_ms": <median lookup latency>,
+                "p99_ms": <99th percentile lookup latency>
+            }:
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            lookups = self.lookups
+            hits = self.positive_hits + self.negative_hits
+            stats = {
+                'lookups': lookups,
+                'positive_hits': self.positive_hits,
+                'negative_hits': self.negative_hits,
+                'registry_lookups': self.registry_lookups,
+                'hit_rate': float(hits) / lookups if lookups else 0.0,
+                'warmed': self.warmed
+            }
+        stats['size'] = self._cache.stats().get('size')
+        for name, percent in [('p50_ms', 50), ('p99_ms', 99)]:
+            value = _percentile(latencies, percent)
+            stats[name] = value * 1000 if value is not None else None
+        return stats
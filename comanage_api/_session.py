@@ -0,0 +1,572 @@
+# comanage_api/_session.py
+
+"""
+Session - HTTP session and connection pool management for the COmanage REST API client
+
+Methods
+-------
+build_session(pool_connections: int, pool_maxsize: int, pool_block: bool, keep_alive: bool) -> Session
+    Create the comanage_api session and mount a pooled adapter for the registry URL.
+pool_stats() -> dict
+    Report connection pool usage (hits, misses, requests) for the registry URL.
+deadline(seconds: float) -> contextmanager
+    Bound every registry call made within the context (including composite operations) by one deadline.
+request(method: str, url: str, params: dict = None, data: str = None, revalidate: bool = False,
+        stream: bool = False) -> Response
+    Send a request to the registry, coalescing identical GET requests in flight when enabled and
+    retrying transient failures per the client retry policy.
+stats() -> dict
+    Retrieve client statistics.
+add_write_listener(listener: callable) -> None
+    Call listener(resource, action, record_id, record) after each write made through the client.
+remove_write_listener(listener: callable) -> None
+    Stop calling a write listener.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+
+from ._cache import request_key, resource_filters
+
+# Status codes considered transient
+RETRY_STATUS_OPTIONS = [429, 500, 502, 503, 504]
+# Status codes for which a non-idempotent request (POST) is known to have been rejected before processing
+RETRY_STATUS_OPTIONS_POST = [429, 503]
+# Methods that can be safely replayed
+IDEMPOTENT_METHODS = ['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT']
+
+
+def build_session(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                  keep_alive: bool = True) -> Session:
+    """
+    Create the comanage_api session and mount a pooled adapter for the registry URL.
+
+    :param self:
+    :param pool_connections: number of per-host connection pools to cache
+    :param pool_maxsize: maximum number of connections kept open per host
+    :param pool_block: block when no free connection is available rather than opening a throwaway connection
+    :param keep_alive: reuse connections between requests (False sends 'Connection: close')
+    :return
+        requests.Session
+    """
+    if int(pool_connections) < 1:
+        raise TypeError("Invalid Fields 'pool_connections'")
+    if int(pool_maxsize) < 1:
+        raise TypeError("Invalid Fields 'pool_maxsize'")
+    s = Session()
+    s.headers = {'Content-Type': 'application/json'}
+    if not keep_alive:
+        s.headers['Connection'] = 'close'
+    s.auth = (self._CO_API_USER, self._CO_API_PASS)
+    self._pool_adapter = HTTPAdapter(
+        pool_connections=int(pool_connections),
+        pool_maxsize=int(pool_maxsize),
+        pool_block=bool(pool_block)
+    )
+    s.mount(self._CO_API_URL, self._pool_adapter)
+    return s
+
+
+def pool_stats(self) -> dict:
+    """
+    Report connection pool usage for the registry URL.
+    A miss is a request that had to open a new connection (new TCP/TLS handshake), a hit is a request
+    that reused a warm connection from the pool.
+
+    :param self:
+    :return
+        {
+            "pools": <number of host pools>,
+            "requests": <requests sent>,
+            "hits": <requests on a reused connection>,
+            "misses": <new connections opened>,
+            "maxsize": <pool_maxsize>,
+            "block": <pool_block>
+        }:
+    """
+    pools = self._pool_adapter.poolmanager.pools
+    num_pools = num_requests = num_connections = 0
+    for key in pools.keys():
+        try:
+            pool = pools[key]
+        except KeyError:
+            continue
+        num_pools += 1
+        num_requests += pool.num_requests
+        num_connections += pool.num_connections
+    return {
+        'pools': num_pools,
+        'requests': num_requests,
+        'hits': max(num_requests - num_connections, 0),
+        'misses': num_connections,
+        'maxsize': self._pool_adapter._pool_maxsize,
+        'block': self._pool_adapter._pool_block
+    }
+
+
+def not_implemented(self) -> Response:
+    """
+    Local '501 Not Implemented' response for endpoints not implemented by the client.
+    Built in memory on each call, no session, adapter or network round trip is involved.
+
+    :param self:
+    :return
+        requests.Response (raise_for_status() raises
+        501 Server Error: Not Implemented for url: mock://not_implemented_501.local)
+    """
+    resp = Response()
+    resp.status_code = 501
+    resp.reason = 'Not Implemented'
+    resp.url = self._MOCK_501_URL
+    resp._content = b''
+    return resp
+
+
+class DeadlineExceeded(Timeout):
+    """
+    The deadline set with ComanageApi.deadline() expired before the registry call could complete.
+    """
+
+
+def count(self, key: str, value=1):
+    """
+    Increment a client statistics counter.
+
+    :param self:
+    :param key:
+    :param value:
+    """
+    with self._stats_lock:
+        self._counters[key] = self._counters.get(key, 0) + value
+
+
+def add_write_listener(self, listener):
+    """
+    Call listener(resource, action, record_id, record) after each successful write made through the client,
+    e.g. to keep an in-memory index in step with the registry. resource is 'co_person_roles', 'ssh_keys' or
+    'cous', action 'add', 'edit' or 'delete', and record the record as written (None when unknown, e.g. on a
+    delete of an uncached record). Listeners run in the writing thread; their exceptions are counted in
+    stats()['write_listener_errors'] and do not fail the write.
+
+    :param self:
+    :param listener: callable(resource: str, action: str, record_id: str, record: dict)
+    """
+    if not callable(listener):
+        raise TypeError("Invalid Fields 'listener'")
+    with self._stats_lock:
+        self._write_listeners = self._write_listeners + [listener]
+
+
+def remove_write_listener(self, listener):
+    with self._stats_lock:
+        self._write_listeners = [registered for registered in self._write_listeners if registered is not listener]
+
+
+def notify_write(self, resource: str, action: str, record_id, record: dict = None):
+    """
+    Pass a successful write to the registered write listeners.
+    """
+    for listener in self._write_listeners:
+        try:
+            listener(resource, action, str(record_id), record)
+        except Exception:
+            count(self, 'write_listener_errors')
+
+
+def _retry_after(resp: Response):
+    """
+    Parse the Retry-After header (delay-seconds or HTTP-date) of a response.
+
+    :param resp:
+    :return
+        seconds to wait or None
+    """
+    value = resp.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def _backoff(self, attempt: int) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    :param self:
+    :param attempt: zero based retry attempt
+    :return
+        seconds to wait
+    """
+    return random.uniform(0, min(self._RETRY_BACKOFF_MAX, self._RETRY_BACKOFF_FACTOR * (2 ** attempt)))
+
+
+@contextmanager
+def deadline(self, seconds: float):
+    """
+    Bound every registry call made within the context by one deadline, composite operations such as
+    coperson_roles_edit (GET then PUT) share the remaining time. Nested deadlines never extend an outer one.
+    The deadline is tracked per thread.
+
+    with api.deadline(2.0):
+        api.coperson_roles_edit(coperson_role_id=123, status='Expired')
+
+    :param self:
+    :param seconds: time allowed from now
+    :return
+        monotonic time at which the deadline expires
+    """
+    expires = time.monotonic() + float(seconds)
+    previous = getattr(self._local, 'deadline', None)
+    if previous is not None:
+        expires = min(expires, previous)
+    self._local.deadline = expires
+    try:
+        yield expires
+    finally:
+        self._local.deadline = previous
+
+
+def current_deadline(self):
+    """
+    Monotonic time at which the deadline of the calling thread expires, None when no deadline is set.
+
+    :param self:
+    :return
+        float or None
+    """
+    return getattr(self._local, 'deadline', None)
+
+
+def _remaining(self):
+    """
+    Time left before the deadline of the calling thread expires.
+
+    :param self:
+    :return
+        seconds left or None when no deadline is set
+    :raise
+        DeadlineExceeded when the deadline has already expired
+    """
+    expires = current_deadline(self)
+    if expires is None:
+        return None
+    remaining = expires - time.monotonic()
+    if remaining <= 0:
+        count(self, 'deadline_exceeded')
+        raise DeadlineExceeded('Deadline exceeded before the request could be sent')
+    return remaining
+
+
+def _timeout(self) -> tuple:
+    """
+    (connect, read) timeout for the next request, capped by the time left before the deadline.
+
+    :param self:
+    :return
+        (connect_timeout, read_timeout)
+    """
+    remaining = _remaining(self)
+    if remaining is None:
+        return self._CONNECT_TIMEOUT, self._READ_TIMEOUT
+    return min(self._CONNECT_TIMEOUT, remaining), min(self._READ_TIMEOUT, remaining)
+
+
+def _fits_deadline(self, delay: float) -> bool:
+    """
+    Whether waiting delay seconds still leaves time before the deadline of the calling thread.
+
+    :param self:
+    :param delay:
+    :return
+        bool
+    """
+    expires = current_deadline(self)
+    return expires is None or time.monotonic() + delay < expires
+
+
+def request(self, method: str, url: str, params: dict = None, data: str = None,
+            revalidate: bool = False, stream: bool = False) -> Response:
+    """
+    Send a request to the registry, the shared request path used by every endpoint.
+
+    When the response cache is enabled, successful GET responses are served from and stored in the cache.
+    When request coalescing is enabled, concurrent identical GET requests (same url and params) share
+    the response of the single request in flight instead of each sending their own.
+    When conditional GET is enabled, revalidate=True sends the validators of the previous response
+    (If-None-Match / If-Modified-Since) and a 304 Not Modified is answered with the stored response.
+    With stream=True the body is left unread for the caller to consume incrementally, such requests
+    bypass the response cache, coalescing and revalidation.
+
+    :param self:
+    :param method:
+    :param url:
+    :param params:
+    :param data:
+    :param revalidate: revalidate the previous response of this GET request
+    :param stream: do not read the response body (the caller must consume or close the response)
+    :return
+        requests.Response
+    """
+    method = str(method).upper()
+    if stream:
+        return _send(self, method=method, url=url, params=params, data=data, stream=True)
+    if method != 'GET':
+        return _send(self, method=method, url=url, params=params, data=data)
+    if self._cache is None:
+        return _get(self, url=url, params=params, revalidate=revalidate)
+    key = request_key('GET', url, params)
+    resp = self._cache.get(key)
+    if resp is not None:
+        return resp
+    generation = self._cache.generation
+    resp = _get(self, url=url, params=params, revalidate=revalidate)
+    if resp.status_code in [200, 204]:
+        resource, filters = resource_filters(self._CO_API_URL, url, params)
+        # read the body before sharing the response between callers
+        resp.content
+        self._cache.set(key, resource, filters, resp, generation=generation)
+    return resp
+
+
+def _get(self, url: str, params: dict = None, revalidate: bool = False) -> Response:
+    """
+    Send a GET request, conditional when revalidating and coalesced with identical requests in flight
+    when enabled.
+
+    :param self:
+    :param url:
+    :param params:
+    :param revalidate:
+    :return
+        requests.Response
+    """
+    if revalidate and self._validators is not None:
+        fetch = _revalidated_get
+    else:
+        fetch = _plain_get
+    if self._COALESCE:
+        return _coalesced_request(self, url=url, params=params, fetch=fetch)
+    return fetch(self, url=url, params=params)
+
+
+def _plain_get(self, url: str, params: dict = None) -> Response:
+    return _send(self, method='GET', url=url, params=params)
+
+
+def _revalidated_get(self, url: str, params: dict = None) -> Response:
+    """
+    Conditional GET using the validators of the previous response, 304 Not Modified is answered with
+    the stored response.
+
+    :param self:
+    :param url:
+    :param params:
+    :return
+        requests.Response
+    """
+    key = request_key('GET', url, params)
+    resp = _send(self, method='GET', url=url, params=params, headers=self._validators.conditional_headers(key))
+    return self._validators.update(key, resp)
+
+
+def _coalesced_request(self, url: str, params: dict = None, fetch=_plain_get) -> Response:
+    """
+    Single-flight GET: the first caller for a key sends the request, callers arriving while it is in
+    flight wait for and share its response (or exception).
+
+    :param self:
+    :param url:
+    :param params:
+    :return
+        requests.Response
+    """
+    key = request_key('GET', url, params)
+    with self._inflight_lock:
+        call = self._inflight.get(key)
+        leader = call is None
+        if leader:
+            call = self._inflight[key] = {'event': threading.Event(), 'response': None, 'error': None}
+    if leader:
+        try:
+            resp = fetch(self, url=url, params=params)
+            # read the body before sharing the response between threads
+            resp.content
+            call['response'] = resp
+        except Exception as err:
+            call['error'] = err
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            call['event'].set()
+    else:
+        count(self, 'coalesced')
+        if not call['event'].wait(timeout=_remaining(self)):
+            count(self, 'deadline_exceeded')
+            raise DeadlineExceeded('Deadline exceeded while waiting for a coalesced request')
+    if call['error'] is not None:
+        raise call['error']
+    return call['response']
+
+
+def _send(self, method: str, url: str, params: dict = None, data: str = None, headers: dict = None,
+          stream: bool = False) -> Response:
+    """
+    Send a request to the registry, retrying transient failures per the client retry policy.
+
+    Idempotent methods (GET, PUT, DELETE) are retried on connection errors, timeouts and any of
+    RETRY_STATUS_OPTIONS. Non-idempotent methods (POST) are only retried when the registry is known to
+    have rejected the request before processing it: on RETRY_STATUS_OPTIONS_POST or a connect timeout.
+    A Retry-After header is honored, and retrying stops once retry_total attempts or retry_budget seconds
+    of waiting have been used, in which case the last response is returned (or the last error raised).
+    Each attempt uses the client connect/read timeouts, capped by the deadline of the calling thread.
+
+    :param self:
+    :param method:
+    :param url:
+    :param params:
+    :param data:
+    :param headers: additional request headers
+    :param stream: do not read the response body
+    :return
+        requests.Response
+    """
+    if method in IDEMPOTENT_METHODS:
+        retry_statuses = RETRY_STATUS_OPTIONS
+        retry_errors = (ConnectionError, Timeout)
+    else:
+        retry_statuses = RETRY_STATUS_OPTIONS_POST
+        retry_errors = (ConnectTimeout,)
+    attempt = 0
+    waited = 0.0
+    while True:
+        try:
+            resp = self._s.request(
+                method=method,
+                url=url,
+                params=params,
+                data=data,
+                headers=headers,
+                timeout=_timeout(self),
+                stream=stream
+            )
+        except retry_errors:
+            if attempt >= self._RETRY_TOTAL:
+                count(self, 'retry_exhausted')
+                raise
+            delay = _backoff(self, attempt)
+            if waited + delay > self._RETRY_BUDGET or not _fits_deadline(self, delay):
+                count(self, 'retry_exhausted')
+                raise
+        else:
+            if resp.status_code not in retry_statuses:
+                return resp
+            if attempt >= self._RETRY_TOTAL:
+                count(self, 'retry_exhausted')
+                return resp
+            delay = _retry_after(resp)
+            if delay is None:
+                delay = _backoff(self, attempt)
+            if waited + delay > self._RETRY_BUDGET or not _fits_deadline(self, delay):
+                count(self, 'retry_exhausted')
+                return resp
+            # drain the body so the connection is returned to the pool
+            resp.content
+        attempt += 1
+        waited += delay
+        count(self, 'retries')
+        count(self, 'retry_wait_seconds', delay)
+        time.sleep(delay)
+
+
+def stats(self) -> dict:
+    """
+    Retrieve client statistics.
+
+    :param self:
+    :return
+        {
+            "pool": <pool_stats()>,
+            "retry":
+            {
+                "retries": <requests re-sent after a transient failure>,
+                "retry_wait_seconds": <total time spent waiting between retries>,
+                "retry_exhausted": <requests that failed after using up the retry policy>
+            },
+            "deadline_exceeded": <requests not sent because their deadline had expired>,
+            "coalesced": <GET requests answered by an identical request already in flight>,
+            "cache":
+            {
+                "size": <cached responses>,
+                "maxsize": <cache_maxsize>,
+                "hits": <GET requests answered from the cache>,
+                "misses": <GET requests not found in the cache (or expired)>,
+                "evictions": <entries dropped to stay within cache_maxsize>,
+                "expirations": <entries dropped after their TTL>,
+                "invalidations": <entries dropped by writes>
+            },
+            "conditional":
+            {
+                "collections": <collections with a stored response>,
+                "not_modified": <conditional requests answered 304 Not Modified>,
+                "modified": <collections downloaded with new content>,
+                "unchanged": <collections downloaded again with the same fingerprint>
+            },
+            "view_many":
+            {
+                "one": {"calls": <calls>, "ids": <ids requested>, "seconds": <total time>},
+                "listing": {"calls": <calls>, "ids": <ids requested>, "seconds": <total time>},
+                "last": {"strategy": <strategy>, "ids": <ids>, "co_size_estimate": <estimate>, "seconds": <time>}
+            },
+            "write_listener_errors": <exceptions raised by write listeners>,
+            "roles_edit":
+            {
+                "gets": <coperson_roles_edit calls that fetched the role>,
+                "gets_avoided": <coperson_roles_edit calls based on a snapshot or the cached role>,
+                "conflicts": <edits refused with RoleConflict>
+            }
+        }:
+    """
+    with self._stats_lock:
+        counters = dict(self._counters)
+        view_many_last = self._view_many_last
+    client_stats = {
+        'pool': pool_stats(self),
+        'retry': {
+            'retries': counters.get('retries', 0),
+            'retry_wait_seconds': round(counters.get('retry_wait_seconds', 0.0), 3),
+            'retry_exhausted': counters.get('retry_exhausted', 0)
+        },
+        'deadline_exceeded': counters.get('deadline_exceeded', 0),
+        'coalesced': counters.get('coalesced', 0),
+        'cache': self._cache.stats() if self._cache is not None else None,
+        'conditional': self._validators.stats() if self._validators is not None else None,
+        'view_many': {
+            strategy: {
+                'calls': counters.get('view_many_' + strategy, 0),
+                'ids': counters.get('view_many_' + strategy + '_ids', 0),
+                'seconds': round(counters.get('view_many_' + strategy + '_seconds', 0.0), 3)
+            } for strategy in ['one', 'listing']
+        },
+        'write_listener_errors': counters.get('write_listener_errors', 0),
+        'roles_edit': {
+            'gets': counters.get('roles_edit_gets', 0),
+            'gets_avoided': counters.get('roles_edit_gets_avoided', 0),
+            'conflicts': counters.get('roles_edit_conflicts', 0)
+        }
+    }
+    client_stats['view_many']['last'] = view_many_last
+    return client_stats
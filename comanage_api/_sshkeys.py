@@ -13,12 +13,16 @@ ssh_keys_delete(ssh_key_id: int) -> bool
 ssh_keys_edit(ssh_key_id: int, coperson_id: int = None, ssh_key: str = None, key_type: str = None,
               comment: str = None, ssh_key_authenticator_id: int = None) -> bool
     Edit an exiting SSH Key.
-ssh_keys_view_all() -> dict
+ssh_keys_view_all(as_models: bool = False) -> dict
     Retrieve all existing SSH Keys.
-ssh_keys_view_per_coperson(coperson_id: int) -> dict
+ssh_keys_view_per_coperson(coperson_id: int, as_models: bool = False) -> dict
     Retrieve all existing SSH Keys for the specified CO Person.
-ssh_keys_view_one(ssh_key_id: int) -> dict
+ssh_keys_view_one(ssh_key_id: int, as_models: bool = False) -> dict
     Retrieve an existing SSH Key.
+iter_ssh_keys_all() -> generator
+    Iterate over all existing SSH Keys one record at a time, parsed incrementally from a streamed response.
+ssh_key_fingerprint(ssh_key: str) -> str
+    OpenSSH SHA256 fingerprint of a public key.
 
 Notes
 -----
@@ -35,8 +39,106 @@ Implementation Notes
 - Authenticators that are locked cannot be managed by the API.
 """
 
+import base64
+import binascii
+import hashlib
 import json
 
+from ._cache import cache_invalidate, cache_peek
+from ._json import decode, iter_records
+from ._models import to_models
+from ._session import notify_write, request
+
+
+def _ssh_keys_post_body(self, coperson_id: int, ssh_key: str, key_type: str, comment: str = None,
+                        ssh_key_authenticator_id: int = None, sshkey: dict = None) -> str:
+    """
+    Build the SshKeys request body. Unspecified fields are taken from the existing sshkey record when one
+    is provided (edit), otherwise they are used as given (add).
+
+    :param self:
+    :param coperson_id:
+    :param ssh_key:
+    :param key_type:
+    :param comment:
+    :param ssh_key_authenticator_id:
+    :param sshkey: existing SshKey record
+    :return
+        JSON encoded request body
+    """
+    post_body = {
+        'RequestType': 'SshKeys',
+        'Version': '1.0',
+        'SshKeys':
+            [
+                {
+                    'Version': '1.0',
+                    'Person':
+                        {
+                            'Type': 'CO'
+                        }
+                }
+            ]
+    }
+    if coperson_id or sshkey is None:
+        post_body['SshKeys'][0]['Person']['Id'] = str(coperson_id)
+    else:
+        post_body['SshKeys'][0]['Person']['Id'] = str(sshkey.get('Person').get('Id'))
+    if ssh_key or sshkey is None:
+        post_body['SshKeys'][0]['Skey'] = str(ssh_key)
+    else:
+        post_body['SshKeys'][0]['Skey'] = sshkey.get('Skey')
+    if key_type or sshkey is None:
+        key_type = str(key_type).lower()
+        if key_type not in self.SSH_KEY_OPTIONS:
+            raise TypeError("Invalid Fields 'key_type'")
+        post_body['SshKeys'][0]['Type'] = str(key_type)
+    else:
+        post_body['SshKeys'][0]['Type'] = sshkey.get('Type')
+    if comment or sshkey is None:
+        post_body['SshKeys'][0]['Comment'] = str(comment)
+    else:
+        post_body['SshKeys'][0]['Comment'] = sshkey.get('Comment')
+    if ssh_key_authenticator_id or sshkey is None:
+        post_body['SshKeys'][0]['SshKeyAuthenticatorId'] = str(ssh_key_authenticator_id)
+    else:
+        post_body['SshKeys'][0]['SshKeyAuthenticatorId'] = str(sshkey.get('SshKeyAuthenticatorId'))
+    return json.dumps(post_body)
+
+
+def ssh_key_fingerprint(ssh_key: str) -> str:
+    """
+    OpenSSH SHA256 fingerprint of a public key, as shown by ssh-keygen -l (e.g. 'SHA256:nThbg6kX...').
+
+    :param ssh_key: base64 key data, or a full '<type> <base64> [comment]' public key line
+    :return
+        fingerprint or None when the key data is not valid base64
+    """
+    if not ssh_key:
+        return None
+    fields = str(ssh_key).split()
+    blob = fields[1] if len(fields) > 1 and not fields[0].startswith('AAAA') else fields[0]
+    try:
+        key = base64.b64decode(blob.encode(), validate=True)
+    except (binascii.Error, ValueError):
+        return None
+    return 'SHA256:' + base64.b64encode(hashlib.sha256(key).digest()).decode().rstrip('=')
+
+
+def _invalidate_ssh_key(self, ssh_key_id, sshkey: dict = None):
+    """
+    Drop cached SshKeys responses affected by a write to ssh_key_id: the key itself, the key list of its
+    CO Person, and unfiltered listings. When the key record is not known every per CO Person list is dropped.
+
+    :param self:
+    :param ssh_key_id:
+    :param sshkey: SshKey record (or None when unknown)
+    """
+    if sshkey:
+        cache_invalidate(self, 'ssh_keys', id=ssh_key_id, copersonid=sshkey.get('Person', {}).get('Id'))
+    else:
+        cache_invalidate(self, 'ssh_keys', id=ssh_key_id)
+
 
 def ssh_keys_add(self, coperson_id: int, ssh_key: str, key_type: str, comment: str = None,
                  ssh_key_authenticator_id: int = None) -> dict:
@@ -108,35 +210,21 @@ def ssh_keys_add(self, coperson_id: int, ssh_key: str, key_type: str, comment: s
     """
     if not ssh_key_authenticator_id:
         ssh_key_authenticator_id = self._CO_SSH_KEY_AUTHENTICATOR_ID
-    key_type = str(key_type).lower()
-    if key_type not in self.SSH_KEY_OPTIONS:
-        raise TypeError("Invalid Fields 'key_type'")
-    post_body = json.dumps({
-        'RequestType': 'SshKeys',
-        'Version': '1.0',
-        'SshKeys':
-            [
-                {
-                    'Version': '1.0',
-                    'Person':
-                        {
-                            'Type': 'CO',
-                            'Id': str(coperson_id)
-                        },
-                    'Comment': str(comment),
-                    'Type': str(key_type),
-                    'Skey': str(ssh_key),
-                    'SshKeyAuthenticatorId': str(ssh_key_authenticator_id)
-                }
-            ]
-    })
+    post_body = _ssh_keys_post_body(self, coperson_id=coperson_id, ssh_key=ssh_key, key_type=key_type,
+                                    comment=comment, ssh_key_authenticator_id=ssh_key_authenticator_id)
     url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json'
-    resp = self._s.post(
+    resp = request(
+        self,
+        method='POST',
         url=url,
         data=post_body
     )
     if resp.status_code == 201:
-        return json.loads(resp.text)
+        resp_dict = decode(self, resp)
+        sshkey = json.loads(post_body).get('SshKeys')[0]
+        _invalidate_ssh_key(self, resp_dict.get('Id'), sshkey)
+        notify_write(self, 'ssh_keys', 'add', resp_dict.get('Id'), dict(sshkey, Id=resp_dict.get('Id')))
+        return resp_dict
     else:
         resp.raise_for_status()
 
@@ -158,10 +246,18 @@ def ssh_keys_delete(self, ssh_key_id: int) -> bool:
         500 Other Error                             Unknown error
     """
     url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys/' + str(ssh_key_id) + '.json'
-    resp = self._s.delete(
+    # key record from the cache (if any) to only invalidate the key list of its CO Person
+    sshkey = cache_peek(self, url=url)
+    if sshkey:
+        sshkey = sshkey.get('SshKeys')[0]
+    resp = request(
+        self,
+        method='DELETE',
         url=url
     )
     if resp.status_code == 200:
+        _invalidate_ssh_key(self, ssh_key_id, sshkey)
+        notify_write(self, 'ssh_keys', 'delete', ssh_key_id, sshkey)
         return True
     else:
         resp.raise_for_status()
@@ -214,60 +310,32 @@ def ssh_keys_edit(self, ssh_key_id: int, coperson_id: int = None, ssh_key: str =
         500 Other Error                                             Unknown error
     """
     sshkey = ssh_keys_view_one(self, ssh_key_id=ssh_key_id)
-    post_body = {
-        'RequestType': 'SshKeys',
-        'Version': '1.0',
-        'SshKeys':
-            [
-                {
-                    'Version': '1.0',
-                    'Person':
-                        {
-                            'Type': 'CO'
-                        }
-                }
-            ]
-    }
-    if coperson_id:
-        post_body['SshKeys'][0]['Person']['Id'] = str(coperson_id)
-    else:
-        post_body['SshKeys'][0]['Person']['Id'] = str(sshkey.get('SshKeys')[0].get('Person').get('Id'))
-    if ssh_key:
-        post_body['SshKeys'][0]['Skey'] = str(ssh_key)
-    else:
-        post_body['SshKeys'][0]['Skey'] = sshkey.get('SshKeys')[0].get('Skey')
-    if key_type:
-        key_type = str(key_type).lower()
-        if key_type not in self.SSH_KEY_OPTIONS:
-            raise TypeError("Invalid Fields 'key_type'")
-        post_body['SshKeys'][0]['Type'] = str(key_type)
-    else:
-        post_body['SshKeys'][0]['Type'] = sshkey.get('SshKeys')[0].get('Type')
-    if comment:
-        post_body['SshKeys'][0]['Comment'] = str(comment)
-    else:
-        post_body['SshKeys'][0]['Comment'] = sshkey.get('SshKeys')[0].get('Comment')
-    if ssh_key_authenticator_id:
-        post_body['SshKeys'][0]['SshKeyAuthenticatorId'] = str(ssh_key_authenticator_id)
-    else:
-        post_body['SshKeys'][0]['SshKeyAuthenticatorId'] = str(sshkey.get('SshKeys')[0].get('SshKeyAuthenticatorId'))
-    post_body = json.dumps(post_body)
+    post_body = _ssh_keys_post_body(self, coperson_id=coperson_id, ssh_key=ssh_key, key_type=key_type,
+                                    comment=comment, ssh_key_authenticator_id=ssh_key_authenticator_id,
+                                    sshkey=sshkey.get('SshKeys')[0])
     url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys/' + str(ssh_key_id) + '.json'
-    resp = self._s.put(
+    resp = request(
+        self,
+        method='PUT',
         url=url,
         data=post_body
     )
     if resp.status_code == 200:
+        written = json.loads(post_body).get('SshKeys')[0]
+        _invalidate_ssh_key(self, ssh_key_id, sshkey.get('SshKeys')[0])
+        _invalidate_ssh_key(self, ssh_key_id, written)
+        notify_write(self, 'ssh_keys', 'edit', ssh_key_id, dict(written, Id=str(ssh_key_id)))
         return True
     else:
         resp.raise_for_status()
 
 
-def ssh_keys_view_all(self) -> dict:
+def ssh_keys_view_all(self, as_models: bool = False) -> dict:
     """
     Retrieve all existing SSH Keys.
 
     :param self:
+    :param as_models: return the records as SshKey models instead of dicts
     :return
         {
             "ResponseType":"SshKeys",
@@ -300,21 +368,25 @@ def ssh_keys_view_all(self) -> dict:
         500 Other Error                         Unknown error
     """
     url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json'
-    resp = self._s.get(
-        url=url
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        revalidate=True
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     else:
         resp.raise_for_status()
 
 
-def ssh_keys_view_per_coperson(self, coperson_id: int) -> dict:
+def ssh_keys_view_per_coperson(self, coperson_id: int, as_models: bool = False) -> dict:
     """
     Retrieve all existing SSH Keys for the specified CO Person.
 
     :param self:
     :param coperson_id:
+    :param as_models: return the records as SshKey models instead of dicts
     :return
         {
             "ResponseType":"SshKeys",
@@ -349,7 +421,9 @@ def ssh_keys_view_per_coperson(self, coperson_id: int) -> dict:
     """
     url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json'
     params = {'copersonid': str(coperson_id)}
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url,
         params=params
     )
@@ -359,19 +433,20 @@ def ssh_keys_view_per_coperson(self, coperson_id: int) -> dict:
         'SshKeys': []
     }
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
     if resp.status_code == 204:
         return no_ssh_keys
     else:
         resp.raise_for_status()
 
 
-def ssh_keys_view_one(self, ssh_key_id: int) -> dict:
+def ssh_keys_view_one(self, ssh_key_id: int, as_models: bool = False) -> dict:
     """
     Retrieve an existing SSH Key.
 
     :param self:
     :param ssh_key_id:
+    :param as_models: return the records as SshKey models instead of dicts
     :return
         {
             "ResponseType":"SshKeys",
@@ -405,10 +480,40 @@ def ssh_keys_view_one(self, ssh_key_id: int) -> dict:
         500 Other Error                             Unknown error
     """
     url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys/' + str(ssh_key_id) + '.json'
-    resp = self._s.get(
+    resp = request(
+        self,
+        method='GET',
         url=url
     )
     if resp.status_code == 200:
-        return json.loads(resp.text)
+        return to_models(decode(self, resp)) if as_models else decode(self, resp)
+    else:
+        resp.raise_for_status()
+
+
+def iter_ssh_keys_all(self):
+    """
+    Iterate over all existing SSH Keys one record at a time. The response is streamed and parsed
+    incrementally, records are yielded as they arrive and the full listing is never held in memory.
+    Streamed requests bypass the response cache, coalescing and revalidation.
+
+    for record in api.iter_ssh_keys_all():
+        ...
+
+    :param self:
+    :return
+        generator of SshKeys records (same format as the "SshKeys" items of ssh_keys_view_all)
+    """
+    url = self._CO_API_URL + '/ssh_key_authenticator/ssh_keys.json'
+    resp = request(
+        self,
+        method='GET',
+        url=url,
+        stream=True
+    )
+    if resp.status_code == 200:
+        return iter_records(resp, 'SshKeys')
     else:
+        resp.close()
         resp.raise_for_status()
+        return iter([])
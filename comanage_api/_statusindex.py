@@ -0,0 +1,335 @@
+# comanage_api/_statusindex.py
+
+"""
+StatusIndex - CO People and CO Person Roles grouped by Status
+
+Records are partitioned by Status (the client STATUS_OPTIONS) when the index is refreshed, and roles
+additionally by COU and by CO Person, so that status filters, counts and membership checks are dictionary
+lookups instead of scans over every record. A refresh builds a new index and swaps it in atomically; with
+the conditional_get client option, collections whose fingerprint has not changed are not rebuilt. The index
+can refresh itself on a background thread, and roles added, edited or deleted through the client are
+applied to it as they are written (write listener), including writes made while a refresh is in progress.
+
+Methods
+-------
+refresh() -> dict
+    Rebuild the index from copeople_view_per_co and coperson_roles_view_all.
+start(interval: float = 300) -> None
+    Refresh the index every interval seconds on a background thread.
+stop() -> None
+    Stop the background refresh.
+close() -> None
+    Stop the background refresh and detach the index from the client writes.
+copeople(status: str) -> list
+    CO People with status.
+coperson_status(coperson_id: int) -> str
+    Status of a CO Person.
+roles(cou_id: int, status: str = None) -> list
+    CO Person Roles of a COU with status (any status when None).
+member_ids(cou_id: int, status: str = 'Active') -> set
+    Ids of the CO People holding a role with status in a COU.
+has_role(coperson_id: int, cou_id: int, statuses: list = None) -> bool
+    Whether a CO Person holds a role with one of statuses in a COU.
+memberships(coperson_id: int) -> list
+    CO Person Roles of a CO Person.
+counts(cou_id: int = None) -> dict
+    Number of roles by status, for one COU or per COU.
+stats() -> dict
+    Index size, refresh and write counts.
+"""
+
+import threading
+import time
+
+
+def _role_keys(role: dict) -> tuple:
+    """
+    (role id, coperson_id, cou_id, status) of a CoPersonRole record.
+    """
+    person = role.get('Person') or {}
+    return str(role.get('Id')), str(person.get('Id', person.get('ID'))), str(role.get('CouId')), role.get('Status')
+
+
+class _Partitions(object):
+    """
+    Snapshot of the index, replaced as a whole on refresh. Role writes are applied in place, under the lock
+    of the index.
+    """
+
+    def __init__(self, copeople: list = None, roles: list = None):
+        self.copeople_by_status = {}
+        self.coperson_status = {}
+        # role id -> CoPersonRole record
+        self.roles = {}
+        # cou_id -> {status: {role id: CoPersonRole record}}
+        self.roles_by_cou = {}
+        # (coperson_id, cou_id) -> {role id: status}
+        self.member_statuses = {}
+        # coperson_id -> {role id}
+        self.coperson_roles = {}
+        if copeople is not None:
+            self.set_copeople(copeople)
+        if roles is not None:
+            self.set_roles(roles)
+
+    def set_copeople(self, copeople: list):
+        self.copeople_by_status = {}
+        self.coperson_status = {}
+        for coperson in copeople:
+            status = coperson.get('Status')
+            self.copeople_by_status.setdefault(status, []).append(coperson)
+            self.coperson_status[str(coperson.get('Id'))] = status
+
+    def set_roles(self, roles: list):
+        self.roles = {}
+        self.roles_by_cou = {}
+        self.member_statuses = {}
+        self.coperson_roles = {}
+        for role in roles:
+            self.put_role(role)
+
+    def share_roles(self, partitions):
+        self.roles = partitions.roles
+        self.roles_by_cou = partitions.roles_by_cou
+        self.member_statuses = partitions.member_statuses
+        self.coperson_roles = partitions.coperson_roles
+
+    def put_role(self, role: dict):
+        role_id, coperson_id, cou_id, status = _role_keys(role)
+        self.discard_role(role_id)
+        self.roles[role_id] = role
+        self.roles_by_cou.setdefault(cou_id, {}).setdefault(status, {})[role_id] = role
+        self.member_statuses.setdefault((coperson_id, cou_id), {})[role_id] = status
+        self.coperson_roles.setdefault(coperson_id, set()).add(role_id)
+
+    def discard_role(self, role_id: str):
+        role = self.roles.pop(role_id, None)
+        if role is None:
+            return
+        _, coperson_id, cou_id, status = _role_keys(role)
+        statuses = self.roles_by_cou.get(cou_id)
+        statuses.get(status).pop(role_id, None)
+        if not statuses.get(status):
+            del statuses[status]
+        if not statuses:
+            del self.roles_by_cou[cou_id]
+        held = self.member_statuses.get((coperson_id, cou_id))
+        held.pop(role_id, None)
+        if not held:
+            del self.member_statuses[(coperson_id, cou_id)]
+        self.coperson_roles.get(coperson_id).discard(role_id)
+        if not self.coperson_roles.get(coperson_id):
+            del self.coperson_roles[coperson_id]
+
+
+class StatusIndex(object):
+    """
+    CO People and CO Person Roles partitioned by Status.
+
+    index = StatusIndex(api)
+    index.refresh()
+    index.start(interval=300)
+    active = index.member_ids(cou_id=45, status='Active')
+    if index.has_role(coperson_id=123, cou_id=45, statuses=['Active', 'GracePeriod']):
+        ...
+
+    Attributes
+    ----------
+    api: ComanageApi
+        Client used to refresh the index, its role writes are applied to the index (required)
+    """
+
+    def __init__(self, api):
+        self.api = api
+        self._lock = threading.Lock()
+        self._partitions = _Partitions()
+        self._fingerprints = {}
+        # role writes applied since the start of the refresh in progress, replayed onto the new index
+        self._writes = []
+        self._refreshing = False
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.refreshed = None
+        self.refreshes = self.refresh_errors = self.writes = 0
+        self.last_error = None
+        api.add_write_listener(self._on_write)
+
+    def _status(self, status: str) -> str:
+        if status not in self.api.STATUS_OPTIONS:
+            raise TypeError("Invalid Fields 'status'")
+        return status
+
+    @staticmethod
+    def _apply(partitions: _Partitions, action: str, role_id: str, role: dict):
+        if action == 'delete':
+            partitions.discard_role(role_id)
+            return
+        # fields missing from the written record are kept from the indexed role
+        record = dict(partitions.roles.get(role_id) or {})
+        record.update(role)
+        record['Id'] = role_id
+        partitions.put_role(record)
+
+    def _on_write(self, resource: str, action: str, record_id: str, record: dict):
+        if resource != 'co_person_roles' or (action != 'delete' and not record):
+            return
+        with self._lock:
+            self._apply(self._partitions, action, str(record_id), record or {})
+            if self._refreshing:
+                self._writes.append((action, str(record_id), record or {}))
+            self.writes += 1
+
+    def refresh(self) -> dict:
+        """
+        Rebuild the index from copeople_view_per_co and coperson_roles_view_all. Collections whose
+        fingerprint (conditional_get client option) has not changed since the last refresh are kept. Role
+        writes made through the client while the listings are fetched are applied again to the new index.
+
+        :return
+            {"copeople": <CO People indexed or None when unchanged>, "roles": <roles indexed or None when unchanged>}
+        """
+        with self._refresh_lock:
+            with self._lock:
+                self._refreshing = True
+                self._writes = []
+            try:
+                current = self._partitions
+                partitions = _Partitions()
+                report = {'copeople': None, 'roles': None}
+                copeople = self.api.copeople_view_per_co().get('CoPeople') or []
+                fingerprint = self.api.collection_fingerprint('copeople_view_per_co')
+                if fingerprint is not None and fingerprint == self._fingerprints.get('copeople'):
+                    partitions.copeople_by_status = current.copeople_by_status
+                    partitions.coperson_status = current.coperson_status
+                else:
+                    partitions.set_copeople(copeople)
+                    report['copeople'] = len(copeople)
+                roles = self.api.coperson_roles_view_all().get('CoPersonRoles') or []
+                roles_fingerprint = self.api.collection_fingerprint('coperson_roles_view_all')
+                if roles_fingerprint is not None and roles_fingerprint == self._fingerprints.get('roles'):
+                    # the current roles already hold the writes made since
+                    partitions.share_roles(current)
+                else:
+                    partitions.set_roles(roles)
+                    report['roles'] = len(roles)
+                with self._lock:
+                    if report.get('roles') is not None:
+                        for action, role_id, role in self._writes:
+                            self._apply(partitions, action, role_id, role)
+                    self._partitions = partitions
+                    self._fingerprints = {'copeople': fingerprint, 'roles': roles_fingerprint}
+                    self.refreshed = time.time()
+                    self.refreshes += 1
+            finally:
+                with self._lock:
+                    self._refreshing = False
+                    self._writes = []
+        return report
+
+    def _run(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as err:
+                # the current index is kept until a refresh succeeds
+                with self._lock:
+                    self.refresh_errors += 1
+                    self.last_error = err
+
+    def start(self, interval: float = 300):
+        """
+        Refresh the index every interval seconds on a daemon thread. Failed refreshes keep the current index
+        and are reported in stats().
+        """
+        if float(interval) <= 0:
+            raise TypeError("Invalid Fields 'interval'")
+        self.stop()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(float(interval),), name='StatusIndex', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        self.api.remove_write_listener(self._on_write)
+
+    def copeople(self, status: str) -> list:
+        return list(self._partitions.copeople_by_status.get(self._status(status), []))
+
+    def coperson_status(self, coperson_id: int) -> str:
+        return self._partitions.coperson_status.get(str(coperson_id))
+
+    def roles(self, cou_id: int, status: str = None) -> list:
+        status = None if status is None else self._status(status)
+        with self._lock:
+            statuses = self._partitions.roles_by_cou.get(str(cou_id), {})
+            if status is not None:
+                return list(statuses.get(status, {}).values())
+            return [role for roles in statuses.values() for role in roles.values()]
+
+    def member_ids(self, cou_id: int, status: str = 'Active') -> set:
+        return {_role_keys(role)[1] for role in self.roles(cou_id=cou_id, status=status)}
+
+    def has_role(self, coperson_id: int, cou_id: int, statuses: list = None) -> bool:
+        """
+        Whether a CO Person holds a role with one of statuses (default: ['Active']) in a COU.
+        """
+        statuses = ['Active'] if statuses is None else [self._status(status) for status in statuses]
+        with self._lock:
+            held = self._partitions.member_statuses.get((str(coperson_id), str(cou_id)))
+            return bool(held) and any(status in statuses for status in held.values())
+
+    def memberships(self, coperson_id: int) -> list:
+        with self._lock:
+            partitions = self._partitions
+            return [partitions.roles.get(role_id)
+                    for role_id in sorted(partitions.coperson_roles.get(str(coperson_id), ()))]
+
+    def counts(self, cou_id: int = None) -> dict:
+        """
+        Number of CO Person Roles by status.
+
+        :param cou_id: COU to count, None for every COU
+        :return
+            {<status>: <count>} for cou_id, {<cou_id>: {<status>: <count>}} otherwise
+        """
+        with self._lock:
+            roles_by_cou = self._partitions.roles_by_cou
+            if cou_id is not None:
+                return {status: len(roles) for status, roles in roles_by_cou.get(str(cou_id), {}).items()}
+            return {cou: {status: len(roles) for status, roles in statuses.items()}
+                    for cou, statuses in roles_by_cou.items()}
+
+    def stats(self) -> dict:
+        """
+        Index statistics.
+
+        :return
+            {
+                "copeople": <CO People indexed>,
+                "roles": <roles indexed>,
+                "cous": <COUs with roles>,
+                "refreshed": <time of the last refresh>,
+                "refreshes": <successful refreshes>,
+                "refresh_errors": <failed background refreshes>,
+                "last_error": <exception of the last failed background refresh>,
+                "writes": <role writes applied from the client>
+            }:
+        """
+        with self._lock:
+            return {
+                'copeople': len(self._partitions.coperson_status),
+                'roles': len(self._partitions.roles),
+                'cous': len(self._partitions.roles_by_cou),
+                'refreshed': self.refreshed,
+                'refreshes': self.refreshes,
+                'refresh_errors': self.refresh_errors,
+                'last_error': self.last_error,
+                'writes': self.writes
+            }